@@ -1,45 +1,168 @@
 """CLI and REPL for PitCrew."""
 
+import os
+import stat
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.text import Text
 
 from pitcrew.config import Config
-from pitcrew.conversation import ConversationContext
-from pitcrew.graph import PitCrewGraph
-from pitcrew.handlers.autonomous import AutonomousHandler
-from pitcrew.handlers.query import QueryHandler
-from pitcrew.intent import IntentDetector
-from pitcrew.llm import LLM
-from pitcrew.utils.logging import SessionLogger
+from pitcrew.constants import LANGUAGE_MAP
+
+# Heavy modules (LangGraph, the Anthropic SDK, Pygments) are imported inside the
+# functions that need them so `pitcrew --help` and config errors stay fast.
 
 app = typer.Typer(help="PitCrew - Terminal Code Editing Bot")
-console = Console()
+
+
+class BufferedConsole(Console):
+    """Console that batches output fragments into one print per logical line.
+
+    Rich re-parses markup and re-renders styles on every ``print`` call, so
+    commands that emit many small fragments collect them with ``write`` and
+    render them in a single pass with ``writeln``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._line_buffer: list = []
+
+    def write(self, text: Any) -> None:
+        """Append a string or renderable to the pending line."""
+        self._line_buffer.append(text)
+
+    def writeln(self, text: Any = "") -> None:
+        """Append to the pending line and flush it."""
+        self._line_buffer.append(text)
+        self._flush_line_buffer()
+
+    def _flush_line_buffer(self) -> None:
+        """Render all buffered fragments with a single print call."""
+        if not self._line_buffer:
+            return
+
+        parts, self._line_buffer = self._line_buffer, []
+        if all(isinstance(part, str) for part in parts):
+            super().print("".join(parts))
+        else:
+            super().print(*parts, sep="")
+
+
+console = BufferedConsole()
+
+# Static status lines, styled once so printing them skips markup parsing
+_MSG_BUILDING_INDEX = Text("\nBuilding file index...", style="dim")
+_MSG_AGENTS_LOADED = Text("✓ AGENTS.md loaded into system prompt (cached by Claude)\n", style="dim")
+_MSG_NO_AGENTS = Text("ℹ️  No AGENTS.md found - run /init to create it\n", style="dim")
+_MSG_USE_QUIT = Text("\nUse /quit to exit", style="dim")
+_MSG_UNKNOWN_HINT = Text("Type /help for available commands", style="dim")
+_MSG_APPLYING = Text("Applying plan...\n", style="dim")
+_MSG_RUNNING_TESTS = Text("Running tests...\n", style="dim")
+
+_BANNER_TEMPLATE = (
+    "[bold cyan]PitCrew[/bold cyan] - Terminal Code Editing Bot\n"
+    "Project: {project_root}\n"
+    "Model: {model}\n"
+    "\n"
+    "Type /help for commands or /quit to exit"
+)
+
+_HELP_TEXT = """
+**Available Commands:**
+
+- `/init` - Create or update AGENTS.md file
+- `/init --batch` - Same via the Batch API at half price (run again to collect)
+- `/reload` - Reload system prompt with current AGENTS.md
+- `/plan <goal>` - Generate a structured edit plan
+- `/apply` - Apply the last generated plan
+- `/implement <file> <description>` - Generate code for a specific file
+- `/read <path>` - Read a file
+- `/exec <cmd>` - Execute a command
+- `/test` - Auto-detect and run tests
+- `/index` - Rebuild file index
+- `/undo` - Revert last applied changes
+- `/allow-edits on|off` - Toggle edit permissions
+- `/model [name]` - Show or switch LLM model
+- `/config` - Show current configuration
+- `/log` - Show session log path
+- `/help` - Show this help message
+- `/quit` - Exit PitCrew
+
+**Examples:**
+
+```
+/plan Add a function to calculate fibonacci numbers and write tests
+/read src/main.py
+/exec python -m pytest tests/
+/model openai:gpt-4o
+```
+"""
+
+
+@lru_cache(maxsize=1)
+def _help_markdown() -> Any:
+    """Parse the static help text once, on first use."""
+    from rich.markdown import Markdown
+
+    return Markdown(_HELP_TEXT)
+
+
+@lru_cache(maxsize=None)
+def _syntax_builder(language: str) -> Callable[..., Any]:
+    """Get a Syntax factory with its Pygments lexer and theme resolved once.
+
+    Args:
+        language: Language name from LANGUAGE_MAP (or "text")
+
+    Returns:
+        Callable taking the code string and keyword overrides
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+    from rich.syntax import Syntax
+
+    try:
+        lexer = get_lexer_by_name(language)
+    except ClassNotFound:
+        lexer = get_lexer_by_name("text")
+    return partial(Syntax, lexer=lexer, theme=Syntax.get_theme("monokai"))
 
 
 class REPL:
     """Interactive REPL for PitCrew."""
 
-    def __init__(self, project_root: Path, config: Config):
+    def __init__(self, project_root: Path, config: Config, debug: bool = False):
         """Initialize REPL.
 
         Args:
             project_root: Project root directory
             config: Configuration object
+            debug: Print full tracebacks when a command fails
         """
+        from pitcrew.conversation import ConversationContext
+        from pitcrew.graph import PitCrewGraph
+        from pitcrew.handlers.autonomous import AutonomousHandler
+        from pitcrew.handlers.query import QueryHandler
+        from pitcrew.intent import IntentDetector
+        from pitcrew.utils.logging import SessionLogger
+
         self.project_root = project_root
         self.config = config
+        self.debug = debug
         self.graph = PitCrewGraph(project_root, config)
         self.logger = SessionLogger(project_root)
         self.graph.logger = self.logger
 
         self.last_plan = None
+        self._index_future: Optional[Future] = None
+        self._index_pool: Optional[ThreadPoolExecutor] = None
         self.allow_edits = False
         self.running = True
 
@@ -49,37 +172,83 @@ class REPL:
         self.query_handler = QueryHandler(self.graph, self.graph.llm)
         self.autonomous_handler = AutonomousHandler(self.graph, self.conversation)
 
+        # Slash command jump table (keys are lowercase; handle_command lowers input)
+        self._commands: dict[str, Callable[[str], None]] = {
+            "/help": self._cmd_help,
+            "/quit": self._cmd_quit,
+            "/exit": self._cmd_quit,
+            "/init": self._cmd_init,
+            "/index": self._cmd_index,
+            "/read": self._cmd_read,
+            "/plan": self._cmd_plan,
+            "/apply": self._cmd_apply,
+            "/implement": self._cmd_implement,
+            "/exec": self._cmd_exec,
+            "/test": self._cmd_test,
+            "/undo": self._cmd_undo,
+            "/allow-edits": self._cmd_allow_edits,
+            "/model": self._cmd_model,
+            "/reload": self._cmd_reload,
+            "/config": self._cmd_config,
+            "/log": self._cmd_log,
+        }
+
         # Set initial system prompt
         self._initialize_conversation()
 
     def start(self) -> None:
         """Start the REPL."""
-        console.print(Panel.fit(
-            "[bold cyan]PitCrew[/bold cyan] - Terminal Code Editing Bot\n"
-            f"Project: {self.project_root}\n"
-            f"Model: {self.config.default_model}\n"
-            "\n"
-            "Type /help for commands or /quit to exit",
-            border_style="cyan"
-        ))
+        banner = _BANNER_TEMPLATE.format(
+            project_root=self.project_root,
+            model=self.config.default_model,
+        )
+        console.print(Panel.fit(banner, border_style="cyan"))
 
-        # Load initial index
-        console.print("\n[dim]Building file index...[/dim]")
-        index = self.graph.file_index.load_from_disk()
-        if not index:
-            index = self.graph.file_index.build()
-            self.graph.file_index.save_to_disk(index)
-        summary = self.graph.file_index.summarize(index)
-        console.print(f"[dim]{summary}[/dim]")
+        # Load initial index in the background; joined before the first command
+        console.print(_MSG_BUILDING_INDEX)
+        self._index_pool = ThreadPoolExecutor(max_workers=1)
+        self._index_future = self._index_pool.submit(self._refresh_index)
 
         # Show AGENTS.md status
         agents_md_path = self.project_root / "AGENTS.md"
         if agents_md_path.exists():
-            console.print("[dim]✓ AGENTS.md loaded into system prompt (cached by Claude)[/dim]\n")
+            console.print(_MSG_AGENTS_LOADED)
         else:
-            console.print("[dim]ℹ️  No AGENTS.md found - run /init to create it[/dim]\n")
+            console.print(_MSG_NO_AGENTS)
 
         # Main REPL loop
+        if sys.stdin.isatty():
+            self._interactive_loop()
+        else:
+            self._piped_loop()
+
+        self._wait_for_index()
+        self.graph.close()
+        console.print("\n[cyan]Goodbye![/cyan]")
+
+    def _refresh_index(self) -> str:
+        """Load the saved file index, refreshing entries for changed files.
+
+        Returns:
+            Index summary line
+        """
+        return self.graph.file_index.summarize(self.graph.get_index())
+
+    def _wait_for_index(self) -> None:
+        """Join the startup index build, if one is still pending."""
+        future = self._index_future
+        if future is None:
+            return
+        self._index_future = None
+        try:
+            console.print(f"[dim]{future.result()}[/dim]")
+        except Exception as e:
+            console.print(f"[yellow]File index build failed: {e}[/yellow]")
+        finally:
+            self._index_pool.shutdown()
+
+    def _interactive_loop(self) -> None:
+        """Read commands from a terminal with a Rich prompt."""
         while self.running:
             try:
                 user_input = console.input("[bold cyan]pitcrew>[/bold cyan] ").strip()
@@ -91,12 +260,26 @@ class REPL:
                 self.handle_input(user_input)
 
             except KeyboardInterrupt:
-                console.print("\n[dim]Use /quit to exit[/dim]")
+                console.print(_MSG_USE_QUIT)
                 continue
             except EOFError:
                 break
 
-        console.print("\n[cyan]Goodbye![/cyan]")
+    def _piped_loop(self) -> None:
+        """Read commands line by line from non-TTY stdin (scripts, CI).
+
+        Skips prompt rendering since nobody is there to see it.
+        """
+        for line in sys.stdin:
+            user_input = line.strip()
+            if not user_input:
+                continue
+
+            self.logger.log_message("user", user_input)
+            self.handle_input(user_input)
+
+            if not self.running:
+                break
 
     def handle_input(self, user_input: str) -> None:
         """Handle user input (command or natural language).
@@ -104,6 +287,9 @@ class REPL:
         Args:
             user_input: User input string
         """
+        # Every command may touch the index, so finish the startup build first
+        self._wait_for_index()
+
         if user_input.startswith("/"):
             self.handle_command(user_input)
         else:
@@ -116,147 +302,197 @@ class REPL:
             command: Command string (starting with /)
         """
         parts = command.split(maxsplit=1)
-        cmd = parts[0].lower()
+        # Interned so the jump-table lookup hits the identity fast path
+        cmd = sys.intern(parts[0].lower())
         args = parts[1] if len(parts) > 1 else ""
 
         try:
-            if cmd == "/help":
-                self.show_help()
-            elif cmd == "/quit" or cmd == "/exit":
-                self.running = False
-            elif cmd == "/init":
-                result = self.graph.handle_init()
-                console.print(result)
-                # Reload system prompt with the newly created/updated AGENTS.md
-                if "✓" in result:  # Success indicator
-                    console.print()
-                    self._reload_system_prompt(show_message=True)
-            elif cmd == "/index":
-                result = self.graph.handle_index()
-                console.print(result)
-            elif cmd == "/read":
-                if not args:
-                    console.print("[red]Usage: /read <path>[/red]")
-                    return
-                result = self.graph.handle_read(args)
-                # Display with syntax highlighting
-                if not result.startswith("Error"):
-                    lines = result.split("\n", 1)
-                    console.print(f"[bold]{lines[0]}[/bold]")
-                    if len(lines) > 1:
-                        try:
-                            syntax = Syntax(lines[1], "python", theme="monokai")
-                            console.print(syntax)
-                        except Exception:
-                            console.print(lines[1])
-                else:
-                    console.print(f"[red]{result}[/red]")
-            elif cmd == "/plan":
-                if not args:
-                    console.print("[red]Usage: /plan <goal>[/red]")
-                    return
-                console.print(f"[dim]Generating plan for: {args}[/dim]\n")
-                # Pass conversation history to planner
-                conversation_msgs = self.conversation.to_messages()
-                plan_dict, summary = self.graph.handle_plan(args, conversation_msgs)
-                self.last_plan = plan_dict
-                console.print(Panel(summary, title="Plan", border_style="green"))
-                console.print("\n[yellow]Use /apply to execute this plan[/yellow]")
-            elif cmd == "/apply":
-                if not self.last_plan:
-                    console.print("[red]No plan to apply. Use /plan first.[/red]")
-                    return
-                if not self.allow_edits:
-                    response = console.input(
-                        "[yellow]Allow edits for this session? (y/N):[/yellow] "
-                    ).lower()
-                    if response != "y":
-                        console.print("[red]Edits not allowed. Plan not applied.[/red]")
-                        return
-                    self.allow_edits = True
-                console.print("[dim]Applying plan...[/dim]\n")
-                result = self.graph.handle_apply(self.last_plan)
-                console.print(result)
-            elif cmd == "/implement":
-                if not args:
-                    console.print("[red]Usage: /implement <file_path> <description>[/red]")
-                    return
-                # Split into file_path and description
-                parts = args.split(maxsplit=1)
-                if len(parts) < 2:
-                    console.print("[red]Usage: /implement <file_path> <description>[/red]")
-                    return
-                file_path, description = parts
-                result = self.graph.handle_implement(file_path, description)
-                console.print(result)
-            elif cmd == "/exec":
-                if not args:
-                    console.print("[red]Usage: /exec <command>[/red]")
-                    return
-                console.print(f"[dim]Executing: {args}[/dim]\n")
-                result = self.graph.handle_exec(args)
-                console.print(result)
-            elif cmd == "/test":
-                console.print("[dim]Running tests...[/dim]\n")
-                result = self.graph.handle_test()
-                console.print(result)
-            elif cmd == "/undo":
-                result = self.graph.handle_undo()
-                console.print(result)
-            elif cmd == "/allow-edits":
-                if args.lower() == "on":
-                    self.allow_edits = True
-                    console.print("[green]Edits enabled for this session[/green]")
-                elif args.lower() == "off":
-                    self.allow_edits = False
-                    console.print("[yellow]Edits disabled for this session[/yellow]")
-                else:
-                    console.print(f"[dim]Edits currently: {'enabled' if self.allow_edits else 'disabled'}[/dim]")
-                    console.print("[dim]Usage: /allow-edits on|off[/dim]")
-            elif cmd == "/model":
-                if args:
-                    # Switch model
-                    try:
-                        descriptor = LLM.parse_model_string(args)
-                        self.config.default_model = args
-                        # Reinitialize LLM
-                        api_key = (
-                            self.config.openai_api_key
-                            if descriptor.provider == "openai"
-                            else self.config.anthropic_api_key
-                        )
-                        self.graph.llm = LLM(descriptor, api_key)
-                        self.graph.planner.llm = self.graph.llm
-                        console.print(f"[green]Switched to model: {args}[/green]")
-                    except ValueError as e:
-                        console.print(f"[red]{e}[/red]")
-                else:
-                    # Show current model and list available
-                    console.print(f"[dim]Current model: {self.config.default_model}[/dim]")
-                    console.print("\nAvailable models:")
-                    for model in LLM.list_models():
-                        console.print(f"  - {model}")
-            elif cmd == "/reload":
-                console.print("[cyan]Reloading system prompt with current AGENTS.md...[/cyan]")
-                self._reload_system_prompt(show_message=True)
-            elif cmd == "/config":
-                config_dict = self.config.to_dict()
-                console.print(Panel(
-                    "\n".join(f"{k}: {v}" for k, v in config_dict.items()),
-                    title="Configuration",
-                    border_style="blue"
-                ))
-            elif cmd == "/log":
-                log_path = self.logger.get_log_path()
-                console.print(f"[dim]Session logs: {log_path}[/dim]")
+            handler = self._commands.get(cmd)
+            if handler:
+                handler(args)
             else:
-                console.print(f"[red]Unknown command: {cmd}[/red]")
-                console.print("[dim]Type /help for available commands[/dim]")
+                self._unknown_command(cmd)
 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
-            import traceback
-            traceback.print_exc()
+            if self.debug:
+                console.print_exception(show_locals=False)
+
+    def _unknown_command(self, cmd: str) -> None:
+        """Report an unrecognized slash command."""
+        console.print(f"[red]Unknown command: {cmd}[/red]")
+        console.print(_MSG_UNKNOWN_HINT)
+
+    def _cmd_help(self, args: str) -> None:
+        """Handle /help."""
+        self.show_help()
+
+    def _cmd_quit(self, args: str) -> None:
+        """Handle /quit and /exit."""
+        self.running = False
+
+    def _cmd_init(self, args: str) -> None:
+        """Handle /init [--batch]."""
+        result = self.graph.handle_init(batch=args.strip() == "--batch")
+        console.print(result)
+        # Reload system prompt with the newly created/updated AGENTS.md
+        if "✓" in result:  # Success indicator
+            console.print()
+            self._reload_system_prompt(show_message=True)
+
+    def _cmd_index(self, args: str) -> None:
+        """Handle /index."""
+        result = self.graph.handle_index()
+        console.print(result)
+
+    def _cmd_read(self, args: str) -> None:
+        """Handle /read <path>."""
+        if not args:
+            console.print("[red]Usage: /read <path>[/red]")
+            return
+        result = self.graph.handle_read(args)
+        # Display with syntax highlighting
+        if not result.startswith("Error"):
+            lines = result.split("\n", 1)
+            console.write(f"[bold]{lines[0]}[/bold]")
+            if len(lines) > 1:
+                try:
+                    language = LANGUAGE_MAP.get(Path(args).suffix.lower(), "text")
+                    syntax = _syntax_builder(language)(lines[1], code_width=console.width)
+                    console.writeln(syntax)
+                except Exception:
+                    console.writeln(f"\n{lines[1]}")
+            else:
+                console.writeln()
+        else:
+            console.print(f"[red]{result}[/red]")
+
+    def _cmd_plan(self, args: str) -> None:
+        """Handle /plan <goal>."""
+        if not args:
+            console.print("[red]Usage: /plan <goal>[/red]")
+            return
+        console.print(f"[dim]Generating plan for: {args}[/dim]\n")
+        # Pass conversation history to planner
+        conversation_msgs = self.conversation.to_messages()
+        plan_dict, summary = self.graph.handle_plan(args, conversation_msgs)
+        self.last_plan = plan_dict
+        console.print(Panel(summary, title="Plan", border_style="green"))
+        console.print("\n[yellow]Use /apply to execute this plan[/yellow]")
+
+    def _cmd_apply(self, args: str) -> None:
+        """Handle /apply."""
+        if not self.last_plan:
+            console.print("[red]No plan to apply. Use /plan first.[/red]")
+            return
+        if not self.allow_edits:
+            try:
+                response = console.input(
+                    "[yellow]Allow edits for this session? (y/N):[/yellow] "
+                ).lower()
+            except EOFError:
+                # No terminal to ask on (piped input, or a daemon-served command)
+                console.print("[red]Applying needs confirmation. Run /allow-edits on first.[/red]")
+                return
+            if response != "y":
+                console.print("[red]Edits not allowed. Plan not applied.[/red]")
+                return
+            self.allow_edits = True
+        console.print(_MSG_APPLYING)
+        result = self.graph.handle_apply(self.last_plan)
+        console.print(result)
+
+    def _cmd_implement(self, args: str) -> None:
+        """Handle /implement <file_path> <description>."""
+        # Split into file_path and description
+        parts = args.split(maxsplit=1)
+        if len(parts) < 2:
+            console.print("[red]Usage: /implement <file_path> <description>[/red]")
+            return
+        file_path, description = parts
+        result = self.graph.handle_implement(file_path, description)
+        console.print(result)
+
+    def _cmd_exec(self, args: str) -> None:
+        """Handle /exec <command>."""
+        if not args:
+            console.print("[red]Usage: /exec <command>[/red]")
+            return
+        console.print(f"[dim]Executing: {args}[/dim]\n")
+        result = self.graph.handle_exec(args)
+        console.print(result)
+
+    def _cmd_test(self, args: str) -> None:
+        """Handle /test."""
+        console.print(_MSG_RUNNING_TESTS)
+        result = self.graph.handle_test()
+        console.print(result)
+
+    def _cmd_undo(self, args: str) -> None:
+        """Handle /undo."""
+        result = self.graph.handle_undo()
+        console.print(result)
+
+    def _cmd_allow_edits(self, args: str) -> None:
+        """Handle /allow-edits on|off."""
+        mode = args.strip().lower()
+        if mode == "on":
+            self.allow_edits = True
+            console.print("[green]Edits enabled for this session[/green]")
+        elif mode == "off":
+            self.allow_edits = False
+            console.print("[yellow]Edits disabled for this session[/yellow]")
+        else:
+            console.print(f"[dim]Edits currently: {'enabled' if self.allow_edits else 'disabled'}[/dim]")
+            console.print("[dim]Usage: /allow-edits on|off[/dim]")
+
+    def _cmd_model(self, args: str) -> None:
+        """Handle /model [name]."""
+        from pitcrew.llm import LLM
+
+        if args:
+            # Switch model
+            try:
+                descriptor = LLM.parse_model_string(args)
+                self.config.default_model = args
+                # Reinitialize LLM
+                api_key = (
+                    self.config.openai_api_key
+                    if descriptor.provider == "openai"
+                    else self.config.anthropic_api_key
+                )
+                self.graph.llm = LLM(descriptor, api_key)
+                self.graph.planner.llm = self.graph.llm
+                self.query_handler.llm = self.graph.llm
+                console.print(f"[green]Switched to model: {args}[/green]")
+            except ValueError as e:
+                console.print(f"[red]{e}[/red]")
+        else:
+            # Show current model and list available
+            console.write(f"[dim]Current model: {self.config.default_model}[/dim]\n")
+            console.write("\nAvailable models:")
+            for model in LLM.list_models():
+                console.write(f"\n  - {model}")
+            console.writeln()
+
+    def _cmd_reload(self, args: str) -> None:
+        """Handle /reload."""
+        console.print("[cyan]Reloading system prompt with current AGENTS.md...[/cyan]")
+        self._reload_system_prompt(show_message=True)
+
+    def _cmd_config(self, args: str) -> None:
+        """Handle /config."""
+        config_dict = self.config.to_dict()
+        console.print(Panel(
+            "\n".join(f"{k}: {v}" for k, v in config_dict.items()),
+            title="Configuration",
+            border_style="blue"
+        ))
+
+    def _cmd_log(self, args: str) -> None:
+        """Handle /log."""
+        log_path = self.logger.get_log_path()
+        console.print(f"[dim]Session logs: {log_path}[/dim]")
 
     def handle_natural_language(self, text: str) -> None:
         """Handle natural language input.
@@ -278,13 +514,7 @@ class REPL:
             # Route based on intent
             if intent.action == "query":
                 # Stream the response
-                console.print()  # Add newline before streaming
-                full_response = ""
-                for chunk in self.query_handler.handle_stream(text, self.conversation):
-                    console.print(chunk, end="")
-                    full_response += chunk
-                console.print("\n")  # Add newline after streaming
-                self.conversation.add_message("assistant", full_response)
+                self._stream_query(text)
 
             elif intent.action == "plan":
                 # Use autonomous handler for planning and execution
@@ -326,18 +556,26 @@ class REPL:
 
             else:
                 # Fallback to query with streaming
-                console.print()  # Add newline before streaming
-                full_response = ""
-                for chunk in self.query_handler.handle_stream(text, self.conversation):
-                    console.print(chunk, end="")
-                    full_response += chunk
-                console.print("\n")  # Add newline after streaming
-                self.conversation.add_message("assistant", full_response)
+                self._stream_query(text)
 
         except Exception as e:
             console.print(f"[red]Error processing request: {e}[/red]")
             console.print("[dim]You can try rephrasing or use /help for slash commands.[/dim]")
 
+    def _stream_query(self, text: str) -> None:
+        """Stream a query answer to the console and record it in the conversation.
+
+        Args:
+            text: User query
+        """
+        console.print()  # Add newline before streaming
+        chunks = []
+        for chunk in self.query_handler.handle_stream(text, self.conversation):
+            console.print(chunk, end="")
+            chunks.append(chunk)
+        console.print("\n")  # Add newline after streaming
+        self.conversation.add_message("assistant", "".join(chunks))
+
     def _initialize_conversation(self) -> None:
         """Initialize the conversation with rich system prompt including AGENTS.md."""
         self._reload_system_prompt(show_message=False)
@@ -348,11 +586,8 @@ class REPL:
         Args:
             show_message: Whether to show a message to the user
         """
-        from rich.console import Console
         from pitcrew.system_prompt import SystemPromptBuilder
 
-        console = Console()
-
         # Load AGENTS.md if it exists
         agents_md_path = self.project_root / "AGENTS.md"
         agents_md_content = None
@@ -412,36 +647,7 @@ class REPL:
 
     def show_help(self) -> None:
         """Show help message."""
-        help_text = """
-**Available Commands:**
-
-- `/init` - Create or update AGENTS.md file
-- `/reload` - Reload system prompt with current AGENTS.md
-- `/plan <goal>` - Generate a structured edit plan
-- `/apply` - Apply the last generated plan
-- `/implement <file> <description>` - Generate code for a specific file
-- `/read <path>` - Read a file
-- `/exec <cmd>` - Execute a command
-- `/test` - Auto-detect and run tests
-- `/index` - Rebuild file index
-- `/undo` - Revert last applied changes
-- `/allow-edits on|off` - Toggle edit permissions
-- `/model [name]` - Show or switch LLM model
-- `/config` - Show current configuration
-- `/log` - Show session log path
-- `/help` - Show this help message
-- `/quit` - Exit PitCrew
-
-**Examples:**
-
-```
-/plan Add a function to calculate fibonacci numbers and write tests
-/read src/main.py
-/exec python -m pytest tests/
-/model openai:gpt-4o
-```
-        """
-        console.print(Markdown(help_text))
+        console.print(_help_markdown())
 
 
 @app.command()
@@ -455,19 +661,51 @@ def main(
         "--model", "-m",
         help="Model to use (e.g., openai:gpt-4o-mini)"
     ),
+    command: Optional[str] = typer.Option(
+        None,
+        "--command", "-c",
+        help="Run a single command and exit (uses a running daemon if available)"
+    ),
+    daemon: bool = typer.Option(
+        False,
+        "--daemon",
+        help="Serve commands for this project over a Unix socket"
+    ),
+    auto_daemon: bool = typer.Option(
+        False,
+        "--auto-daemon",
+        help="With --command, start a background daemon if none is running"
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Show full tracebacks on errors"
+    ),
 ) -> None:
     """Start PitCrew interactive session."""
     # Determine project root
     project_root = Path(path).resolve() if path else Path.cwd()
 
-    if not project_root.exists():
+    # One stat call covers both the existence and directory checks
+    try:
+        root_stat = os.stat(project_root)
+    except FileNotFoundError:
         console.print(f"[red]Error: Path does not exist: {project_root}[/red]")
         sys.exit(1)
 
-    if not project_root.is_dir():
+    if not stat.S_ISDIR(root_stat.st_mode):
         console.print(f"[red]Error: Path is not a directory: {project_root}[/red]")
         sys.exit(1)
 
+    # Hand one-shot commands to a warm daemon before paying for config/graph setup
+    if command and not daemon:
+        from pitcrew.daemon import send_command
+
+        output = send_command(project_root, command, model)
+        if output is not None:
+            sys.stdout.write(output)
+            return
+
     # Load configuration
     try:
         config = Config.load(project_root)
@@ -489,12 +727,28 @@ def main(
 
     # Start REPL
     try:
-        repl = REPL(project_root, config)
+        if daemon:
+            from pitcrew.daemon import serve
+
+            serve(project_root, config)
+            return
+
+        if command:
+            if auto_daemon:
+                from pitcrew.daemon import spawn_daemon
+
+                spawn_daemon(project_root, model)
+            repl = REPL(project_root, config, debug=debug)
+            repl.handle_input(command)
+            repl.graph.close()
+            return
+
+        repl = REPL(project_root, config, debug=debug)
         repl.start()
     except Exception as e:
         console.print(f"[red]Fatal error: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        if debug:
+            console.print_exception(show_locals=False)
         sys.exit(1)
 
 
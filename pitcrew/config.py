@@ -3,11 +3,18 @@
 import json
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from dotenv import load_dotenv
 
+try:
+    from orjson import loads as _json_loads  # optional: pip install pitcrew[fast]
+except ImportError:
+    _json_loads = json.loads
+
 from pitcrew.constants import (
     DEFAULT_MODEL,
     DEFAULT_EXEC_TIMEOUT,
@@ -17,6 +24,63 @@ from pitcrew.constants import (
 )
 
 
+@dataclass(frozen=True)
+class _EnvSettings:
+    """Snapshot of the environment variables PitCrew reads."""
+
+    anthropic_api_key: Optional[str]
+    langsmith_api_key: Optional[str]
+    langsmith_tracing: bool
+    langsmith_project: str
+    default_model: str
+    exec_timeout: int
+    exec_net_policy: str
+    max_read_mb: int
+    max_write_mb: int
+
+
+@lru_cache(maxsize=1)
+def _load_env_cached() -> _EnvSettings:
+    """Load .env and parse environment settings once per process.
+
+    Call ``_load_env_cached.cache_clear()`` to pick up environment changes.
+    """
+    load_dotenv()
+
+    return _EnvSettings(
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
+        langsmith_api_key=os.getenv("LANGSMITH_API_KEY"),
+        langsmith_tracing=os.getenv("LANGSMITH_TRACING", "").lower() == "true",
+        langsmith_project=os.getenv("LANGSMITH_PROJECT", "PitCrew"),
+        default_model=os.getenv("PITCREW_DEFAULT_MODEL", DEFAULT_MODEL),
+        exec_timeout=int(os.getenv("PITCREW_EXEC_TIMEOUT", DEFAULT_EXEC_TIMEOUT)),
+        exec_net_policy=os.getenv("PITCREW_EXEC_NET", DEFAULT_EXEC_NET_POLICY),
+        max_read_mb=int(os.getenv("PITCREW_MAX_READ_MB", DEFAULT_MAX_READ_MB)),
+        max_write_mb=int(os.getenv("PITCREW_MAX_WRITE_MB", DEFAULT_MAX_WRITE_MB)),
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_bot_config_cached(path: str, mtime_ns: int) -> dict[str, str]:
+    """Read custom commands from a project config file.
+
+    The file's mtime is part of the cache key, so edits invalidate the entry.
+    Parsed with orjson when it is installed.
+
+    Args:
+        path: Path to .pitcrew/config.json
+        mtime_ns: Modification time of the file in nanoseconds
+
+    Returns:
+        Custom commands mapping (empty if the file is invalid)
+    """
+    try:
+        bot_config = _json_loads(Path(path).read_bytes())
+        return bot_config.get("commands", {})
+    except (json.JSONDecodeError, IOError):
+        return {}  # Ignore invalid config
+
+
 @dataclass
 class Config:
     """PitCrew configuration.
@@ -44,6 +108,14 @@ class Config:
     # Custom commands (from .bot/config.json)
     custom_commands: dict[str, str] = field(default_factory=dict)
 
+    # Cached to_dict() result, dropped whenever a field is assigned
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
     @classmethod
     def load(cls, project_root: Optional[Path] = None) -> "Config":
         """Load configuration from environment and project-specific config.
@@ -54,32 +126,32 @@ class Config:
         Returns:
             Config instance
         """
-        # Load .env file
-        load_dotenv()
-
-        # Create config from environment
+        # Create config from environment (.env is only scanned once per process)
+        env = _load_env_cached()
         config = cls(
-            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
-            langsmith_api_key=os.getenv("LANGSMITH_API_KEY"),
-            langsmith_tracing=os.getenv("LANGSMITH_TRACING", "").lower() == "true",
-            langsmith_project=os.getenv("LANGSMITH_PROJECT", "PitCrew"),
-            default_model=os.getenv("PITCREW_DEFAULT_MODEL", DEFAULT_MODEL),
-            exec_timeout=int(os.getenv("PITCREW_EXEC_TIMEOUT", DEFAULT_EXEC_TIMEOUT)),
-            exec_net_policy=os.getenv("PITCREW_EXEC_NET", DEFAULT_EXEC_NET_POLICY),
-            max_read_mb=int(os.getenv("PITCREW_MAX_READ_MB", DEFAULT_MAX_READ_MB)),
-            max_write_mb=int(os.getenv("PITCREW_MAX_WRITE_MB", DEFAULT_MAX_WRITE_MB)),
+            anthropic_api_key=env.anthropic_api_key,
+            langsmith_api_key=env.langsmith_api_key,
+            langsmith_tracing=env.langsmith_tracing,
+            langsmith_project=env.langsmith_project,
+            default_model=env.default_model,
+            exec_timeout=env.exec_timeout,
+            exec_net_policy=env.exec_net_policy,
+            max_read_mb=env.max_read_mb,
+            max_write_mb=env.max_write_mb,
         )
 
         # Load project-specific config if available
         if project_root:
             bot_config_path = project_root / ".pitcrew" / "config.json"
-            if bot_config_path.exists():
-                try:
-                    with open(bot_config_path) as f:
-                        bot_config = json.load(f)
-                        config.custom_commands = bot_config.get("commands", {})
-                except (json.JSONDecodeError, IOError):
-                    pass  # Ignore invalid config
+            try:
+                mtime_ns = bot_config_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+            if mtime_ns is not None:
+                # Copy so callers can't mutate the cached mapping
+                config.custom_commands = dict(
+                    _load_bot_config_cached(str(bot_config_path), mtime_ns)
+                )
 
         return config
 
@@ -105,14 +177,19 @@ class Config:
 
         return errors
 
-    def to_dict(self) -> dict:
-        """Convert config to dictionary (for logging/display)."""
-        return {
-            "default_model": self.default_model,
-            "exec_timeout": self.exec_timeout,
-            "exec_net_policy": self.exec_net_policy,
-            "max_read_mb": self.max_read_mb,
-            "max_write_mb": self.max_write_mb,
-            "custom_commands": self.custom_commands,
-            "has_anthropic_key": bool(self.anthropic_api_key),
-        }
+    def to_dict(self) -> Mapping[str, Any]:
+        """Convert config to a read-only mapping (for logging/display).
+
+        The mapping is built once and reused until a field is reassigned.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "default_model": self.default_model,
+                "exec_timeout": self.exec_timeout,
+                "exec_net_policy": self.exec_net_policy,
+                "max_read_mb": self.max_read_mb,
+                "max_write_mb": self.max_write_mb,
+                "custom_commands": self.custom_commands,
+                "has_anthropic_key": bool(self.anthropic_api_key),
+            }
+        return MappingProxyType(self._dict_cache)
@@ -1,7 +1,9 @@
 """Constants and default values for PitCrew."""
 
+import fnmatch
 import re
-from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 
 # Default model configuration
 DEFAULT_MODEL = "anthropic:claude-sonnet-4-5"
@@ -15,7 +17,7 @@ DEFAULT_MAX_READ_MB = 8
 DEFAULT_MAX_WRITE_MB = 2
 
 # Built-in ignore patterns
-BUILTIN_IGNORES = [
+BUILTIN_IGNORES = (
     # Version control and project metadata
     ".git/",
     ".gitignore",
@@ -69,22 +71,70 @@ BUILTIN_IGNORES = [
     "*.log",
     "*.sqlite",
     "*.db",
-]
+)
+
+# BUILTIN_IGNORES compiled into two alternations: directory patterns (trailing
+# "/") match any parent component, name patterns match any component.
+_IGNORE_DIR_RE = re.compile("|".join(
+    fnmatch.translate(p.rstrip("/")) for p in BUILTIN_IGNORES if p.endswith("/")
+))
+_IGNORE_NAME_RE = re.compile("|".join(
+    fnmatch.translate(p) for p in BUILTIN_IGNORES if not p.endswith("/")
+))
+
+
+def is_ignored(rel_path: str) -> bool:
+    """Check a project-relative file path against the built-in ignore patterns.
+
+    Args:
+        rel_path: POSIX-style path relative to the project root
+
+    Returns:
+        True if any built-in pattern matches the path
+    """
+    parts = rel_path.split("/")
+    if any(_IGNORE_NAME_RE.match(part) for part in parts):
+        return True
+    return any(_IGNORE_DIR_RE.match(part) for part in parts[:-1])
 
 # Dangerous command patterns (for executor safety checks)
-DANGEROUS_PATTERNS = [
-    (re.compile(r'\bsudo\b'), "Use of sudo detected"),
-    (re.compile(r'\brm\s+-rf\s+/'), "Recursive delete of root directory"),
-    (re.compile(r':\(\)\{.*\|.*\&.*\}'), "Fork bomb pattern detected"),
-    (re.compile(r'curl.*\|.*sh'), "Piping curl to shell"),
-    (re.compile(r'wget.*\|.*sh'), "Piping wget to shell"),
-    (re.compile(r'\bchmod\s+777'), "chmod 777 detected"),
-    (re.compile(r'>\s*/dev/sd[a-z]'), "Writing to block device"),
-    (re.compile(r'\bdd\s+.*of=/dev/'), "dd to block device"),
-]
+_RAW_DANGEROUS_PATTERNS = (
+    (r'\bsudo\b', "Use of sudo detected"),
+    (r'\brm\s+-rf\s+/', "Recursive delete of root directory"),
+    (r':\(\)\{.*\|.*\&.*\}', "Fork bomb pattern detected"),
+    (r'curl.*\|.*sh', "Piping curl to shell"),
+    (r'wget.*\|.*sh', "Piping wget to shell"),
+    (r'\bchmod\s+777', "chmod 777 detected"),
+    (r'>\s*/dev/sd[a-z]', "Writing to block device"),
+    (r'\bdd\s+.*of=/dev/', "dd to block device"),
+)
+
+DANGEROUS_PATTERNS = tuple((re.compile(src), msg) for src, msg in _RAW_DANGEROUS_PATTERNS)
+
+# All patterns folded into one alternation so a safe command is scanned once
+_DANGEROUS_RE = re.compile("|".join(f"(?:{src})" for src, _ in _RAW_DANGEROUS_PATTERNS))
+
+
+def check_dangerous(command: str) -> Optional[str]:
+    """Check a command against all dangerous patterns.
+
+    Safe commands, the common case, are rejected with a single scan; only a
+    flagged command is re-checked pattern by pattern to pick the reason.
+
+    Args:
+        command: Command to check
+
+    Returns:
+        Reason for the first pattern in DANGEROUS_PATTERNS order that matches,
+        or None if the command is safe
+    """
+    if _DANGEROUS_RE.search(command) is None:
+        return None
+    return next(msg for pattern, msg in DANGEROUS_PATTERNS if pattern.search(command))
+
 
 # Language detection by extension
-LANGUAGE_MAP = {
+LANGUAGE_MAP = MappingProxyType({
     ".py": "python",
     ".js": "javascript",
     ".jsx": "javascript",
@@ -116,7 +166,7 @@ LANGUAGE_MAP = {
     ".html": "html",
     ".css": "css",
     ".sql": "sql",
-}
+})
 
 # Model descriptors - Anthropic Claude models only
 SUPPORTED_MODELS = {
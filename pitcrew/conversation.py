@@ -1,5 +1,6 @@
 """Conversation context management."""
 
+from collections import OrderedDict, deque
 from typing import Optional
 
 from pitcrew.tools.executor import ExecResult
@@ -15,9 +16,12 @@ class ConversationContext:
         Args:
             max_history: Maximum number of message pairs to keep
         """
-        self.messages: list[dict] = []
+        # System message lives in its own slot; the deque evicts the oldest
+        # user/assistant messages once max_history pairs are stored
+        self._system_msg: Optional[dict] = None
+        self._history: deque[dict] = deque(maxlen=max_history * 2)
         self.current_plan: Optional[dict] = None
-        self.last_files_read: list[str] = []
+        self.last_files_read: OrderedDict[str, None] = OrderedDict()
         self.last_execution: Optional[ExecResult] = None
         self.max_history = max_history
         self.system_prompt: Optional[str] = None
@@ -29,15 +33,11 @@ class ConversationContext:
             role: Message role (user, assistant, system)
             content: Message content
         """
-        self.messages.append({"role": role, "content": content})
+        if role == "system":
+            self.set_system_prompt(content)
+            return
 
-        # Trim history if too long (keep system message if exists)
-        if len(self.messages) > self.max_history * 2 + 1:
-            system_msgs = [m for m in self.messages if m["role"] == "system"]
-            other_msgs = [m for m in self.messages if m["role"] != "system"]
-
-            # Keep system + recent messages
-            self.messages = system_msgs + other_msgs[-(self.max_history * 2) :]
+        self._history.append({"role": role, "content": content})
 
     def set_system_prompt(self, prompt: str | list) -> None:
         """Set or update the system prompt.
@@ -46,12 +46,7 @@ class ConversationContext:
             prompt: System prompt content (string or structured list with cache_control)
         """
         self.system_prompt = prompt
-
-        # Update or add system message
-        if self.messages and self.messages[0]["role"] == "system":
-            self.messages[0]["content"] = prompt
-        else:
-            self.messages.insert(0, {"role": "system", "content": prompt})
+        self._system_msg = {"role": "system", "content": prompt}
 
     def get_context_summary(self) -> str:
         """Generate a summary of recent context.
@@ -65,7 +60,8 @@ class ConversationContext:
             parts.append(f"Current plan: {self.current_plan.get('intent', 'N/A')}")
 
         if self.last_files_read:
-            parts.append(f"Recently read files: {', '.join(self.last_files_read[-3:])}")
+            recent = list(self.last_files_read)[-3:]
+            parts.append(f"Recently read files: {', '.join(recent)}")
 
         if self.last_execution:
             parts.append(
@@ -75,13 +71,15 @@ class ConversationContext:
 
         return "\n".join(parts) if parts else "No recent context"
 
-    def to_messages(self) -> list[dict]:
+    def to_messages(self) -> tuple[dict, ...]:
         """Convert to LLM message format.
 
         Returns:
-            List of message dictionaries
+            Read-only tuple of message dictionaries (copy before mutating)
         """
-        return self.messages.copy()
+        if self._system_msg:
+            return (self._system_msg, *self._history)
+        return tuple(self._history)
 
     def update_plan(self, plan: Optional[dict]) -> None:
         """Update the current plan.
@@ -97,12 +95,13 @@ class ConversationContext:
         Args:
             file_path: Path to the file
         """
-        if file_path not in self.last_files_read:
-            self.last_files_read.append(file_path)
+        # Re-reading a file moves it to the most recent position
+        self.last_files_read.pop(file_path, None)
+        self.last_files_read[file_path] = None
 
         # Keep only last 10 files
         if len(self.last_files_read) > 10:
-            self.last_files_read = self.last_files_read[-10:]
+            self.last_files_read.popitem(last=False)
 
     def update_execution(self, result: ExecResult) -> None:
         """Update the last execution result.
@@ -114,8 +113,7 @@ class ConversationContext:
 
     def clear(self) -> None:
         """Clear conversation history (keeps system prompt)."""
-        system_msgs = [m for m in self.messages if m["role"] == "system"]
-        self.messages = system_msgs
+        self._history.clear()
         self.current_plan = None
-        self.last_files_read = []
+        self.last_files_read.clear()
         self.last_execution = None
@@ -0,0 +1,202 @@
+"""Background daemon that keeps a warm REPL per project.
+
+Each `pitcrew --command ...` invocation otherwise pays for importing
+LangGraph and the Anthropic SDK and loading the file index. A daemon started
+with `pitcrew --daemon` holds that state and answers commands over a Unix
+domain socket using length-prefixed JSON messages.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import struct
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+try:
+    import orjson  # optional: pip install pitcrew[fast]
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from pitcrew.config import Config
+
+_LENGTH = struct.Struct(">I")
+
+
+def socket_path(project_root: Path) -> Path:
+    """Get the daemon socket path for a project.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Path to ~/.pitcrew/<project-hash>.sock
+    """
+    digest = hashlib.sha1(str(project_root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path.home() / ".pitcrew" / f"{digest}.sock"
+
+
+def _send_msg(sock: socket.socket, payload: dict[str, Any]) -> None:
+    """Send one length-prefixed JSON message."""
+    data = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes or raise ConnectionError."""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_msg(sock: socket.socket) -> dict[str, Any]:
+    """Receive one length-prefixed JSON message."""
+    (size,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    data = _recv_exact(sock, size)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def send_command(project_root: Path, command: str, model: Optional[str] = None) -> Optional[str]:
+    """Send a command to a running daemon.
+
+    Args:
+        project_root: Project root directory
+        command: REPL input (slash command or natural language)
+        model: Model the caller asked for; a daemon running another model declines
+
+    Returns:
+        Rendered output, or None if no daemon is listening or it declined
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        if sock.connect_ex(str(socket_path(project_root))) != 0:
+            return None
+        _send_msg(sock, {"command": command, "model": model})
+        reply = _recv_msg(sock)
+        if "error" in reply:
+            return None
+        return reply.get("output", "")
+    except (OSError, ConnectionError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+def spawn_daemon(project_root: Path, model: Optional[str] = None) -> None:
+    """Start a detached daemon for the project in the background.
+
+    Args:
+        project_root: Project root directory
+        model: Optional model override passed through to the daemon
+    """
+    if os.name != "posix":
+        return
+
+    if os.fork() != 0:
+        return  # Parent continues with the in-process path
+
+    # Child: detach from the terminal and re-exec in daemon mode
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    argv = [sys.executable, "-m", "pitcrew.cli", str(project_root), "--daemon"]
+    if model:
+        argv += ["--model", model]
+    os.execv(sys.executable, argv)
+
+
+def _handle_request(repl: Any, request: dict[str, Any]) -> dict[str, Any]:
+    """Run one client request against the daemon's warm REPL.
+
+    Args:
+        repl: The daemon's REPL
+        request: Decoded request message
+
+    Returns:
+        Reply message with the rendered output, or an error if the client
+        asked for a different model than the daemon runs
+    """
+    from pitcrew.cli import console
+
+    model = request.get("model")
+    if model and model != repl.config.default_model:
+        return {"error": f"Daemon runs {repl.config.default_model}, not {model}"}
+
+    command = request.get("command", "").strip()
+    with console.capture() as capture:
+        if command:
+            repl.logger.log_message("user", command)
+            repl.handle_input(command)
+    return {"output": capture.get()}
+
+
+def _share_console() -> None:
+    """Point every module's console at the CLI's, so one capture sees it all.
+
+    The graph and handlers print progress through their own module-level
+    consoles, which in a daemon write to /dev/null.
+    """
+    import pitcrew.graph
+    import pitcrew.handlers.autonomous
+    import pitcrew.handlers.query
+    from pitcrew.cli import console
+
+    for module in (pitcrew.graph, pitcrew.handlers.autonomous, pitcrew.handlers.query):
+        module.console = console
+
+
+def serve(project_root: Path, config: "Config") -> None:
+    """Serve commands for a project until a /quit command is received.
+
+    Args:
+        project_root: Project root directory
+        config: Configuration object
+    """
+    from pitcrew.cli import REPL
+
+    repl = REPL(project_root, config)
+    _share_console()
+
+    # Pay for the index refresh and graph compilation once, before the first
+    # client is waiting on them
+    repl.graph.get_index()
+    repl.graph.build_graph()
+
+    path = socket_path(project_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()  # Stale socket from a daemon that did not shut down cleanly
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    os.chmod(path, 0o600)
+    server.listen()
+
+    try:
+        while repl.running:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    request = _recv_msg(conn)
+                except (ConnectionError, ValueError):
+                    continue
+
+                try:
+                    _send_msg(conn, _handle_request(repl, request))
+                except OSError:
+                    pass  # Client went away
+    finally:
+        server.close()
+        if path.exists():
+            path.unlink()
+        repl.graph.close()
@@ -1,23 +1,303 @@
 """LangGraph orchestration and supervisor node."""
 
+import asyncio
+import heapq
+import io
 import json
-import time
+import mmap
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 from langgraph.graph import StateGraph, END
+from rich.console import Console
+from rich.progress import Progress
 
 from pitcrew.config import Config
 from pitcrew.llm import LLM
 from pitcrew.state import BotState
 from pitcrew.tools.executor import Executor
-from pitcrew.tools.file_index import FileIndex
-from pitcrew.tools.planner import Planner
-from pitcrew.tools.read_write import ReadWrite
+from pitcrew.tools.file_index import FileIndex, FileIndexSnapshot
+from pitcrew.tools.planner import EditAction, Plan, Planner
+from pitcrew.tools.read_write import ReadWrite, content_hash, text_hash
 from pitcrew.tools.tester import Tester
+from pitcrew.utils.cache import FileContentCache, TTLCache
+from pitcrew.utils.diffs import apply_patch, normalize_line_endings
 from pitcrew.utils.ignore import IgnoreRules
 from pitcrew.utils.logging import SessionLogger
 
+console = Console()
+
+# Context documents fed into LLM prompts, in the order they are emitted
+CONTEXT_DOC_FILES = ("AGENTS.md", "AGENTS.local.md")
+
+# /init --batch records its in-flight batch here until the result is collected
+PENDING_BATCH_FILE = Path(".pitcrew") / "pending_batch.json"
+
+# /exec results are only reused for read-only inspection commands without shell
+# operators; anything else (builds, tests, writes) always runs
+_CACHEABLE_EXEC_RE = re.compile(
+    r"^\s*(?:"
+    r"(?:git\s+(?:status|log|diff|show)|ls|cat|head|tail|wc|grep|rg|tree)\b"
+    # git branch only when listing, never when given a name to create
+    r"|git\s+branch(?:\s+(?:-a|-r|-v|-vv|--all|--remotes|--list|--show-current))*\s*$"
+    # find without actions that delete, run commands or write files
+    r"|find\b(?!.*\s-(?:delete|exec|execdir|ok|okdir|fprint|fprint0|fprintf|fls)\b)"
+    r")[^;&|<>`$]*$"
+)
+EXEC_CACHE_TTL = 60  # seconds
+
+# Command output shown to the user (and fed back into prompts) is capped
+EXEC_OUTPUT_LIMIT = 8000  # characters
+
+# Sections of LLM replies, compiled once
+_FILE_BLOCK_RE = re.compile(r'<file path="([^"]+)">(.*?)</file>', re.DOTALL)
+_THINKING_RE = re.compile(r'<thinking>(.*?)</thinking>', re.DOTALL | re.IGNORECASE)
+_ANALYSIS_RE = re.compile(r'<analysis>(.*?)</analysis>', re.DOTALL | re.IGNORECASE)
+_CODE_RE = re.compile(r'<code>(.*?)</code>', re.DOTALL | re.IGNORECASE)
+_MARKDOWN_CODE_RE = re.compile(r'```(?:\w+)?\n(.*?)\n```', re.DOTALL)
+
+# File names in Python tracebacks
+_TRACEBACK_FILE_RE = re.compile(r'File "([^"]+)"')
+
+# /init file selection: what to skip entirely and what to read in full
+_INIT_SKIP_EXTENSIONS = frozenset({
+    '.pdf', '.doc', '.docx', '.dat', '.bin', '.exe', '.zip', '.tar', '.gz',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.ico', '.webp',
+    '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv',
+    '.mp3', '.wav', '.ogg', '.flac',
+    '.ttf', '.otf', '.woff', '.woff2',
+    '.pyc', '.pyo', '.pyd', '.so', '.dylib', '.dll',
+})
+
+_INIT_SKIP_FILENAMES = frozenset({
+    '.DS_Store', '.gitignore', '.gitattributes', '.dockerignore',
+    'package-lock.json', 'yarn.lock', 'poetry.lock', 'Pipfile.lock',
+    '.env', '.env.example', '.env.local', '.env.production',
+    'LICENSE', 'LICENSE.md', 'LICENSE.txt',
+})
+
+_INIT_SKIP_DIRS = frozenset({
+    '.pytest_cache', '.mypy_cache', '.ruff_cache', '__pycache__',
+    'node_modules', '.pitcrew', '.bot', '.git',
+})
+
+_INIT_IMPORTANT_FILENAMES = frozenset({
+    # Entry points
+    'main.py', 'cli.py', 'app.py', 'index.js', 'index.ts', 'server.js', 'main.go',
+    # Init files
+    '__init__.py',
+    # Build and package config
+    'setup.py', 'setup.cfg', 'pyproject.toml', 'package.json', 'tsconfig.json',
+    'go.mod', 'cargo.toml', 'makefile', 'dockerfile',
+    # Documentation
+    'readme.md', 'readme.txt', 'changelog.md', 'contributing.md',
+})
+
+_INIT_CONFIG_EXTENSIONS = frozenset({'.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.json'})
+
+_INIT_MAX_FILE_SIZE = 500_000  # bytes (increased from 100KB)
+
+# Files under a config/settings directory in the top two levels are read in full
+_INIT_CONFIG_DIR_RE = re.compile(r'^(?:[^/]+/)?(?:config|settings)(?:/|$)')
+
+# Lines read from files that are not important enough to read in full
+_INIT_DEFAULT_MAX_LINES = 300  # (increased from 100)
+
+# Any skipped directory as a "/dir/" component of a "/"-prefixed index path,
+# matched in one scan
+_INIT_SKIP_DIR_RE = re.compile("/(?:%s)/" % "|".join(map(re.escape, sorted(_INIT_SKIP_DIRS))))
+
+# Threads in the graph's shared I/O pool (/init reads, /apply edit groups,
+# index builds, snapshot copies).
+# The work is I/O- or network-bound, so oversubscribe the cores; asyncio's
+# default executor would cap this at cpu+4
+_IO_POOL_WORKERS = 32
+
+# The /init file tree lists this many paths, in at most this many lines
+_FILE_TREE_MAX_FILES = 30
+_FILE_TREE_MAX_LINES = 50
+
+# Stands in for a file whose /init excerpt repeats an earlier file's
+_INIT_DUPLICATE_TEMPLATE = "# (identical to {path})"
+
+# File contents in the /init prompt are capped to stay well inside the model's
+# 200K-token context; tokens are estimated from characters
+_INIT_CONTENT_TOKEN_BUDGET = 150_000
+_CHARS_PER_TOKEN = 4
+
+# /init instructions are constant system blocks (cacheable by the provider);
+# only the project details in _INIT_PROJECT_TEMPLATE vary between runs
+_INIT_CREATE_SYSTEM = [{
+    "type": "text",
+    "text": """Analyze the project described by the user and create a comprehensive AGENTS.md file.
+
+Create a detailed AGENTS.md file with these sections:
+
+1. **Project Overview** - What this project does, main use cases
+2. **Tech Stack** - Languages, frameworks, key dependencies
+3. **Architecture** - Directory structure, key files, main classes, data flow
+4. **Key Classes & Functions** - Actual class/function names from the code
+5. **Configuration & Setup** - Environment variables, config files, setup steps
+6. **How to Test** - Test commands and approach
+7. **Coding Conventions** - Patterns, style, error handling
+8. **Important Implementation Details** - Key algorithms, gotchas, TODOs
+
+Use ACTUAL information from the file contents. Include real class names, function signatures, and configuration values.""",
+    "cache_control": {"type": "ephemeral"},
+}]
+
+_INIT_UPDATE_SYSTEM = [{
+    "type": "text",
+    "text": """Update the existing AGENTS.md file for the project described by the user with the latest changes.
+
+**Your task:**
+Review the existing AGENTS.md and UPDATE it with the latest information from the file contents.
+
+IMPORTANT:
+1. **Preserve** any manually added sections, notes, or instructions
+2. **Update** outdated information with current details from the file contents
+3. **Add** new classes, functions, or files that weren't documented before
+4. **Remove** references to deleted files or components that no longer exist
+5. **Keep** the same overall structure and tone
+6. Use ACTUAL information from the file contents (real class names, function signatures, config values)
+
+Return the complete updated AGENTS.md content.""",
+    "cache_control": {"type": "ephemeral"},
+}]
+
+# The file tree and contents are the bulk of the /init prompt and change least,
+# so they go first in the user message, behind their own cache breakpoint
+_INIT_FILES_HEADER = """File Structure:
+```
+{file_tree}
+```
+
+File Contents (important files shown in full, others truncated to first 300 lines):
+"""
+
+_INIT_EXISTING_TEMPLATE = """Existing AGENTS.md Content:
+```markdown
+{existing}
+```
+
+"""
+
+_INIT_PROJECT_TEMPLATE = """{existing_section}Project Information:
+- Name: {name}
+- Languages: {languages}
+- Total Files: {total_files}
+- Test Command: {test_command}
+"""
+
+
+def _clip(text: str, limit: int = EXEC_OUTPUT_LIMIT) -> str:
+    """Shorten long command output to its head and tail.
+
+    Args:
+        text: Output to shorten
+        limit: Maximum number of characters kept
+
+    Returns:
+        The text unchanged if it fits, otherwise head + elision marker + tail
+    """
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return f"{text[:half]}\n...[{len(text) - limit} characters elided]...\n{text[-half:]}"
+
+
+def _pack_blocks(blocks: list[str], token_budget: int) -> tuple[list[str], int]:
+    """Keep the prompt blocks that fit a token budget, in their original order.
+
+    Each block is measured once; blocks that would overflow the budget are
+    dropped and later, smaller blocks may still fit.
+
+    Args:
+        blocks: Prompt blocks in priority order
+        token_budget: Estimated tokens available
+
+    Returns:
+        Tuple of (kept blocks, number of blocks dropped)
+    """
+    kept = []
+    remaining = token_budget
+    for block in blocks:
+        cost = len(block) // _CHARS_PER_TOKEN + 1
+        if cost <= remaining:
+            kept.append(block)
+            remaining -= cost
+    return kept, len(blocks) - len(kept)
+
+
+def _init_should_skip(path: str, ext: str, size: int) -> bool:
+    """Decide from index columns alone whether /init should skip a file.
+
+    Args:
+        path: "/"-separated path relative to the project root
+        ext: Lowercased extension
+        size: File size in bytes
+
+    Returns:
+        True for binary/media extensions, large files, lock/env/license
+        files, and anything under a cache or VCS directory
+    """
+    if ext in _INIT_SKIP_EXTENSIONS or size > _INIT_MAX_FILE_SIZE:
+        return True
+    if path.rpartition("/")[2] in _INIT_SKIP_FILENAMES:
+        return True
+    return _INIT_SKIP_DIR_RE.search(f"/{path}") is not None
+
+
+def _preview_thinking(thinking: str, limit: int = 500) -> str:
+    """Shorten an LLM's reasoning for display, keeping whole lines.
+
+    Args:
+        thinking: Reasoning text
+        limit: Characters shown before cutting off with "..."
+
+    Returns:
+        Leading lines of the reasoning
+    """
+    shown_chars = 0
+    shown_lines = []
+    for line in thinking.split('\n'):
+        if shown_chars + len(line) > limit:
+            shown_lines.append("...")
+            break
+        shown_lines.append(line)
+        shown_chars += len(line)
+    return '\n'.join(shown_lines)
+
+
+def _init_line_limit(path: str, ext: str) -> Optional[int]:
+    """Decide how much of a file /init reads.
+
+    Args:
+        path: "/"-separated path relative to the project root
+        ext: Lowercased extension
+
+    Returns:
+        None to read important files (entry points, package config, docs,
+        config files and directories) in full, otherwise a line limit
+    """
+    if (
+        ext in _INIT_CONFIG_EXTENSIONS
+        or path.rpartition("/")[2].lower() in _INIT_IMPORTANT_FILENAMES
+        or _INIT_CONFIG_DIR_RE.match(path)
+    ):
+        return None
+    return _INIT_DEFAULT_MAX_LINES
+
+
+def _canonicalize_doc(content: str) -> str:
+    """Normalize a context doc to LF line endings and a single trailing newline."""
+    return content.replace("\r\n", "\n").rstrip() + "\n"
+
 
 class PitCrewGraph:
     """Manages the LangGraph workflow for PitCrew."""
@@ -32,10 +312,18 @@ class PitCrewGraph:
         self.project_root = project_root
         self.config = config
 
+        # Shared by every handler and tool instead of a pool per call; threads
+        # start lazily
+        self._io_pool = ThreadPoolExecutor(max_workers=_IO_POOL_WORKERS, thread_name_prefix="pitcrew-io")
+
         # Initialize tools
         self.ignore_rules = IgnoreRules(project_root)
-        self.file_index = FileIndex(project_root, self.ignore_rules, config.max_read_mb)
-        self.read_write = ReadWrite(project_root, config.max_read_mb, config.max_write_mb)
+        self.file_index = FileIndex(
+            project_root, self.ignore_rules, config.max_read_mb, executor=self._io_pool
+        )
+        self.read_write = ReadWrite(
+            project_root, config.max_read_mb, config.max_write_mb, executor=self._io_pool
+        )
         self.executor = Executor(project_root, config.exec_timeout, config.exec_net_policy)
         self.tester = Tester(project_root, self.executor, config.custom_commands)
 
@@ -46,17 +334,85 @@ class PitCrewGraph:
         self.llm = LLM(model_descriptor, config.anthropic_api_key)
 
         # Initialize planner
-        self.planner = Planner(self.llm, project_root)
+        self.planner = Planner(self.llm, project_root, use_prompt_caching=True)
 
         # Initialize logger
         self.logger: SessionLogger = None  # Set during session start
 
+        # Compiled LangGraph workflow, built on first use
+        self._compiled_graph = None
+
+        # Single-flight index refresh: callers that queue up behind a running
+        # refresh share the next one instead of each running their own
+        self._index_lock = threading.Lock()
+        # Refreshes started so far, and the start number of the last to finish
+        self._index_started = 0
+        self._index_done = 0
+        self._cached_index: Optional[FileIndexSnapshot] = None
+
+        # (snapshot, rendered tree) for the most recent _build_file_tree call
+        self._file_tree_cache: Optional[tuple[Any, str]] = None
+
+        # Plan edit action -> handler returning a status line
+        self._edit_dispatch = {
+            "create": self._apply_create,
+            "replace": self._apply_replace,
+            "patch": self._apply_patch,
+            "implement": self._apply_implement,
+            "delete": self._apply_delete,
+        }
+
+        # Canonicalized context docs keyed by filename: (mtime_ns, size, content)
+        self._ctx_cache: dict[str, tuple[int, int, str]] = {}
+
+        # /read output keyed by (path, mtime_ns, size); /exec output keyed by command
+        self._read_cache = TTLCache(maxsize=128)
+        self._exec_cache = TTLCache(maxsize=512, ttl=EXEC_CACHE_TTL)
+
+        # /init file excerpts, reused across runs while a file's stamp is unchanged
+        self._init_cache = FileContentCache(project_root / ".pitcrew" / "init_cache.json")
+
+    def close(self) -> None:
+        """Shut down the shared I/O pool, waiting for in-flight work."""
+        self._io_pool.shutdown(wait=True)
+
+    def get_index(self) -> FileIndexSnapshot:
+        """Load and refresh the file index, sharing one refresh between callers.
+
+        A caller that had to wait reuses a refresh only if that refresh
+        started after the caller asked, so it cannot miss edits made before
+        the call. A refresh already running when the caller arrived may have
+        scanned those files too early, so the caller then runs its own.
+
+        Returns:
+            Current FileIndexSnapshot
+        """
+        asked = self._index_started
+        with self._index_lock:
+            if self._index_done > asked and self._cached_index is not None:
+                return self._cached_index
+            self._index_started += 1
+            started = self._index_started
+            index = self.file_index.load_or_refresh()
+            # Keep the previous snapshot object when nothing changed, so values
+            # derived from it (such as the /init file tree) stay cached
+            if self._cached_index is None or index.files != self._cached_index.files:
+                self._cached_index = index
+            self._index_done = started
+            return self._cached_index
+
     def build_graph(self) -> StateGraph:
         """Build the LangGraph workflow.
 
+        The compiled graph is cached on the instance; call ``invalidate_graph``
+        after changing its nodes.
+
         Returns:
             Compiled StateGraph
         """
+        if self._compiled_graph is not None:
+            return self._compiled_graph
+
         workflow = StateGraph(BotState)
 
         # Add supervisor node
@@ -66,7 +422,12 @@ class PitCrewGraph:
         workflow.set_entry_point("supervisor")
         workflow.add_edge("supervisor", END)
 
-        return workflow.compile()
+        self._compiled_graph = workflow.compile()
+        return self._compiled_graph
+
+    def invalidate_graph(self) -> None:
+        """Drop the cached compiled graph so the next build_graph recompiles."""
+        self._compiled_graph = None
 
     def supervisor_node(self, state: BotState) -> BotState:
         """Supervisor node that handles commands and orchestrates tools.
@@ -81,14 +442,20 @@ class PitCrewGraph:
         # where we can handle interactive commands
         return state
 
-    def handle_init(self) -> str:
+    def handle_init(self, batch: bool = False) -> str:
         """Handle /init command - create or update AGENTS.md using a template.
 
+        Args:
+            batch: Generate through the Message Batches API (half price, up to
+                24 hours). The first call submits the batch; later calls collect
+                it once it has finished.
+
         Returns:
             Status message
         """
-        from rich.console import Console
-        console = Console()
+        pending_path = self.project_root / PENDING_BATCH_FILE
+        if batch and pending_path.exists():
+            return self._collect_init_batch(pending_path)
 
         # Check if AGENTS.md already exists
         agents_path = self.project_root / "AGENTS.md"
@@ -104,11 +471,8 @@ class PitCrewGraph:
                 existing_content = None
 
         console.print("📊 Building file index...")
-        # Load index
-        index = self.file_index.load_from_disk()
-        if not index:
-            index = self.file_index.build()
-            self.file_index.save_to_disk(index)
+        # Load index, re-scanning only files that changed
+        index = self.get_index()
 
         console.print(f"📁 Found {len(index.files)} files in project")
 
@@ -117,191 +481,306 @@ class PitCrewGraph:
         languages = list(index.summary.get("languages", {}).keys())
         total_files = index.summary.get("total_files", 0)
 
-        # Detect test command
-        test_commands = self.tester.detect()
-        test_command = test_commands[0] if test_commands else None
-
-        # Build file tree
-        file_tree = self._build_file_tree(index)
-
-        # Read file contents (first 100 lines) - NO AI summarization
-        console.print("📖 Reading project files...")
-
-        skip_extensions = {'.pdf', '.doc', '.docx', '.dat', '.bin', '.exe', '.zip', '.tar', '.gz',
-                          '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.ico', '.webp',
-                          '.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv',
-                          '.mp3', '.wav', '.ogg', '.flac',
-                          '.ttf', '.otf', '.woff', '.woff2',
-                          '.pyc', '.pyo', '.pyd', '.so', '.dylib', '.dll'}
-
-        skip_filenames = {'.DS_Store', '.gitignore', '.gitattributes', '.dockerignore',
-                         'package-lock.json', 'yarn.lock', 'poetry.lock', 'Pipfile.lock',
-                         '.env', '.env.example', '.env.local', '.env.production',
-                         'LICENSE', 'LICENSE.md', 'LICENSE.txt'}
-
-        skip_dirs = {'.pytest_cache', '.mypy_cache', '.ruff_cache', '__pycache__',
-                    'node_modules', '.pitcrew', '.bot', '.git'}
-
-        file_contents = []
-        files_read = 0
+        # Choose which files to read and how much of each
+        candidates = []
         files_skipped = 0
 
-        for f in index.files:
+        for f, ext, file_size in zip(index.files, index.exts, index.sizes):
             file_path = f["path"]
-            file_size = f.get("size", 0)
-            path_obj = Path(file_path)
-
-            # Skip files by directory, extension, filename, or size
-            if any(skip_dir in path_obj.parts for skip_dir in skip_dirs):
+            if _init_should_skip(file_path, ext, file_size):
                 files_skipped += 1
                 continue
-            if path_obj.suffix.lower() in skip_extensions:
-                files_skipped += 1
-                continue
-            if path_obj.name in skip_filenames:
-                files_skipped += 1
-                continue
-            if file_size > 500_000:  # Skip files > 500KB (increased from 100KB)
-                files_skipped += 1
-                continue
-
-            # Determine how many lines to read based on file importance
-            try:
-                full_path = self.project_root / file_path
-                filename = path_obj.name.lower()
-
-                # Important files: read the whole file (or more lines)
-                is_important = (
-                    # Entry points
-                    filename in {'main.py', 'cli.py', 'app.py', 'index.js', 'index.ts', 'server.js', 'main.go'} or
-                    # Init files
-                    filename == '__init__.py' or
-                    # Config files (usually small)
-                    path_obj.suffix in {'.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.json'} or
-                    filename in {'setup.py', 'setup.cfg', 'pyproject.toml', 'package.json', 'tsconfig.json',
-                                'go.mod', 'cargo.toml', 'makefile', 'dockerfile'} or
-                    # Documentation
-                    filename in {'readme.md', 'readme.txt', 'changelog.md', 'contributing.md'} or
-                    # Important config directories
-                    'config' in path_obj.parts[:2] or 'settings' in path_obj.parts[:2]
-                )
-
-                # Set line limit based on importance
-                if is_important:
-                    max_lines = None  # Read entire file
-                else:
-                    max_lines = 300  # First 300 lines for regular files (increased from 100)
 
-                with open(full_path, 'r', encoding='utf-8', errors='ignore') as fp:
-                    lines = []
-                    for i, line in enumerate(fp):
-                        if max_lines and i >= max_lines:
-                            lines.append(f"... (truncated at {max_lines} lines)")
-                            break
-                        lines.append(line.rstrip())
+            # Read important files in full, others up to a line limit
+            candidates.append((file_path, _init_line_limit(file_path, ext), file_size, f["mtime"]))
 
-                    content = '\n'.join(lines)
-                    file_contents.append(f"=== {file_path} ===\n{content}")
-                    files_read += 1
-
-                    if files_read % 10 == 0:
-                        console.print(f"  📄 Read {files_read} files...")
-            except Exception:
-                continue  # Skip files we can't read
+        # Read file contents - NO AI summarization. Test detection and the file
+        # tree are built while the reads are in flight.
+        with Progress(console=console, transient=True) as progress:
+            task = progress.add_task("📖 Reading project files", total=len(candidates))
+            test_commands, file_tree, file_contents = asyncio.run(self._gather_init_inputs(
+                index, candidates, on_read=lambda: progress.advance(task)
+            ))
+        test_command = test_commands[0] if test_commands else None
+        files_read = len(file_contents)
 
         console.print(f"✅ Read {files_read} files (skipped {files_skipped}: binary/lock/cache/large files)")
         console.print("📝 Generating AGENTS.md with AI (one prompt, cached)...")
 
-        # Build ONE big prompt with all file contents
-        files_context = "\n\n".join(file_contents) if file_contents else "No files found"
+        # Build ONE big prompt with as many file contents as fit the budget
+        file_contents, files_omitted = _pack_blocks(file_contents, _INIT_CONTENT_TOKEN_BUDGET)
+        if files_omitted:
+            console.print(f"⚠️  Left {files_omitted} files out of the prompt to fit the context window")
+            file_contents.append(f"... ({files_omitted} more files omitted to fit the context window)")
+
+        # Copy the (possibly multi-MB) file blocks into the prompt with a single
+        # join, then drop them so only the prompt is held during the LLM call
+        parts = [_INIT_FILES_HEADER.format(file_tree=file_tree)]
+        for i, block in enumerate(file_contents or ["No files found"]):
+            if i:
+                parts.append("\n\n")
+            parts.append(block)
+        parts.append("\n")
+        files_block = "".join(parts)
+        del parts, file_contents
 
         # Build prompt based on whether we're creating or updating
-        if is_update and existing_content:
-            prompt = f"""Update the existing AGENTS.md file for this project with the latest changes.
+        updating = bool(is_update and existing_content)
+        project_block = _INIT_PROJECT_TEMPLATE.format(
+            existing_section=(
+                _INIT_EXISTING_TEMPLATE.format(existing=existing_content[:10000]) if updating else ""
+            ),
+            name=project_name,
+            languages=", ".join(languages),
+            total_files=total_files,
+            test_command=test_command or "Not detected",
+        )
 
-Existing AGENTS.md Content:
-```markdown
-{existing_content[:10000]}
-```
+        try:
+            # Send as ONE prompt: constant instructions, then the cached file
+            # contents, then the details that vary between runs
+            messages = [
+                {"role": "system", "content": _INIT_UPDATE_SYSTEM if updating else _INIT_CREATE_SYSTEM},
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": files_block, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": project_block},
+                    ],
+                },
+            ]
+            if batch:
+                return self._submit_init_batch(messages, is_update)
 
-Project Information:
-- Name: {project_name}
-- Languages: {', '.join(languages)}
-- Total Files: {total_files}
-- Test Command: {test_command or 'Not detected'}
+            try:
+                agents_content = self._stream_agents_md(messages)
+            except Exception:
+                # Fall back to a single non-streaming call
+                response = self.llm.complete(messages, temperature=0.3)
+                return self._write_agents_md(response["content"], is_update)
+            return self._finish_agents_md(agents_content, is_update)
 
-File Structure:
-```
-{file_tree}
-```
+        except Exception as e:
+            return f"✗ Error generating AGENTS.md: {str(e)}"
 
-File Contents (important files shown in full, others truncated to first 300 lines):
-{files_context}
+    def _stream_agents_md(self, messages: list[dict]) -> str:
+        """Stream the AGENTS.md generation straight into the file.
 
-**Your task:**
-Review the existing AGENTS.md and UPDATE it with the latest information from the file contents above.
+        Chunks are written to AGENTS.md.tmp as they arrive, with a running
+        character count on the console, and the file replaces AGENTS.md
+        once the stream completes.
 
-IMPORTANT:
-1. **Preserve** any manually added sections, notes, or instructions
-2. **Update** outdated information with current details from the file contents
-3. **Add** new classes, functions, or files that weren't documented before
-4. **Remove** references to deleted files or components that no longer exist
-5. **Keep** the same overall structure and tone
-6. Use ACTUAL information from the file contents (real class names, function signatures, config values)
+        Args:
+            messages: AGENTS.md generation messages
 
-Return the complete updated AGENTS.md content.
-"""
+        Returns:
+            Generated AGENTS.md content
+        """
+        agents_path = self.project_root / "AGENTS.md"
+        tmp_path = agents_path.with_name("AGENTS.md.tmp")
+        parts = []
+        received = 0
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f, \
+                    console.status("📝 Generating AGENTS.md...") as status:
+                for chunk in self.llm.stream(messages, temperature=0.3):
+                    f.write(chunk)
+                    parts.append(chunk)
+                    received += len(chunk)
+                    status.update(f"📝 Generating AGENTS.md... {received:,} characters")
+            os.replace(tmp_path, agents_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return "".join(parts)
+
+    def _write_agents_md(self, agents_content: str, is_update: bool) -> str:
+        """Write generated AGENTS.md content.
+
+        Args:
+            agents_content: Generated AGENTS.md content
+            is_update: Whether an existing AGENTS.md was updated
+
+        Returns:
+            Status message
+        """
+        success, error = self.read_write.write("AGENTS.md", agents_content)
+        if success:
+            return self._finish_agents_md(agents_content, is_update)
         else:
-            prompt = f"""Analyze this project and create a comprehensive AGENTS.md file.
+            return f"✗ Failed to write AGENTS.md: {error}"
 
-Project Information:
-- Name: {project_name}
-- Languages: {', '.join(languages)}
-- Total Files: {total_files}
-- Test Command: {test_command or 'Not detected'}
+    def _finish_agents_md(self, agents_content: str, is_update: bool) -> str:
+        """Report a freshly written AGENTS.md and cache its content.
 
-File Structure:
-```
-{file_tree}
-```
+        Args:
+            agents_content: Content now on disk
+            is_update: Whether an existing AGENTS.md was updated
 
-File Contents (important files shown in full, others truncated to first 300 lines):
-{files_context}
+        Returns:
+            Status message
+        """
+        self._remember_context_doc("AGENTS.md", agents_content)
+        if is_update:
+            console.print("✅ Updated AGENTS.md with latest changes")
+            return "✓ Updated AGENTS.md with latest project changes"
+        else:
+            console.print("✅ Created AGENTS.md")
+            return "✓ Created AGENTS.md based on project analysis"
 
-Create a detailed AGENTS.md file with these sections:
+    def _submit_init_batch(self, messages: list[dict], is_update: bool) -> str:
+        """Submit the AGENTS.md prompt as a batch and record it as pending.
 
-1. **Project Overview** - What this project does, main use cases
-2. **Tech Stack** - Languages, frameworks, key dependencies
-3. **Architecture** - Directory structure, key files, main classes, data flow
-4. **Key Classes & Functions** - Actual class/function names from the code
-5. **Configuration & Setup** - Environment variables, config files, setup steps
-6. **How to Test** - Test commands and approach
-7. **Coding Conventions** - Patterns, style, error handling
-8. **Important Implementation Details** - Key algorithms, gotchas, TODOs
+        Args:
+            messages: AGENTS.md generation messages
+            is_update: Whether an existing AGENTS.md is being updated
 
-Use ACTUAL information from the file contents above. Include real class names, function signatures, and configuration values.
-"""
+        Returns:
+            Status message
+        """
+        batch_id = self.llm.submit_batch([messages], temperature=0.3)
+        pending_path = self.project_root / PENDING_BATCH_FILE
+        pending_path.parent.mkdir(parents=True, exist_ok=True)
+        pending_path.write_text(json.dumps({"batch_id": batch_id, "is_update": is_update}))
+        return (
+            f"⏳ Submitted AGENTS.md generation as batch {batch_id} (half price, may take up to "
+            "24 hours). Run /init --batch again to collect it."
+        )
+
+    def _collect_init_batch(self, pending_path: Path) -> str:
+        """Write AGENTS.md from a pending batch if it has finished.
 
+        Args:
+            pending_path: Path of the pending batch record
+
+        Returns:
+            Status message
+        """
         try:
-            # Send as ONE prompt (file contents will be cached by Anthropic)
-            messages = [{"role": "user", "content": prompt}]
-            response = self.llm.complete(messages, temperature=0.3)
-            agents_content = response["content"]
+            pending = json.loads(pending_path.read_text())
+            batch_id = pending["batch_id"]
+            results = self.llm.poll_batch(batch_id)
+        except Exception as e:
+            return f"✗ Error checking AGENTS.md batch: {str(e)}"
+
+        if results is None:
+            return f"⏳ Batch {batch_id} is still processing. Run /init --batch again later."
+
+        pending_path.unlink(missing_ok=True)
+        if not results or results[0] is None:
+            return f"✗ Batch {batch_id} failed. Run /init --batch to submit a new one."
+        return self._write_agents_md(results[0]["content"], pending.get("is_update", False))
+
+    async def _gather_init_inputs(
+        self,
+        index: Any,
+        candidates: list[tuple[str, Optional[int], int, float]],
+        on_read: Optional[Callable[[], None]] = None,
+    ) -> tuple[list[str], str, list[str]]:
+        """Read /init files while detecting tests and building the file tree.
+
+        Excerpts cached by an earlier run are reused while the file's size
+        and mtime match. Other reads run on the shared I/O pool and feed a
+        queue; an aggregator hashes each excerpt as soon as its read lands,
+        so hashing overlaps the remaining reads. A file whose excerpt repeats
+        an earlier one (empty __init__.py files, generated boilerplate) gets
+        a back-reference instead of a second copy.
 
-            # Write AGENTS.md
-            success, error = self.read_write.write("AGENTS.md", agents_content)
-            if success:
-                if is_update:
-                    console.print("✅ Updated AGENTS.md with latest changes")
-                    return "✓ Updated AGENTS.md with latest project changes"
-                else:
-                    console.print("✅ Created AGENTS.md")
-                    return "✓ Created AGENTS.md based on project analysis"
-            else:
-                return f"✗ Failed to write AGENTS.md: {error}"
+        Args:
+            index: File index snapshot
+            candidates: (path, max_lines, size, mtime) tuples to read, in prompt order
+            on_read: Called once per finished read, for progress reporting
 
-        except Exception as e:
-            return f"✗ Error generating AGENTS.md: {str(e)}"
+        Returns:
+            Tuple of (test_commands, file_tree, file_blocks)
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        excerpts: list[Optional[tuple[str, str, bytes]]] = [None] * len(candidates)
+
+        async def produce(i: int, file_path: str, max_lines: Optional[int], size: int, mtime: float) -> None:
+            content = self._init_cache.get(file_path, size, mtime, max_lines)
+            if content is None:
+                content = await loop.run_in_executor(self._io_pool, self._read_init_file, file_path, max_lines)
+                if content is not None:
+                    self._init_cache.set(file_path, size, mtime, max_lines, content)
+            await queue.put((i, file_path, content))
+
+        async def aggregate() -> None:
+            for _ in range(len(candidates)):
+                i, file_path, content = await queue.get()
+                if on_read:
+                    on_read()
+                if content is None:
+                    continue  # Skip files we can't read
+                excerpts[i] = (file_path, content, text_hash(content))
+
+        test_commands, file_tree, *_ = await asyncio.gather(
+            asyncio.to_thread(self.tester.detect),
+            asyncio.to_thread(self._build_file_tree, index),
+            aggregate(),
+            *(produce(i, *candidate) for i, candidate in enumerate(candidates)),
+        )
+        await asyncio.to_thread(self._init_cache.save, {candidate[0] for candidate in candidates})
+
+        blocks = []
+        seen: dict[bytes, str] = {}
+        for excerpt in excerpts:
+            if excerpt is None:
+                continue
+            file_path, content, digest = excerpt
+            original = seen.setdefault(digest, file_path)
+            if original != file_path:
+                reference = _INIT_DUPLICATE_TEMPLATE.format(path=original)
+                if len(reference) < len(content):
+                    content = reference
+            blocks.append(f"=== {file_path} ===\n{content}")
+
+        return test_commands, file_tree, blocks
+
+    def _read_init_file(self, file_path: str, max_lines: Optional[int]) -> Optional[str]:
+        """Read a file for the /init prompt.
+
+        Args:
+            file_path: Path relative to the project root
+            max_lines: Line limit, or None to read the whole file
+
+        Returns:
+            File content (with a truncation marker if cut), or None if unreadable
+        """
+        try:
+            with open(self.project_root / file_path, 'rb') as fp:
+                try:
+                    mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    return ''  # Empty files cannot be mapped
+
+                with mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+
+                    # Find the end of the first max_lines lines without
+                    # iterating the file line by line
+                    end = len(mm)
+                    if max_lines:
+                        pos = 0
+                        for _ in range(max_lines):
+                            newline = mm.find(b'\n', pos)
+                            if newline < 0:
+                                pos = end
+                                break
+                            pos = newline + 1
+                        end = pos
+
+                    # Normalize line endings on the whole slice instead of per line
+                    content = mm[:end].replace(b'\r\n', b'\n').decode('utf-8', 'ignore')
+                    if content.endswith('\n'):
+                        content = content[:-1]
+                    if end < len(mm):
+                        content += f"\n... (truncated at {max_lines} lines)"
+                    return content
+        except Exception:
+            return None
 
     def handle_index(self) -> str:
         """Handle /index command - rebuild file index.
@@ -322,9 +801,22 @@ Use ACTUAL information from the file contents above. Include real class names, f
         Returns:
             File content or error message
         """
+        try:
+            stat = (self.project_root / path).stat()
+            cache_key = (path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        if cache_key:
+            cached = self._read_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         success, content, error = self.read_write.read(path)
         if success:
-            return f"File: {path}\n\n{content}"
+            result = f"File: {path}\n\n{content}"
+            if cache_key:
+                self._read_cache.set(cache_key, result)
+            return result
         else:
             return f"Error reading {path}: {error}"
 
@@ -338,17 +830,30 @@ Use ACTUAL information from the file contents above. Include real class names, f
         Returns:
             Tuple of (plan_dict, summary_message)
         """
-        # Load index
-        index = self.file_index.load_from_disk()
-        if not index:
-            index = self.file_index.build()
-            self.file_index.save_to_disk(index)
+        return asyncio.run(self.handle_plan_async(goal, conversation_history))
+
+    async def handle_plan_async(
+        self, goal: str, conversation_history: list[dict] = None
+    ) -> tuple[Any, str]:
+        """Generate an edit plan, refreshing the index and context docs concurrently.
+
+        Args:
+            goal: User's goal
+            conversation_history: Recent conversation messages for context
 
-        # Load context docs
-        context_docs = self._load_context_docs()
+        Returns:
+            Tuple of (plan_dict, summary_message)
+        """
+        # Index refresh and context-doc loading are independent file I/O
+        index, context_docs = await asyncio.gather(
+            asyncio.to_thread(self.get_index),
+            self._load_context_docs_async(),
+        )
 
         # Generate plan with conversation context
-        plan = self.planner.make_plan(goal, index, context_docs, conversation_history or [])
+        plan = await asyncio.to_thread(
+            self.planner.make_plan, goal, index, context_docs, conversation_history or []
+        )
 
         # Save plan
         if self.logger:
@@ -368,14 +873,33 @@ Use ACTUAL information from the file contents above. Include real class names, f
         Returns:
             Status message
         """
-        from pitcrew.tools.planner import Plan
-
         plan = Plan(**plan_dict)
 
         messages = []
 
+        # Group edits by path: edits to the same path run in order, disjoint paths in parallel
+        groups: dict[str, list] = {}
+        for edit in plan.edits:
+            groups.setdefault(os.path.normpath(edit.path), []).append(edit)
+
+        # The shared pool serves both per-path phases: no-op checks and edit
+        # application. A lone replace/patch that would leave the file byte-identical is
+        # skipped entirely (no snapshot copy, no write); everything else
+        # except creates is snapshotted. The checks read and hash the
+        # current files, so they run in parallel too.
+        group_list = list(groups.values())
+        noop_flags = self._io_pool.map(
+            lambda edits: len(edits) == 1 and self._is_noop_edit(edits[0]), group_list
+        )
+        unchanged = set()
+        files_to_snapshot = []
+        for edits, is_noop in zip(group_list, noop_flags):
+            if is_noop:
+                unchanged.add(id(edits[0]))
+                continue
+            files_to_snapshot.extend(edit.path for edit in edits if edit.action != "create")
+
         # Create snapshot first
-        files_to_snapshot = [edit.path for edit in plan.edits if edit.action != "create"]
         if files_to_snapshot:
             success, snapshot_id, error = self.read_write.create_snapshot(files_to_snapshot)
             if success:
@@ -383,72 +907,60 @@ Use ACTUAL information from the file contents above. Include real class names, f
             else:
                 messages.append(f"⚠ Could not create snapshot: {error}")
 
-        # Apply edits
-        for edit in plan.edits:
-            if edit.action == "create":
-                success, error = self.read_write.write(edit.path, edit.content or "")
-                if success:
-                    messages.append(f"✓ Created {edit.path}")
-                else:
-                    messages.append(f"✗ Failed to create {edit.path}: {error}")
-
-            elif edit.action == "replace":
-                success, error = self.read_write.write(edit.path, edit.content or "")
-                if success:
-                    messages.append(f"✓ Replaced {edit.path}")
-                else:
-                    messages.append(f"✗ Failed to replace {edit.path}: {error}")
-
-            elif edit.action == "patch":
-                # Check if this is actually a file creation patch (@@ -0,0 +...)
-                patch_content = edit.patch_unified or ""
-                if "@@ -0,0 +" in patch_content:
-                    # Extract content from patch
-                    lines = []
-                    for line in patch_content.split('\n'):
-                        if line.startswith('+') and not line.startswith('+++'):
-                            lines.append(line[1:])  # Remove the '+' prefix
-                    content = '\n'.join(lines)
-                    success, error = self.read_write.write(edit.path, content)
-                    if success:
-                        messages.append(f"✓ Created {edit.path} (from patch)")
-                    else:
-                        messages.append(f"✗ Failed to create {edit.path}: {error}")
-                else:
-                    # Normal patch
-                    result = self.read_write.patch(edit.path, patch_content)
-                    if result.success:
-                        messages.append(f"✓ Patched {edit.path}")
-                    else:
-                        messages.append(f"✗ Failed to patch {edit.path}: {result.error}")
-
-            elif edit.action == "implement":
-                # Use the implement handler to generate code
-                description = edit.description or edit.justification
-                result = self.handle_implement(edit.path, description)
-                messages.append(result)
-
-            elif edit.action == "delete":
-                file_path = self.project_root / edit.path
-                try:
-                    file_path.unlink()
-                    messages.append(f"✓ Deleted {edit.path}")
-                except Exception as e:
-                    messages.append(f"✗ Failed to delete {edit.path}: {e}")
+        # Apply edits. Groups with an implement edit make an LLM call, print
+        # progress and reset the caches, so they run one at a time in plan
+        # order after the plain file edits have landed in parallel.
+        group_messages: list[list[str]] = [[] for _ in group_list]
+        serial = [
+            i for i, edits in enumerate(group_list)
+            if any(edit.action == "implement" for edit in edits)
+        ]
+        parallel = [i for i in range(len(group_list)) if i not in serial]
+        parallel_messages = self._io_pool.map(
+            lambda i: self._apply_edit_group(group_list[i], unchanged), parallel
+        )
+        for i, edit_messages in zip(parallel, parallel_messages):
+            group_messages[i] = edit_messages
+        for i in serial:
+            group_messages[i] = self._apply_edit_group(group_list[i], unchanged)
+
+        for edit_messages in group_messages:
+            messages.extend(edit_messages)
+
+        self.invalidate_caches()
+        # A context doc rewritten within the same mtime tick and size would
+        # still match its cache key, so drop the ones this plan touched
+        for path in groups:
+            self._ctx_cache.pop(path, None)
 
         # Run post-checks with auto-fix loop
         if plan.post_checks:
             messages.append("\nRunning post-checks:")
+            commands = []
             for check in plan.post_checks:
                 # Fix common command issues (python -> python3 on macOS)
                 command = check.command
                 if command.startswith("python ") or command == "python":
                     command = command.replace("python", "python3", 1)
-
+                commands.append(command)
+
+            # First attempts of parallel-safe checks run concurrently; the rest
+            # run one at a time after them. Retries follow an auto-fix edit and
+            # stay sequential. Results are reported in plan order.
+            parallel = [i for i, check in enumerate(plan.post_checks) if check.parallel_safe]
+            first_results: list[Any] = [None] * len(commands)
+            parallel_results = self.executor.run_many([commands[i] for i in parallel], sandbox=True)
+            for i, result in zip(parallel, parallel_results):
+                first_results[i] = result
+
+            for command, first_result in zip(commands, first_results):
                 # Try up to 3 times to fix test failures
                 max_retries = 3
                 for attempt in range(max_retries):
-                    result = self.executor.run(command, sandbox=True)
+                    if attempt == 0 and first_result is not None:
+                        result = first_result
+                    else:
+                        result = self.executor.run(command, sandbox=True)
 
                     if result.success:
                         messages.append(f"✓ {command}")
@@ -463,7 +975,7 @@ Use ACTUAL information from the file contents above. Include real class names, f
                         # If this was the last attempt, give up
                         if attempt == max_retries - 1:
                             full_error = result.stderr or result.stdout or "No output"
-                            messages.append(f"\n  Full error output:\n{full_error[:1000]}")
+                            messages.append(f"\n  Full error output:\n{_clip(full_error, 1000)}")
                             messages.append(f"  ⚠️  Gave up after {max_retries} attempts")
                             break
 
@@ -474,6 +986,105 @@ Use ACTUAL information from the file contents above. Include real class names, f
 
         return "\n".join(messages)
 
+    def _apply_edit_group(self, edits: list, unchanged: set | frozenset = frozenset()) -> list[str]:
+        """Apply a sequence of plan edits that target the same file.
+
+        Args:
+            edits: EditAction objects for one path, in plan order
+            unchanged: ids of edits known to leave their file as-is
+
+        Returns:
+            Status messages, one per edit
+        """
+        messages = []
+        for edit in edits:
+            if id(edit) in unchanged:
+                messages.append(f"= unchanged {edit.path}")
+                continue
+            handler = self._edit_dispatch.get(edit.action)
+            if handler:
+                messages.append(handler(edit))
+        return messages
+
+    def _is_noop_edit(self, edit: Any) -> bool:
+        """Check whether a replace or patch edit would leave its file unchanged.
+
+        Args:
+            edit: EditAction to check
+
+        Returns:
+            True if the resulting content hashes equal to the current file
+        """
+        if edit.action == "replace":
+            new_content = edit.content or ""
+        elif edit.action == "patch":
+            patch_content = edit.patch_unified or ""
+            if "@@ -0,0 +" in patch_content:
+                return False  # File creation
+            success, content, _ = self.read_write.read(edit.path)
+            if not success:
+                return False
+            success, new_content, _ = apply_patch(
+                normalize_line_endings(content), normalize_line_endings(patch_content)
+            )
+            if not success:
+                return False
+        else:
+            return False
+
+        current = content_hash(self.project_root / edit.path)
+        return current is not None and current == text_hash(new_content)
+
+    def _apply_create(self, edit: Any) -> str:
+        """Create a file with the edit's content."""
+        success, error = self.read_write.write(edit.path, edit.content or "")
+        if success:
+            return f"✓ Created {edit.path}"
+        return f"✗ Failed to create {edit.path}: {error}"
+
+    def _apply_replace(self, edit: Any) -> str:
+        """Replace a file with the edit's content."""
+        success, error = self.read_write.write(edit.path, edit.content or "")
+        if success:
+            return f"✓ Replaced {edit.path}"
+        return f"✗ Failed to replace {edit.path}: {error}"
+
+    def _apply_patch(self, edit: Any) -> str:
+        """Apply the edit's unified diff."""
+        # Check if this is actually a file creation patch (@@ -0,0 +...)
+        patch_content = edit.patch_unified or ""
+        if "@@ -0,0 +" in patch_content:
+            # Extract content from patch
+            lines = []
+            for line in patch_content.split('\n'):
+                if line.startswith('+') and not line.startswith('+++'):
+                    lines.append(line[1:])  # Remove the '+' prefix
+            content = '\n'.join(lines)
+            success, error = self.read_write.write(edit.path, content)
+            if success:
+                return f"✓ Created {edit.path} (from patch)"
+            return f"✗ Failed to create {edit.path}: {error}"
+
+        # Normal patch
+        result = self.read_write.patch(edit.path, patch_content)
+        if result.success:
+            return f"✓ Patched {edit.path}"
+        return f"✗ Failed to patch {edit.path}: {result.error}"
+
+    def _apply_implement(self, edit: Any) -> str:
+        """Generate the file's code with the implement handler."""
+        description = edit.description or edit.justification
+        return self.handle_implement(edit.path, description)
+
+    def _apply_delete(self, edit: Any) -> str:
+        """Delete the edit's file."""
+        file_path = self.project_root / edit.path
+        try:
+            file_path.unlink()
+            return f"✓ Deleted {edit.path}"
+        except Exception as e:
+            return f"✗ Failed to delete {edit.path}: {e}"
+
     def _auto_fix_test_failures(self, command: str, result: Any, original_plan: Any) -> str:
         """Analyze test failures and automatically generate a fix plan.
 
@@ -516,34 +1127,19 @@ Follow the chain-of-thought process for debugging from the system instructions.
             full_response = response["content"]
 
             # Extract thinking and analysis sections
-            import re
-            thinking_match = re.search(r'<thinking>(.*?)</thinking>', full_response, re.DOTALL | re.IGNORECASE)
+            thinking_match = _THINKING_RE.search(full_response)
             thinking = thinking_match.group(1).strip() if thinking_match else None
 
-            analysis_match = re.search(r'<analysis>(.*?)</analysis>', full_response, re.DOTALL | re.IGNORECASE)
+            analysis_match = _ANALYSIS_RE.search(full_response)
             analysis = analysis_match.group(1).strip() if analysis_match else full_response
 
             # Display thinking to console
-            from rich.console import Console
-            console = Console()
-
             if thinking:
                 console.print(f"[dim]💭 Error Analysis:[/dim]")
-                # Show more thinking - up to 500 chars with line breaks
-                thinking_lines = thinking.split('\n')
-                shown_chars = 0
-                shown_lines = []
-                for line in thinking_lines:
-                    if shown_chars + len(line) > 500:
-                        shown_lines.append("...")
-                        break
-                    shown_lines.append(line)
-                    shown_chars += len(line)
-                console.print(f"[dim]{chr(10).join(shown_lines)}[/dim]")
+                console.print(f"[dim]{_preview_thinking(thinking)}[/dim]")
 
             # Extract file names from error messages
-            import re
-            file_matches = re.findall(r'File "([^"]+)"', error_output)
+            file_matches = _TRACEBACK_FILE_RE.findall(error_output)
             files_to_fix = list(set(file_matches))  # Unique files
 
             # If no files found in error, try to infer from the files we just created
@@ -562,8 +1158,6 @@ Follow the chain-of-thought process for debugging from the system instructions.
                 return f"Analysis: {analysis[:500]} | No files identified to fix"
 
             # Create fix plan
-            from pitcrew.tools.planner import Plan, EditAction
-
             fix_edits = []
             for file_path in files_to_fix[:3]:  # Limit to 3 files
                 fix_edits.append(EditAction(
@@ -582,13 +1176,13 @@ Follow the chain-of-thought process for debugging from the system instructions.
                 post_checks=[]
             )
 
-            # Apply the fix plan (without post-checks to avoid infinite loop)
-            result_messages = []
-            for edit in fix_plan.edits:
-                if edit.action == "implement":
-                    description = edit.description or edit.justification
-                    impl_result = self.handle_implement(edit.path, description)
-                    result_messages.append(impl_result)
+            # Apply the fix plan (without post-checks to avoid infinite loop),
+            # generating every file in one LLM call
+            result_messages = self.handle_implement_batch([
+                (edit.path, edit.description or edit.justification)
+                for edit in fix_plan.edits
+                if edit.action == "implement"
+            ])
 
             return " | ".join(result_messages) if result_messages else "No fixes applied"
 
@@ -605,9 +1199,6 @@ Follow the chain-of-thought process for debugging from the system instructions.
         Returns:
             Status message
         """
-        from rich.console import Console
-        console = Console()
-
         console.print(f"🔨 Implementing {file_path}...")
 
         # Read the current file content (if it exists)
@@ -643,21 +1234,18 @@ Follow the chain-of-thought process from the system instructions."""
             response_preview = full_response[:150].replace('\n', ' ')
             console.print(f"[dim]   ✓ Received response from AI: \"{response_preview}...\"[/dim]")
 
-            # Extract thinking and code sections
-            import re
-
             # Try to extract thinking section
-            thinking_match = re.search(r'<thinking>(.*?)</thinking>', full_response, re.DOTALL | re.IGNORECASE)
+            thinking_match = _THINKING_RE.search(full_response)
             thinking = thinking_match.group(1).strip() if thinking_match else None
 
             # Try to extract code section
-            code_match = re.search(r'<code>(.*?)</code>', full_response, re.DOTALL | re.IGNORECASE)
+            code_match = _CODE_RE.search(full_response)
             if code_match:
                 generated_code = code_match.group(1).strip()
             else:
                 # Fallback: try markdown code blocks
                 if "```" in full_response:
-                    match = re.search(r'```(?:\w+)?\n(.*?)\n```', full_response, re.DOTALL)
+                    match = _MARKDOWN_CODE_RE.search(full_response)
                     if match:
                         generated_code = match.group(1)
                     else:
@@ -668,21 +1256,12 @@ Follow the chain-of-thought process from the system instructions."""
             # Display thinking to user if present
             if thinking:
                 console.print(f"[dim]💭 AI Reasoning:[/dim]")
-                # Show more thinking - up to 500 chars with line breaks
-                thinking_lines = thinking.split('\n')
-                shown_chars = 0
-                shown_lines = []
-                for line in thinking_lines:
-                    if shown_chars + len(line) > 500:
-                        shown_lines.append("...")
-                        break
-                    shown_lines.append(line)
-                    shown_chars += len(line)
-                console.print(f"[dim]{chr(10).join(shown_lines)}[/dim]")
+                console.print(f"[dim]{_preview_thinking(thinking)}[/dim]")
 
             # Write the file
             console.print(f"[dim]   💾 Writing code to {file_path}...[/dim]")
             success, error = self.read_write.write(file_path, generated_code)
+            self.invalidate_caches()
             if success:
                 lines_written = len(generated_code.split('\n'))
                 return f"✓ Implemented {file_path} ({lines_written} lines)"
@@ -692,6 +1271,71 @@ Follow the chain-of-thought process from the system instructions."""
         except Exception as e:
             return f"✗ Error generating code for {file_path}: {str(e)}"
 
+    def handle_implement_batch(self, items: list[tuple[str, str]]) -> list[str]:
+        """Generate code for several files with a single LLM call.
+
+        Files missing from the reply are generated one at a time with
+        handle_implement.
+
+        Args:
+            items: (file_path, description) pairs
+
+        Returns:
+            One status message per file, in order
+        """
+        if len(items) <= 1:
+            return [self.handle_implement(path, description) for path, description in items]
+
+        console.print(f"🔨 Implementing {len(items)} files in one request...")
+
+        # The prompt needs every file's current content, so read them all at once
+        async def read_all() -> list[tuple[bool, Optional[str], Optional[str]]]:
+            return await asyncio.gather(*(self.read_write.aread(path) for path, _ in items))
+
+        sections = []
+        for n, ((file_path, description), (success, content, _)) in enumerate(
+            zip(items, asyncio.run(read_all())), 1
+        ):
+            current = content[:500] if success else "File does not exist yet"
+            sections.append(
+                f"File {n}: {file_path}\nPurpose: {description}\n\n"
+                f"Current Content (if exists):\n{current}"
+            )
+
+        prompt = "\n\n".join([
+            f"Generate complete, working code for each of these {len(items)} files.",
+            *sections,
+            'Respond with one <file path="..."></file> block per file containing '
+            "only that file's complete code.",
+        ])
+
+        try:
+            response = self.llm.complete([{"role": "user", "content": prompt}], temperature=0.3)
+            generated = {
+                match.group(1): match.group(2).strip("\n")
+                for match in _FILE_BLOCK_RE.finditer(response["content"] or "")
+            }
+        except Exception:
+            generated = {}
+
+        results = []
+        for file_path, description in items:
+            code = generated.get(file_path)
+            if code is None:
+                results.append(self.handle_implement(file_path, description))
+                continue
+
+            console.print(f"[dim]   💾 Writing code to {file_path}...[/dim]")
+            success, error = self.read_write.write(file_path, code)
+            if success:
+                lines_written = len(code.split('\n'))
+                results.append(f"✓ Implemented {file_path} ({lines_written} lines)")
+            else:
+                results.append(f"✗ Failed to write {file_path}: {error}")
+
+        self.invalidate_caches()
+        return results
+
     def handle_exec(self, command: str) -> str:
         """Handle /exec command - execute a command.
 
@@ -701,6 +1345,12 @@ Follow the chain-of-thought process from the system instructions."""
         Returns:
             Execution result summary
         """
+        cacheable = bool(_CACHEABLE_EXEC_RE.match(command))
+        if cacheable:
+            cached = self._exec_cache.get(command)
+            if cached is not None:
+                return f"{cached}\n\n(cached result, under {EXEC_CACHE_TTL}s old)"
+
         result = self.executor.run(command, sandbox=True)
 
         if self.logger:
@@ -713,12 +1363,25 @@ Follow the chain-of-thought process from the system instructions."""
         ]
 
         if result.stdout:
-            lines.append(f"\nStdout:\n{result.stdout}")
+            lines.append(f"\nStdout:\n{_clip(result.stdout)}")
 
         if result.stderr:
-            lines.append(f"\nStderr:\n{result.stderr}")
+            lines.append(f"\nStderr:\n{_clip(result.stderr)}")
+
+        output = "\n".join(lines)
+        if cacheable:
+            if result.success:
+                self._exec_cache.set(command, output)
+        else:
+            # Anything else may have changed the tree, so earlier /read and
+            # /exec results can no longer be trusted
+            self.invalidate_caches()
+        return output
 
-        return "\n".join(lines)
+    def invalidate_caches(self) -> None:
+        """Drop cached /read and /exec results after the working tree changes."""
+        self._read_cache.clear()
+        self._exec_cache.clear()
 
     def handle_test(self) -> str:
         """Handle /test command - run tests.
@@ -735,15 +1398,14 @@ Follow the chain-of-thought process from the system instructions."""
         Returns:
             Status message
         """
-        snapshots = self.read_write.list_snapshots()
+        snapshot_id = self.read_write.latest_snapshot()
 
-        if not snapshots:
+        if not snapshot_id:
             return "No snapshots available to undo"
 
-        # Restore most recent snapshot
-        snapshot_id = snapshots[0]
         success, error = self.read_write.restore_snapshot(snapshot_id)
 
+        self.invalidate_caches()
         if success:
             return f"✓ Restored snapshot: {snapshot_id}"
         else:
@@ -752,187 +1414,153 @@ Follow the chain-of-thought process from the system instructions."""
     def _load_context_docs(self) -> list[str]:
         """Load context documents (AGENTS.md).
 
+        Contents are memoized by (mtime_ns, size) and canonicalized (LF line
+        endings, single trailing newline) so repeated calls produce byte-identical
+        prompt prefixes.
+
         Returns:
             List of document contents
         """
-        docs = []
-
-        for filename in ["AGENTS.md", "AGENTS.local.md"]:
-            path = self.project_root / filename
-            if path.exists():
-                success, content, _ = self.read_write.read(filename)
-                if success:
-                    docs.append(content)
-
-        return docs
-
-    def _summarize_file(self, path: str) -> str:
-        """Generate an AI summary of a file using a standalone LLM call.
+        present, stale = self._scan_context_docs()
+        fresh = {filename: self.read_write.read(filename) for filename in stale}
+        return self._merge_context_docs(present, fresh)
 
-        Args:
-            path: File path to summarize
+    async def _load_context_docs_async(self) -> list[str]:
+        """Load context documents, reading changed ones concurrently.
 
         Returns:
-            Structured summary of the file
+            List of document contents, as for _load_context_docs
         """
-        # Read the entire file
-        success, content, error = self.read_write.read(path)
-        if not success:
-            return f"Error reading {path}: {error}"
+        present, stale = await asyncio.to_thread(self._scan_context_docs)
+        results = await asyncio.gather(*(self.read_write.aread(filename) for filename in stale))
+        return self._merge_context_docs(present, dict(zip(stale, results)))
 
-        # Determine max chars based on file type
-        # Code files: more generous limit
-        # Data/markup files: stricter limit to avoid huge generated files
-        ext = Path(path).suffix.lower()
-        code_extensions = {'.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.go', '.rs', '.c', '.cpp', '.rb', '.php'}
-
-        if ext in code_extensions:
-            max_chars = 50_000  # ~12K tokens for code files
-        else:
-            max_chars = 20_000  # ~5K tokens for markup/data files (HTML, MD, JSON, etc)
-
-        truncated = False
-        original_length = len(content)
-        if len(content) > max_chars:
-            # For code files, try to get complete functions/classes
-            # For others, just take the beginning
-            content = content[:max_chars]
-            truncated = True
-
-        # Create a standalone LLM call with NO conversation context
-        truncation_note = ""
-        if truncated:
-            truncation_note = f"\n\n[NOTE: File was truncated from {original_length:,} to {max_chars:,} characters. Only analyzing the first portion.]"
-
-        summary_prompt = f"""Analyze this file in DETAIL and provide a comprehensive technical summary.{truncation_note}
-
-File: {path}
-
-Content:
-```
-{content}
-```
+    def _scan_context_docs(self) -> tuple[dict[str, os.stat_result], list[str]]:
+        """Find which context docs exist and which must be (re)read.
 
-IMPORTANT: First, think about the file structure in a <thinking> section:
-1. What is the primary purpose of this file?
-2. What are the main components (classes, functions)?
-3. What external dependencies does it use?
-4. What patterns or approaches are used?
-5. How does it fit into the larger project?
-
-Then provide the detailed summary in a <summary> section.
-
-Format:
-<thinking>
-[Brief analysis of the file]
-</thinking>
-
-<summary>
-## Overview
-[2-3 sentences describing what this file does, its purpose, and how it fits in the project]
-
-## Imports & Dependencies
-- List ALL import statements
-- Note what each major dependency is used for
-
-## Classes
-
-### ClassName1
-**Purpose:** [What this class does]
-
-**Attributes:**
-- `attribute_name: type` - description
-- `another_attr: type` - description
+        Returns:
+            Tuple of (stat results by filename, filenames missing from the cache)
+        """
+        # One directory scan finds which docs exist, instead of a stat per candidate
+        present = {}
+        try:
+            with os.scandir(self.project_root) as entries:
+                for entry in entries:
+                    if entry.name in CONTEXT_DOC_FILES and entry.is_file():
+                        present[entry.name] = entry.stat()
+        except OSError:
+            pass
+
+        stale = []
+        for filename in CONTEXT_DOC_FILES:
+            stat = present.get(filename)
+            if stat is None:
+                self._ctx_cache.pop(filename, None)
+                continue
 
-**Methods:**
-- `__init__(self, param1: type, param2: type)` - initialization
-- `method_name(self, param: type) -> return_type` - what it does
-- `another_method(self, param1: type, param2: type) -> return_type` - what it does
+            cached = self._ctx_cache.get(filename)
+            if not cached or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+                stale.append(filename)
 
-### ClassName2
-[Same structure as above for each class]
+        return present, stale
 
-## Functions
+    def _merge_context_docs(
+        self,
+        present: dict[str, os.stat_result],
+        fresh: dict[str, tuple[bool, Optional[str], Optional[str]]],
+    ) -> list[str]:
+        """Combine cached and freshly read context docs in CONTEXT_DOC_FILES order.
 
-- `function_name(param1: type, param2: type) -> return_type`
-  - Purpose: what it does
-  - Important details or side effects
+        Args:
+            present: Stat results of the docs that exist
+            fresh: read() results for the docs that were re-read
 
-- `another_function(param: type) -> return_type`
-  - Purpose: what it does
-  - Important details or side effects
+        Returns:
+            List of document contents
+        """
+        docs = []
+        for filename in CONTEXT_DOC_FILES:
+            stat = present.get(filename)
+            if stat is None:
+                continue
 
-## Constants & Configuration
-- `CONSTANT_NAME = value` - description
-- `CONFIG_KEY = value` - description
-- Environment variables: `ENV_VAR_NAME`
+            if filename not in fresh:
+                docs.append(self._ctx_cache[filename][2])
+                continue
 
-## Important Implementation Details
-- Key algorithms or patterns used
-- Error handling approach
-- Notable business logic
-- TODOs or FIXMEs
-</summary>
+            success, content, _ = fresh[filename]
+            if success:
+                content = _canonicalize_doc(content)
+                self._ctx_cache[filename] = (stat.st_mtime_ns, stat.st_size, content)
+                docs.append(content)
 
-Be EXHAUSTIVE. List EVERY class, EVERY method with full signatures, EVERY function. This documentation will be used by AI coding assistants."""
+        return docs
 
-        max_retries = 3
-        retry_delay = 10  # seconds (increased from 5)
+    def _remember_context_doc(self, filename: str, content: str) -> None:
+        """Seed the context-doc cache with content just written to disk.
 
-        for attempt in range(max_retries):
-            try:
-                messages = [{"role": "user", "content": summary_prompt}]
-                response = self.llm.complete(messages, temperature=0.3)
-                full_response = response["content"]
+        Saves the next _load_context_docs call from reading the file back.
 
-                # Extract summary section (ignore thinking)
-                import re
-                summary_match = re.search(r'<summary>(.*?)</summary>', full_response, re.DOTALL | re.IGNORECASE)
-                if summary_match:
-                    return summary_match.group(1).strip()
-                else:
-                    # Fallback: return full response if no tags found
-                    return full_response
-            except Exception as e:
-                error_msg = str(e)
-                # Check if it's a rate limit error
-                if "rate_limit_error" in error_msg or "429" in error_msg:
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delay * (attempt + 1)  # Exponential backoff: 10s, 20s, 30s
-                        print(f"    ⚠️  Rate limit hit, waiting {wait_time}s before retry...")
-                        time.sleep(wait_time)
-                        continue
-                return f"Error summarizing {path}: {error_msg}"
+        Args:
+            filename: Context doc filename (one of CONTEXT_DOC_FILES)
+            content: Content that was written
+        """
+        try:
+            stat = (self.project_root / filename).stat()
+        except FileNotFoundError:
+            self._ctx_cache.pop(filename, None)
+            return
+        content = _canonicalize_doc(content)
+        self._ctx_cache[filename] = (stat.st_mtime_ns, stat.st_size, content)
 
     def _build_file_tree(self, index: Any) -> str:
         """Build a simple file tree representation.
 
+        The result is reused while the same snapshot is passed in; get_index
+        keeps returning one snapshot object until the tree changes.
+
         Args:
             index: File index snapshot
 
         Returns:
             File tree string
         """
-        # Group files by directory
-        tree_lines = []
-        seen_dirs = set()
-
-        for file_info in sorted(index.files, key=lambda f: f["path"])[:30]:
-            path = Path(file_info["path"])
-
-            # Add parent directories
-            for parent in path.parents:
-                if parent != Path(".") and str(parent) not in seen_dirs:
-                    seen_dirs.add(str(parent))
-                    tree_lines.append(f"{str(parent)}/")
+        cached = self._file_tree_cache
+        if cached is not None and cached[0] is index:
+            return cached[1]
+
+        tree_lines: list[str] = []
+        prev_dirs: list[str] = []
+
+        # Only the first _FILE_TREE_MAX_FILES paths are shown, so select them
+        # without a full sort. Paths come out sorted, so a directory header is
+        # needed only where a path's directories diverge from the previous
+        # path's. Lines past _FILE_TREE_MAX_LINES are never built.
+        for file_info in heapq.nsmallest(_FILE_TREE_MAX_FILES, index.files, key=itemgetter("path")):
+            path = file_info["path"]
+            dirs = path.split("/")[:-1]
+
+            common = 0
+            for prev, cur in zip(prev_dirs, dirs):
+                if prev != cur:
+                    break
+                common += 1
+            for depth in range(common + 1, len(dirs) + 1):
+                tree_lines.append("/".join(dirs[:depth]) + "/")
+            prev_dirs = dirs
 
             # Add file
             tree_lines.append(f"  {path}")
+            if len(tree_lines) >= _FILE_TREE_MAX_LINES:
+                del tree_lines[_FILE_TREE_MAX_LINES:]
+                break
+        else:
+            if len(index.files) > _FILE_TREE_MAX_FILES:
+                tree_lines.append(f"  ... and {len(index.files) - _FILE_TREE_MAX_FILES} more files")
 
-        if len(index.files) > 30:
-            tree_lines.append(f"  ... and {len(index.files) - 30} more files")
-
-        return "\n".join(tree_lines[:50])  # Limit output
+        file_tree = "\n".join(tree_lines)
+        self._file_tree_cache = (index, file_tree)
+        return file_tree
 
     def _format_plan_summary(self, plan: Any) -> str:
         """Format a plan for display.
@@ -943,20 +1571,15 @@ Be EXHAUSTIVE. List EVERY class, EVERY method with full signatures, EVERY functi
         Returns:
             Formatted summary
         """
-        lines = [
-            f"Intent: {plan.intent}",
-            "",
-            f"Edits ({len(plan.edits)}):",
-        ]
-
-        for edit in plan.edits:
-            lines.append(f"  {edit.action:8} {edit.path}")
-            lines.append(f"           {edit.justification}")
+        buf = io.StringIO()
+        buf.write(f"Intent: {plan.intent}\n\nEdits ({len(plan.edits)}):")
+        buf.writelines(
+            f"\n  {edit.action:8} {edit.path}\n           {edit.justification}"
+            for edit in plan.edits
+        )
 
         if plan.post_checks:
-            lines.append("")
-            lines.append(f"Post-checks ({len(plan.post_checks)}):")
-            for check in plan.post_checks:
-                lines.append(f"  - {check.command}")
+            buf.write(f"\n\nPost-checks ({len(plan.post_checks)}):")
+            buf.writelines(f"\n  - {check.command}" for check in plan.post_checks)
 
-        return "\n".join(lines)
+        return buf.getvalue()
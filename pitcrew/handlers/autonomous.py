@@ -58,7 +58,10 @@ class AutonomousHandler:
 
         should_apply = auto_apply
         if not auto_apply:
-            response = console.input("\n[yellow]Apply this plan? (y/N):[/yellow] ").lower()
+            try:
+                response = console.input("\n[yellow]Apply this plan? (y/N):[/yellow] ").lower()
+            except EOFError:
+                response = ""  # No terminal to confirm on; leave the plan unapplied
             should_apply = response == "y"
 
         if not should_apply:
@@ -83,7 +86,8 @@ class AutonomousHandler:
 
             # Update context with test results
             # Analyze if tests passed
-            if "failed" in test_result.lower() or "error" in test_result.lower():
+            test_result_lower = test_result.lower()
+            if "failed" in test_result_lower or "error" in test_result_lower:
                 results.append(
                     "\n⚠️  **Tests failed!** You may want to:\n"
                     "- Use `/undo` to rollback\n"
@@ -1,11 +1,27 @@
 """Query handler for answering questions about the project."""
 
+import ast
+import asyncio
 import json
-from typing import TYPE_CHECKING, Generator
+import os
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generator, Optional, TypeVar
 
 from rich.console import Console
 
 from pitcrew.llm import LLM
+from pitcrew.tools.read_write import looks_binary
+from pitcrew.utils.cache import SummaryCache
+
+try:
+    import tiktoken  # optional: pip install pitcrew[fast]
+except ImportError:
+    tiktoken = None
 
 if TYPE_CHECKING:
     from pitcrew.conversation import ConversationContext
@@ -13,6 +29,318 @@ if TYPE_CHECKING:
 
 console = Console()
 
+# Tool calls from one model turn (file summaries, reads, searches) are
+# independent, so up to this many run at once
+MAX_PARALLEL_TOOL_CALLS = 8
+
+# Summary LLM calls in flight adapt to the provider's limits (AIMD): the limit
+# grows by _AIMD_INCREASE after each success and is multiplied by
+# _AIMD_DECREASE after a rate limit or server error, between one call and
+# MAX_PARALLEL_TOOL_CALLS
+_AIMD_INCREASE = 0.5
+_AIMD_DECREASE = 0.5
+
+# Rate-limit windows reported on every Anthropic response; a window with
+# nothing remaining holds new calls back until it resets
+_RATE_LIMIT_KINDS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+# Several get_file_summary calls in one turn are packed into shared prompts of
+# about this many characters of file content
+SUMMARY_BATCH_CHARS = 20_000
+
+# Bump when the summary prompts change so cached summaries are regenerated
+SUMMARY_PROMPT_VERSION = 2
+
+_BINARY_FILE_ERROR = "Binary file, not summarized"
+
+# Source files get a larger budget when summarized
+_CODE_EXTENSIONS = frozenset({
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.go', '.rs', '.c', '.cpp', '.rb', '.php',
+})
+
+# Summary budgets in tokens (counted with tiktoken when installed), and the
+# character budgets used instead when it is not
+_SUMMARY_MAX_TOKENS_CODE = 12_000
+_SUMMARY_MAX_TOKENS_DATA = 5_000
+_SUMMARY_MAX_CHARS_CODE = 50_000
+_SUMMARY_MAX_CHARS_DATA = 20_000
+
+# Characters read per budgeted token before counting; only very sparse text
+# runs past this many characters per token
+_SUMMARY_READ_CHARS_PER_TOKEN = 6
+
+# Start of a top-level statement or definition: a line that begins in column
+# zero with anything but a closing bracket
+_TOP_LEVEL_LINE_RE = re.compile(r'\n(?=[^\s)\]}])')
+
+# Python files smaller than this are summarized from their AST, without an LLM call
+_AST_SUMMARY_MAX_CHARS = 8192
+
+# Attempts per summary call; rate limits and transient server errors are retried
+_SUMMARY_MAX_ATTEMPTS = 5
+
+# HTTP statuses worth retrying a summary call on: rate limits, transient
+# server errors and Anthropic's "overloaded"
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 529})
+_RETRYABLE_ERROR_TYPES = ("rate_limit_error", "overloaded_error")
+
+_SUMMARY_SECTION_RE = re.compile(r"^## SUMMARY (\d+)\n(.*?)(?=^## SUMMARY \d+\n|\Z)", re.M | re.S)
+
+_SUMMARY_FORMAT = """**Purpose:**
+[1-2 sentence description of what this file does and its role in the project]
+
+**Classes:**
+For each class, provide:
+- Class name and purpose
+- Key methods with signatures (name, parameters, return type)
+- Important attributes
+
+**Functions:**
+For each standalone function, provide:
+- Function signature (name, parameters, return type)
+- Brief description of what it does
+- Any notable side effects or dependencies
+
+**Dependencies:**
+- External libraries/imports
+- Internal module dependencies
+
+**Configuration/Constants:**
+- Important constants or configuration values
+- Environment variables used
+
+**Notable Patterns:**
+- Design patterns used
+- Architectural decisions
+- Error handling approach
+- Any important algorithms or logic"""
+
+# Constant instructions go in a cached system block; only the file content varies
+_SUMMARY_SYSTEM = [{
+    "type": "text",
+    "text": (
+        "You analyze code files and provide detailed structured summaries.\n\n"
+        f"Summarize each file in this format:\n\n{_SUMMARY_FORMAT}\n\n"
+        "Focus on providing actionable information that helps a developer "
+        "understand and work with the file."
+    ),
+    "cache_control": {"type": "ephemeral"},
+}]
+
+_SUMMARY_FILE_TEMPLATE = "File: {path}{truncation_note}\n\nContent:\n```\n{content}\n```"
+
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=1)
+def _token_encoder() -> Any:
+    """Load the tokenizer used for summary budgets once, on first use.
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is missing or its encoding
+        cannot be loaded (it is downloaded on first use)
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _signature(node: Any) -> str:
+    """Render a function definition's signature as inline code."""
+    prefix = "async " if isinstance(node, ast.AsyncFunctionDef) else ""
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+    return f"`{prefix}{node.name}({ast.unparse(node.args)}){returns}`"
+
+
+def _first_line(docstring: Optional[str]) -> str:
+    """First line of a docstring, or an empty string."""
+    return docstring.strip().split("\n", 1)[0] if docstring else ""
+
+
+def _ast_summary(content: str, path: str) -> Optional[str]:
+    """Summarize a small Python file from its syntax tree.
+
+    Uses the sections of the LLM summary format, but only with what the
+    source states outright: docstrings, signatures, imports and constants.
+
+    Args:
+        content: Python source
+        path: File path, for the purpose line
+
+    Returns:
+        Markdown summary, or None if the source does not parse
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+
+    imports = []
+    classes = []
+    functions = []
+    constants = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(f"- `{ast.unparse(node)}`")
+        elif isinstance(node, ast.ClassDef):
+            purpose = _first_line(ast.get_docstring(node))
+            lines = [f"- `{node.name}`" + (f" - {purpose}" if purpose else "")]
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    doc = _first_line(ast.get_docstring(item))
+                    lines.append(f"  - {_signature(item)}" + (f" - {doc}" if doc else ""))
+            classes.append("\n".join(lines))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            doc = _first_line(ast.get_docstring(node))
+            functions.append(f"- {_signature(node)}" + (f" - {doc}" if doc else ""))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id.isupper():
+                    constants.append(f"- `{target.id}`")
+
+    purpose = _first_line(ast.get_docstring(tree)) or f"Python module `{path}`."
+    sections = [f"**Purpose:**\n{purpose}"]
+    if classes:
+        sections.append("**Classes:**\n" + "\n".join(classes))
+    if functions:
+        sections.append("**Functions:**\n" + "\n".join(functions))
+    if imports:
+        sections.append("**Dependencies:**\n" + "\n".join(imports))
+    if constants:
+        sections.append("**Configuration/Constants:**\n" + "\n".join(constants))
+    return "\n\n".join(sections)
+
+
+def _truncate_code(content: str, min_chars: int) -> str:
+    """Cut a truncated source prefix back to the last top-level boundary.
+
+    Dropping the trailing partial definition keeps the summary from
+    describing a function or class that was cut off midway. Works on the
+    prefix alone, so no parser is needed for any language.
+
+    Args:
+        content: Source prefix that was cut off at the character budget
+        min_chars: Keep at least this much; a single huge definition falls
+            back to the plain cut
+
+    Returns:
+        Content up to the start of its last top-level statement
+    """
+    boundary = None
+    for boundary in _TOP_LEVEL_LINE_RE.finditer(content):
+        pass
+    if boundary is None or boundary.start() < min_chars:
+        return content
+    return content[:boundary.start() + 1]
+
+
+def _summary_key(content: str, note: str) -> str:
+    """Summary cache key for some content and its truncation note.
+
+    The note carries a truncated file's full size, so a file that grows
+    past the budget without its prefix changing still misses.
+    """
+    return f"{note}\0{content}" if note else content
+
+
+def _retry_wait(error: Exception, attempt: int) -> Optional[float]:
+    """Decide how long to wait before retrying a failed LLM call.
+
+    The backoff is jittered so parallel callers that hit the same limit do
+    not retry in lockstep, and never undercuts the server's retry-after.
+
+    Args:
+        error: Exception raised by the call
+        attempt: Zero-based attempt that failed
+
+    Returns:
+        Seconds to wait, or None if the error is not worth retrying
+    """
+    status = getattr(error, "status_code", None)
+    message = str(error)
+    if status not in _RETRYABLE_STATUSES and not any(kind in message for kind in _RETRYABLE_ERROR_TYPES):
+        return None
+
+    wait = random.uniform(2, 4) * (attempt + 1)
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return max(float(headers.get("retry-after") or 0), wait)
+    except ValueError:
+        return wait  # An HTTP date rather than seconds
+
+
+def _rate_limit_pause(headers: dict[str, str]) -> float:
+    """Decide how long to hold off new calls after a successful response.
+
+    Args:
+        headers: HTTP response headers (lower-case names)
+
+    Returns:
+        Seconds until the latest exhausted anthropic-ratelimit-* window
+        resets, or 0 if every window has capacity left
+    """
+    pause = 0.0
+    now = datetime.now(timezone.utc)
+    for kind in _RATE_LIMIT_KINDS:
+        if headers.get(f"anthropic-ratelimit-{kind}-remaining") != "0":
+            continue
+        try:
+            reset_at = datetime.fromisoformat(headers[f"anthropic-ratelimit-{kind}-reset"])
+        except (KeyError, ValueError):
+            continue
+        pause = max(pause, (reset_at - now).total_seconds())
+    return pause
+
+
+class _AdaptiveLimit:
+    """AIMD limit on the summary calls in flight within one event loop."""
+
+    def __init__(self, limit: float, maximum: int):
+        """Initialize limit.
+
+        Args:
+            limit: Starting number of concurrent calls (may be fractional)
+            maximum: Most concurrent calls, however many succeed
+        """
+        self.limit = limit
+        self.maximum = maximum
+        self._active = 0
+        self._resume_at = 0.0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot, then for any shared rate-limit pause to end."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._active < int(self.limit))
+            self._active += 1
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def release(self, ok: Optional[bool]) -> None:
+        """Free a slot and adapt the limit to how the call went.
+
+        Args:
+            ok: True after a success (additive increase), False after a rate
+                limit or server error (multiplicative decrease), None after
+                any other failure (unchanged)
+        """
+        async with self._changed:
+            self._active -= 1
+            if ok:
+                self.limit = min(float(self.maximum), self.limit + _AIMD_INCREASE)
+            elif ok is not None:
+                self.limit = max(1.0, self.limit * _AIMD_DECREASE)
+            self._changed.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller's next call for at least this long."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
 
 class QueryHandler:
     """Handles user queries about the project."""
@@ -27,6 +355,30 @@ class QueryHandler:
         self.graph = graph
         self.llm = llm
 
+        # File summaries persist across sessions, keyed by model, prompt and
+        # content; see summary_cache
+        self._summary_caches: dict[str, SummaryCache] = {}
+
+        # Concurrency the AIMD limit settled on, carried over to the next turn
+        self._summary_concurrency = float(MAX_PARALLEL_TOOL_CALLS)
+
+    @property
+    def summary_cache(self) -> SummaryCache:
+        """Summary cache for the current model.
+
+        The namespace is taken from self.llm on each lookup, so switching
+        models never serves the previous model's summaries.
+        """
+        name = self.llm.descriptor.name
+        cache = self._summary_caches.get(name)
+        if cache is None:
+            cache = SummaryCache(
+                self.graph.project_root / ".pitcrew" / "summary_cache",
+                f"{name}_v{SUMMARY_PROMPT_VERSION}",
+            )
+            self._summary_caches[name] = cache
+        return cache
+
     def _get_tools(self) -> list[dict]:
         """Get tool definitions for the LLM.
 
@@ -145,6 +497,57 @@ class QueryHandler:
         except Exception as e:
             return f"Error executing {tool_name}: {str(e)}"
 
+    def _execute_tool_calls(self, tool_calls: list[dict]) -> dict[str, str]:
+        """Execute the tool calls from one model turn concurrently.
+
+        Args:
+            tool_calls: Tool calls from an LLM response
+
+        Returns:
+            Map of tool_call_id to result string
+        """
+        jobs = []
+        for tool_call in tool_calls:
+            tool_name = tool_call["name"]
+            try:
+                arguments = json.loads(tool_call["arguments"]) if isinstance(tool_call["arguments"], str) else tool_call["arguments"]
+            except json.JSONDecodeError:
+                arguments = {}
+
+            console.print(f"[dim]🔧 Using {tool_name}...[/dim]")
+            jobs.append((tool_name, arguments))
+
+        # Several file summaries are packed into shared prompts rather than
+        # one LLM call each; every task returns the results for its slots
+        summary_slots = [
+            i for i, (tool_name, arguments) in enumerate(jobs)
+            if tool_name == "get_file_summary" and arguments.get("path")
+        ]
+        tasks: list[tuple[list[int], Callable[[], list[str]]]] = []
+        if len(summary_slots) > 1:
+            summary_paths = [jobs[i][1]["path"] for i in summary_slots]
+            tasks.append((summary_slots, lambda: self._summarize_files_batched(summary_paths)))
+        else:
+            summary_slots = []
+
+        batched = set(summary_slots)
+        for i, job in enumerate(jobs):
+            if i not in batched:
+                tasks.append(([i], lambda job=job: [self._execute_tool(*job)]))
+
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TOOL_CALLS, len(tasks))) as pool:
+                task_results = list(pool.map(lambda task: task[1](), tasks))
+        else:
+            task_results = [run() for _, run in tasks]
+
+        results: list[str] = [""] * len(jobs)
+        for (task_slots, _), task_result in zip(tasks, task_results):
+            for i, result in zip(task_slots, task_result):
+                results[i] = result
+
+        return {tool_call["id"]: result for tool_call, result in zip(tool_calls, results)}
+
     def _summarize_file(self, path: str) -> str:
         """Generate an AI summary of a file using a standalone LLM call.
 
@@ -154,66 +557,266 @@ class QueryHandler:
         Returns:
             Structured summary of the file
         """
-        # Read the entire file
-        success, content, error = self.graph.read_write.read(path)
+        success, content, note, error = self._read_for_summary(path)
         if not success:
             return f"Error reading {path}: {error}"
 
-        # Create a standalone LLM call with NO conversation context
-        summary_prompt = f"""Analyze this code file and provide a detailed structured summary.
+        return self._run_summaries(lambda limit: self._summarize_content(path, content, note, limit))
+
+    def _run_summaries(self, summarize: Callable[[_AdaptiveLimit], Awaitable[_T]]) -> _T:
+        """Run summary calls on an event loop under the AIMD limit.
 
-File: {path}
+        Args:
+            summarize: Coroutine function taking the limit to acquire per call
 
-Content:
-```
-{content}
-```
+        Returns:
+            Whatever summarize returns
+        """
+        async def run() -> _T:
+            limit = _AdaptiveLimit(self._summary_concurrency, MAX_PARALLEL_TOOL_CALLS)
+            try:
+                return await summarize(limit)
+            finally:
+                self._summary_concurrency = limit.limit
 
-Provide a comprehensive summary in this format:
+        return asyncio.run(run())
 
-**Purpose:**
-[1-2 sentence description of what this file does and its role in the project]
+    def _read_for_summary(self, path: str) -> tuple[bool, Optional[str], str, Optional[str]]:
+        """Read the part of a file that fits its summary budget.
 
-**Classes:**
-For each class, provide:
-- Class name and purpose
-- Key methods with signatures (name, parameters, return type)
-- Important attributes
+        Code gets a more generous budget than data and markup, so huge
+        generated files are never loaded whole.
 
-**Functions:**
-For each standalone function, provide:
-- Function signature (name, parameters, return type)
-- Brief description of what it does
-- Any notable side effects or dependencies
+        Args:
+            path: File path to read
 
-**Dependencies:**
-- External libraries/imports
-- Internal module dependencies
+        Returns:
+            Tuple of (success, content, truncation_note, error); the note is
+            empty unless the file was cut to fit
+        """
+        # Sniff the head first so binaries are rejected without reading them whole
+        if looks_binary(self.graph.read_write.peek(path)):
+            return False, None, "", _BINARY_FILE_ERROR
+
+        ext = os.path.splitext(path)[1].lower()
+        is_code = ext in _CODE_EXTENSIONS
+        encoder = _token_encoder()
+        if encoder is not None:
+            max_tokens = _SUMMARY_MAX_TOKENS_CODE if is_code else _SUMMARY_MAX_TOKENS_DATA
+            max_chars = max_tokens * _SUMMARY_READ_CHARS_PER_TOKEN
+        else:
+            max_chars = _SUMMARY_MAX_CHARS_CODE if is_code else _SUMMARY_MAX_CHARS_DATA
 
-**Configuration/Constants:**
-- Important constants or configuration values
-- Environment variables used
+        success, content, truncated, error = self.graph.read_write.read_prefix(path, max_chars)
+        if not success:
+            return False, None, "", error
+
+        # With a tokenizer, the budget is exact: dense JSON gets fewer
+        # characters than prose-like code
+        if encoder is not None:
+            tokens = encoder.encode(content, disallowed_special=())
+            if len(tokens) > max_tokens:
+                content = encoder.decode(tokens[:max_tokens])
+                truncated = True
+
+        if not truncated:
+            return True, content, "", None
+
+        # Code is cut on a top-level definition boundary rather than mid-function
+        if is_code:
+            content = _truncate_code(content, len(content) // 2)
+        try:
+            original_length = (self.graph.project_root / path).stat().st_size
+        except OSError:
+            original_length = len(content)
+        note = (
+            f"[NOTE: File was truncated from {original_length:,} bytes to {len(content):,} "
+            "characters. Only analyzing the first portion.]"
+        )
+        return True, content, note, None
+
+    def _known_summary(self, path: str, content: str, note: str) -> Optional[str]:
+        """Summary available without an LLM call: from the AST or the cache.
 
-**Notable Patterns:**
-- Design patterns used
-- Architectural decisions
-- Error handling approach
-- Any important algorithms or logic
+        Args:
+            path: File path
+            content: Content from _read_for_summary
+            note: Truncation note from _read_for_summary
+
+        Returns:
+            Summary, or None if the LLM has to write one
+        """
+        # A small Python file says all a summary would in its syntax tree
+        if path.endswith(".py") and not note and len(content) < _AST_SUMMARY_MAX_CHARS:
+            summary = _ast_summary(content, path)
+            if summary is not None:
+                return summary
+        return self.summary_cache.get(_summary_key(content, note))
+
+    async def _complete_with_retry(self, messages: list[dict], limit: _AdaptiveLimit) -> str:
+        """Run a summary LLM call under the limit, retrying rate limits and overloads.
+
+        Args:
+            messages: Summary request messages
+            limit: AIMD limit shared by this run's summary calls
+
+        Returns:
+            Reply text
+
+        Raises:
+            Exception: The last error, once it is not worth retrying
+        """
+        for attempt in range(_SUMMARY_MAX_ATTEMPTS):
+            await limit.acquire()
+            try:
+                # No max_tokens limit - let it generate as much as needed
+                response = await self.llm.acomplete(messages, temperature=0.3)
+            except Exception as e:
+                wait_time = _retry_wait(e, attempt)
+                await limit.release(ok=False if wait_time is not None else None)
+                if wait_time is None or attempt == _SUMMARY_MAX_ATTEMPTS - 1:
+                    raise
+                # The server's limit applies to every caller, not just this one
+                console.print(f"[dim]    ⚠️  Rate limited or overloaded, waiting {wait_time:.1f}s before retry...[/dim]")
+                limit.pause(wait_time)
+                continue
+            await limit.release(ok=True)
+            limit.pause(_rate_limit_pause(response.get("headers") or {}))
+            return response["content"] or ""
+
+    async def _summarize_content(self, path: str, content: str, note: str, limit: _AdaptiveLimit) -> str:
+        """Summarize one file's content with a standalone LLM call.
 
-Focus on providing actionable information that helps a developer understand and work with this file."""
+        Args:
+            path: File path, for the prompt
+            content: Content from _read_for_summary
+            note: Truncation note from _read_for_summary
+            limit: AIMD limit shared by this run's summary calls
+
+        Returns:
+            Structured summary of the file
+        """
+        known = self._known_summary(path, content, note)
+        if known is not None:
+            return known
 
         try:
             # Standalone LLM call - no tools, no conversation history
             messages = [
-                {"role": "user", "content": summary_prompt}
+                {"role": "system", "content": _SUMMARY_SYSTEM},
+                {"role": "user", "content": _SUMMARY_FILE_TEMPLATE.format(
+                    path=path, truncation_note=f"\n\n{note}" if note else "", content=content
+                )},
             ]
-            # No max_tokens limit - let it generate as much as needed
-            response = self.llm.complete(messages, temperature=0.3)
-            return response["content"]
+            summary = await self._complete_with_retry(messages, limit)
+            self.summary_cache.set(_summary_key(content, note), summary)
+            return summary
         except Exception as e:
             # Fallback to basic file info
             return f"File: {path}\nSize: {len(content)} chars\n[Summary generation failed: {e}]"
 
+    def _summarize_files_batched(self, paths: list[str]) -> list[str]:
+        """Summarize several files, packing small ones into shared LLM calls.
+
+        Known summaries are reused; the remaining files are packed greedily
+        until their combined content nears SUMMARY_BATCH_CHARS and batches
+        run concurrently under the AIMD limit. A batch whose reply
+        is missing a section falls back to one call per missing file.
+
+        Args:
+            paths: File paths to summarize
+
+        Returns:
+            Summaries in the same order as paths
+        """
+        results: list[str] = [""] * len(paths)
+        batches: list[list[tuple[int, str, str, str]]] = []
+        current: list[tuple[int, str, str, str]] = []
+        current_chars = 0
+
+        for i, path in enumerate(paths):
+            success, content, note, error = self._read_for_summary(path)
+            if not success:
+                results[i] = f"Error reading {path}: {error}"
+                continue
+            known = self._known_summary(path, content, note)
+            if known is not None:
+                results[i] = known
+                continue
+            if current and current_chars + len(content) > SUMMARY_BATCH_CHARS:
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append((i, path, content, note))
+            current_chars += len(content)
+        if current:
+            batches.append(current)
+        if not batches:
+            return results
+
+        async def run_batch(batch: list[tuple[int, str, str, str]], limit: _AdaptiveLimit) -> None:
+            if len(batch) == 1:
+                i, path, content, note = batch[0]
+                results[i] = await self._summarize_content(path, content, note, limit)
+                return
+
+            sections = await self._summarize_batch(batch, limit)
+            missing = []
+            for n, (i, path, content, note) in enumerate(batch, 1):
+                summary = sections.get(n)
+                if summary:
+                    self.summary_cache.set(_summary_key(content, note), summary)
+                    results[i] = summary
+                else:
+                    missing.append((i, path, content, note))
+            summaries = await asyncio.gather(*(
+                self._summarize_content(path, content, note, limit) for _, path, content, note in missing
+            ))
+            for (i, _, _, _), summary in zip(missing, summaries):
+                results[i] = summary
+
+        async def run_batches(limit: _AdaptiveLimit) -> None:
+            await asyncio.gather(*(run_batch(batch, limit) for batch in batches))
+
+        self._run_summaries(run_batches)
+        return results
+
+    async def _summarize_batch(self, batch: list[tuple[int, str, str, str]], limit: _AdaptiveLimit) -> dict[int, str]:
+        """Summarize several files in one LLM call.
+
+        Args:
+            batch: (result index, path, content, truncation note) tuples
+            limit: AIMD limit shared by this run's summary calls
+
+        Returns:
+            Summaries keyed by 1-based position in the batch (empty on failure)
+        """
+        blocks = []
+        for n, (_, path, content, note) in enumerate(batch, 1):
+            header = f"=== FILE {n}: {path} ===" + (f"\n{note}" if note else "")
+            blocks.append(f"{header}\n{content}\n=== END FILE {n} ===")
+
+        summary_prompt = "\n\n".join([
+            f"Summarize each of these {len(batch)} files.",
+            *blocks,
+            f"Reply with exactly {len(batch)} sections, one per file and in the same order. "
+            "Start each section with a line `## SUMMARY <n>` where <n> is the file number, "
+            "followed by that file's summary.",
+        ])
+
+        try:
+            messages = [
+                {"role": "system", "content": _SUMMARY_SYSTEM},
+                {"role": "user", "content": summary_prompt},
+            ]
+            reply = await self._complete_with_retry(messages, limit)
+        except Exception:
+            return {}
+
+        return {
+            int(match.group(1)): match.group(2).strip()
+            for match in _SUMMARY_SECTION_RE.finditer(reply)
+        }
+
     def _add_tool_results_to_messages(
         self,
         messages: list[dict],
@@ -308,19 +911,7 @@ Focus on providing actionable information that helps a developer understand and
                 # Check if there are tool calls
                 if "tool_calls" in response and response["tool_calls"]:
                     # Execute all tool calls and collect results
-                    tool_results = {}
-                    for tool_call in response["tool_calls"]:
-                        tool_name = tool_call["name"]
-                        try:
-                            arguments = json.loads(tool_call["arguments"]) if isinstance(tool_call["arguments"], str) else tool_call["arguments"]
-                        except json.JSONDecodeError:
-                            arguments = {}
-
-                        console.print(f"[dim]🔧 Using {tool_name}...[/dim]")
-
-                        # Execute the tool
-                        result = self._execute_tool(tool_name, arguments)
-                        tool_results[tool_call["id"]] = result
+                    tool_results = self._execute_tool_calls(response["tool_calls"])
 
                     # Add tool calls and results to messages
                     self._add_tool_results_to_messages(messages, response, tool_results)
@@ -361,19 +952,7 @@ Focus on providing actionable information that helps a developer understand and
                 # Check if there are tool calls
                 if "tool_calls" in response and response["tool_calls"]:
                     # Execute all tool calls and collect results
-                    tool_results = {}
-                    for tool_call in response["tool_calls"]:
-                        tool_name = tool_call["name"]
-                        try:
-                            arguments = json.loads(tool_call["arguments"]) if isinstance(tool_call["arguments"], str) else tool_call["arguments"]
-                        except json.JSONDecodeError:
-                            arguments = {}
-
-                        console.print(f"[dim]🔧 Using {tool_name}...[/dim]")
-
-                        # Execute the tool
-                        result = self._execute_tool(tool_name, arguments)
-                        tool_results[tool_call["id"]] = result
+                    tool_results = self._execute_tool_calls(response["tool_calls"])
 
                     # Add tool calls and results to messages
                     self._add_tool_results_to_messages(messages, response, tool_results)
@@ -437,19 +1016,18 @@ Focus on providing actionable information that helps a developer understand and
         # Build prompt for LLM
         system_prompt = self._build_system_prompt("\n\n".join(info_parts))
 
-        # Get conversation messages
-        messages = context.to_messages()
+        # Get conversation messages (read-only view; the stored system message
+        # is replaced rather than mutated)
+        history = context.to_messages()
+        if history and history[0]["role"] == "system":
+            history = history[1:]
+
+        messages = [{"role": "system", "content": system_prompt}, *history]
 
         # Add current query if not already in messages
-        if not messages or messages[-1]["content"] != query:
+        if len(messages) == 1 or messages[-1]["content"] != query:
             messages.append({"role": "user", "content": query})
 
-        # Update system prompt if needed
-        if messages and messages[0]["role"] == "system":
-            messages[0]["content"] = system_prompt
-        else:
-            messages.insert(0, {"role": "system", "content": system_prompt})
-
         return messages
 
     def _build_system_prompt(self, project_info: str) -> str:
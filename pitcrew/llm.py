@@ -1,9 +1,12 @@
 """LLM abstraction layer for Anthropic Claude models."""
 
+import asyncio
+import threading
+import weakref
 from dataclasses import dataclass
 from typing import Any, Generator, Literal, Optional
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 
 from pitcrew.constants import SUPPORTED_MODELS
 
@@ -36,6 +39,11 @@ class LLM:
 
         self.client = Anthropic(api_key=api_key)
 
+        # An async client's connection pool belongs to the event loop that
+        # opened it, so acomplete keeps one client per loop
+        self._async_clients: weakref.WeakKeyDictionary[Any, AsyncAnthropic] = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+
     def complete(
         self,
         messages: list[dict[str, Any]],
@@ -59,6 +67,41 @@ class LLM:
 
         return self._complete_anthropic(messages, tools, temp, max_tok)
 
+    async def acomplete(
+        self,
+        messages: list[dict[str, Any]],
+        tools: Optional[list[dict]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Generate a completion without blocking the event loop.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            tools: Optional list of tool definitions
+            temperature: Optional temperature override
+            max_tokens: Optional max tokens override
+
+        Returns:
+            Response dict as from complete(), plus 'headers' with the HTTP
+            response headers (including the anthropic-ratelimit-* state)
+        """
+        temp = temperature if temperature is not None else self.descriptor.temperature
+        max_tok = max_tokens if max_tokens is not None else self.descriptor.max_output_tokens
+
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = AsyncAnthropic(api_key=self.api_key)
+                self._async_clients[loop] = client
+
+        kwargs = self._anthropic_request(messages, tools, temp, max_tok)
+        raw = await client.messages.with_raw_response.create(**kwargs)
+        result = self._parse_anthropic_message(await raw.parse())
+        result["headers"] = dict(raw.headers)
+        return result
+
     def stream(
         self,
         messages: list[dict[str, Any]],
@@ -82,6 +125,57 @@ class LLM:
 
         yield from self._stream_anthropic(messages, tools, temp, max_tok)
 
+    def submit_batch(
+        self,
+        requests: list[list[dict[str, Any]]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Submit completions through the Message Batches API.
+
+        Batched requests are billed at half price but may take up to 24 hours;
+        collect them with poll_batch.
+
+        Args:
+            requests: One message list per completion
+            temperature: Optional temperature override
+            max_tokens: Optional max tokens override
+
+        Returns:
+            Batch ID
+        """
+        temp = temperature if temperature is not None else self.descriptor.temperature
+        max_tok = max_tokens if max_tokens is not None else self.descriptor.max_output_tokens
+
+        batch = self.client.messages.batches.create(requests=[
+            {"custom_id": str(i), "params": self._anthropic_request(messages, None, temp, max_tok)}
+            for i, messages in enumerate(requests)
+        ])
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> Optional[list[Optional[dict[str, Any]]]]:
+        """Collect the results of a batch submitted with submit_batch.
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            Response dicts in submission order (None for requests that failed),
+            or None if the batch is still processing
+        """
+        batch = self.client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results: dict[int, Optional[dict[str, Any]]] = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                results[int(entry.custom_id)] = self._parse_anthropic_message(entry.result.message)
+            else:
+                results[int(entry.custom_id)] = None
+
+        return [results.get(i) for i in range(max(results, default=-1) + 1)]
+
     def _complete_anthropic(
         self,
         messages: list[dict[str, Any]],
@@ -90,6 +184,18 @@ class LLM:
         max_tokens: int,
     ) -> dict[str, Any]:
         """Complete using Anthropic API with prompt caching support."""
+        kwargs = self._anthropic_request(messages, tools, temperature, max_tokens)
+        response = self.client.messages.create(**kwargs)
+        return self._parse_anthropic_message(response)
+
+    def _anthropic_request(
+        self,
+        messages: list[dict[str, Any]],
+        tools: Optional[list[dict]],
+        temperature: float,
+        max_tokens: int,
+    ) -> dict[str, Any]:
+        """Build Anthropic Messages API parameters from OpenAI-style messages."""
         # Extract system messages - can be string or structured blocks with cache_control
         system_messages = [m for m in messages if m["role"] == "system"]
         system = None
@@ -181,18 +287,16 @@ class LLM:
             # Convert OpenAI tool format to Anthropic format
             kwargs["tools"] = self._convert_tools_to_anthropic(tools)
 
-        response = self.client.messages.create(**kwargs)
-
-        result: dict[str, Any] = {
-            "role": "assistant",
-            "content": "",
-        }
+        return kwargs
 
+    def _parse_anthropic_message(self, response: Any) -> dict[str, Any]:
+        """Convert an Anthropic message into a response dict."""
         # Extract content and tool calls
+        text_parts = []
         tool_calls = []
         for block in response.content:
             if block.type == "text":
-                result["content"] += block.text
+                text_parts.append(block.text)
             elif block.type == "tool_use":
                 tool_calls.append({
                     "id": block.id,
@@ -200,6 +304,11 @@ class LLM:
                     "arguments": block.input,
                 })
 
+        result: dict[str, Any] = {
+            "role": "assistant",
+            "content": "".join(text_parts),
+        }
+
         if tool_calls:
             result["tool_calls"] = tool_calls
 
@@ -259,26 +368,7 @@ class LLM:
         max_tokens: int,
     ) -> Generator[str, None, None]:
         """Stream using Anthropic API."""
-        # Anthropic requires system messages to be separate
-        system_messages = [m["content"] for m in messages if m["role"] == "system"]
-        system = "\n\n".join(system_messages) if system_messages else None
-
-        # Filter out system messages from main messages
-        chat_messages = [m for m in messages if m["role"] != "system"]
-
-        kwargs: dict[str, Any] = {
-            "model": self.descriptor.name,
-            "messages": chat_messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        if system:
-            kwargs["system"] = system
-
-        if tools:
-            # Convert OpenAI tool format to Anthropic format
-            kwargs["tools"] = self._convert_tools_to_anthropic(tools)
+        kwargs = self._anthropic_request(messages, tools, temperature, max_tokens)
 
         with self.client.messages.stream(**kwargs) as stream:
             for text in stream.text_stream:
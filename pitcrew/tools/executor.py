@@ -1,5 +1,7 @@
 """Command execution with safety checks and sandboxing."""
 
+import asyncio
+import os
 import resource
 import subprocess
 import time
@@ -7,7 +9,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from pitcrew.constants import DANGEROUS_PATTERNS
+from pitcrew.constants import check_dangerous
+
+# Checks such as test suites often fan out themselves, so run_many keeps at
+# most this many commands in flight by default
+MAX_PARALLEL_COMMANDS = 8
 
 
 @dataclass
@@ -131,6 +137,111 @@ class Executor:
                 command=command,
             )
 
+    async def run_async(
+        self,
+        command: str,
+        timeout: Optional[int] = None,
+        sandbox: bool = True,
+    ) -> ExecResult:
+        """Run a command without blocking the event loop.
+
+        Same safety checks and result shape as ``run``.
+
+        Args:
+            command: Command to execute
+            timeout: Optional timeout override
+            sandbox: Whether to apply sandboxing
+
+        Returns:
+            ExecResult with execution details
+        """
+        is_dangerous, reason = self.is_dangerous(command)
+        if is_dangerous and sandbox:
+            return ExecResult(
+                success=False,
+                stdout="",
+                stderr=f"Command blocked: {reason}",
+                exit_code=-1,
+                duration_ms=0,
+                command=command,
+            )
+
+        timeout_val = timeout if timeout is not None else self.timeout
+        start_time = time.time()
+
+        try:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                cwd=str(self.project_root),
+                env=self._prepare_env(),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                preexec_fn=self._setup_sandbox if sandbox else None,
+            )
+        except Exception as e:
+            return ExecResult(
+                success=False,
+                stdout="",
+                stderr=f"Execution error: {str(e)}",
+                exit_code=-1,
+                duration_ms=int((time.time() - start_time) * 1000),
+                command=command,
+            )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout_val)
+        except asyncio.TimeoutError:
+            process.kill()
+            stdout, stderr = await process.communicate()
+            return ExecResult(
+                success=False,
+                stdout=stdout.decode(errors="replace"),
+                stderr=stderr.decode(errors="replace") or f"Command timed out after {timeout_val}s",
+                exit_code=-1,
+                duration_ms=int((time.time() - start_time) * 1000),
+                command=command,
+            )
+
+        return ExecResult(
+            success=process.returncode == 0,
+            stdout=stdout.decode(errors="replace"),
+            stderr=stderr.decode(errors="replace"),
+            exit_code=process.returncode,
+            duration_ms=int((time.time() - start_time) * 1000),
+            command=command,
+        )
+
+    def run_many(
+        self,
+        commands: list[str],
+        sandbox: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> list[ExecResult]:
+        """Run independent commands concurrently.
+
+        Args:
+            commands: Commands to execute
+            sandbox: Whether to apply sandboxing
+            max_concurrency: Most commands running at once (default:
+                MAX_PARALLEL_COMMANDS or the CPU count, whichever is lower)
+
+        Returns:
+            ExecResults in the same order as commands
+        """
+        if max_concurrency is None:
+            max_concurrency = min(MAX_PARALLEL_COMMANDS, os.cpu_count() or 1)
+
+        async def run_all() -> list[ExecResult]:
+            limit = asyncio.Semaphore(max_concurrency)
+
+            async def run_one(command: str) -> ExecResult:
+                async with limit:
+                    return await self.run_async(command, sandbox=sandbox)
+
+            return list(await asyncio.gather(*(run_one(c) for c in commands)))
+
+        return asyncio.run(run_all())
+
     def is_dangerous(self, command: str) -> tuple[bool, str]:
         """Check if a command matches dangerous patterns.
 
@@ -140,9 +251,9 @@ class Executor:
         Returns:
             Tuple of (is_dangerous, reason)
         """
-        for pattern, reason in DANGEROUS_PATTERNS:
-            if pattern.search(command):
-                return True, reason
+        reason = check_dangerous(command)
+        if reason is not None:
+            return True, reason
 
         return False, ""
 
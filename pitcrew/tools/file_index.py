@@ -2,12 +2,61 @@
 
 import hashlib
 import json
+import mmap
+import os
+import struct
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-from pitcrew.constants import LANGUAGE_MAP
+from pitcrew.constants import BUILTIN_IGNORES, LANGUAGE_MAP
 from pitcrew.utils.ignore import IgnoreRules
 
+# On-disk index layout (.pitcrew/index.bin):
+#   header | fixed-size records | string table (UTF-8) | summary (JSON)
+# The header carries the git HEAD sha the index was built against, so a stale
+# index is detected with a single 20-byte compare before any record is parsed,
+# plus a digest of the indexing settings (ignore rules, size limit) so records
+# built under different rules are never reused.
+INDEX_MAGIC = b"PCIX"
+INDEX_VERSION = 2
+_HEADER = struct.Struct("<4sI20s20sIII")  # magic, version, guard, config, count, strtab_len, summary_len
+_RECORD = struct.Struct("<IIQd16s?II")  # path_off, path_len, size, mtime, md5, has_hash, lang_off, lang_len
+_NO_GUARD = b"\0" * 20
+
+# Thread count for stat/read/hash during build (same default as ThreadPoolExecutor)
+_INDEX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def read_head_guard(project_root: Path) -> bytes:
+    """Read the current git HEAD commit sha as 20 raw bytes.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        HEAD sha bytes, or 20 zero bytes if the project is not a git checkout
+    """
+    git_dir = project_root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = head[5:]
+            ref_path = git_dir / ref
+            if ref_path.exists():
+                head = ref_path.read_text().strip()
+            else:
+                # Ref may only exist in packed-refs
+                head = ""
+                for line in (git_dir / "packed-refs").read_text().splitlines():
+                    if line.endswith(" " + ref):
+                        head = line.split(" ", 1)[0]
+                        break
+        return bytes.fromhex(head) if len(head) == 40 else _NO_GUARD
+    except (OSError, ValueError):
+        return _NO_GUARD
+
 
 class FileIndexSnapshot:
     """Snapshot of project file index."""
@@ -22,6 +71,16 @@ class FileIndexSnapshot:
         self.files = files
         self.summary = summary
 
+    @cached_property
+    def exts(self) -> list[str]:
+        """Lowercased extension of each file, parallel to ``files``."""
+        return [os.path.splitext(f["path"])[1].lower() for f in self.files]
+
+    @cached_property
+    def sizes(self) -> list[int]:
+        """Size in bytes of each file, parallel to ``files``."""
+        return [f.get("size", 0) for f in self.files]
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -43,6 +102,7 @@ class FileIndex:
         project_root: Path,
         ignore_rules: IgnoreRules,
         max_file_size_mb: int = 100,
+        executor: Optional[Executor] = None,
     ):
         """Initialize file indexer.
 
@@ -50,67 +110,62 @@ class FileIndex:
             project_root: Root directory to index
             ignore_rules: Ignore rules to apply
             max_file_size_mb: Maximum file size to index (in MB)
+            executor: Shared pool for per-file work; a temporary pool of
+                _INDEX_WORKERS threads is used per build if omitted
         """
         self.project_root = project_root
         self.ignore_rules = ignore_rules
         self.max_file_size = max_file_size_mb * 1024 * 1024
+        self.executor = executor
+        self._config_digest = self._compute_config_digest()
 
-    def build(self) -> FileIndexSnapshot:
-        """Build file index by walking the project tree.
+    def _compute_config_digest(self) -> bytes:
+        """Hash the settings that determine which files are indexed.
 
         Returns:
-            FileIndexSnapshot with all indexed files
+            20-byte digest of index version, size limit and ignore patterns
         """
-        files = []
-        total_size = 0
-        language_counts: dict[str, int] = {}
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{INDEX_VERSION}\0{self.max_file_size}\0".encode("utf-8"))
+        for pattern in BUILTIN_IGNORES:
+            digest.update(pattern.encode("utf-8") + b"\0")
+        digest.update(b"\0")
+        for pattern in self.ignore_rules.spec.patterns:
+            digest.update(str(pattern.pattern).encode("utf-8") + b"\0")
+        return digest.digest()
+
+    def build(self, previous: Optional[FileIndexSnapshot] = None) -> FileIndexSnapshot:
+        """Build file index by walking the project tree.
 
-        for path in self.project_root.rglob("*"):
-            # Skip directories
-            if path.is_dir():
-                continue
+        The walk itself is sequential and never descends into ignored
+        directories; the per-file stat/read/hash work is I/O-bound and runs
+        on the shared executor (or a temporary thread pool).
 
-            # Skip ignored files
-            if self.ignore_rules.should_ignore(path):
-                continue
+        Args:
+            previous: Earlier snapshot whose records are reused for files whose
+                size and mtime are unchanged (skips re-hashing them)
 
-            # Skip files that are too large
-            try:
-                size = path.stat().st_size
-                if size > self.max_file_size:
-                    continue
-            except OSError:
-                continue  # Skip files we can't stat
-
-            # Determine language
-            language = self._detect_language(path)
-
-            # Calculate hash for text files (skip binary)
-            file_hash = None
-            if self._is_likely_text(path):
-                try:
-                    with open(path, "rb") as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                except (IOError, OSError):
-                    pass
-
-            # Get relative path
-            try:
-                rel_path = path.relative_to(self.project_root)
-            except ValueError:
-                continue
+        Returns:
+            FileIndexSnapshot with all indexed files
+        """
+        candidates = list(self._walk())
+        known = {f["path"]: f for f in previous.files} if previous else {}
 
-            # Add to index
-            files.append({
-                "path": str(rel_path),
-                "size": size,
-                "mtime": path.stat().st_mtime,
-                "hash": file_hash,
-                "language": language,
-            })
+        def index_file(path: Path) -> Optional[dict]:
+            return self._index_file(path, known)
 
-            total_size += size
+        if self.executor is not None:
+            entries = self.executor.map(index_file, candidates)
+            files = [entry for entry in entries if entry is not None]
+        else:
+            with ThreadPoolExecutor(max_workers=_INDEX_WORKERS) as pool:
+                files = [entry for entry in pool.map(index_file, candidates) if entry is not None]
 
+        total_size = 0
+        language_counts: dict[str, int] = {}
+        for entry in files:
+            total_size += entry["size"]
+            language = entry["language"]
             if language:
                 language_counts[language] = language_counts.get(language, 0) + 1
 
@@ -122,6 +177,72 @@ class FileIndex:
 
         return FileIndexSnapshot(files=files, summary=summary)
 
+    def _walk(self) -> Iterator[Path]:
+        """Yield the project's non-ignored files, pruning ignored directories.
+
+        Yields:
+            Absolute file paths
+        """
+        root = str(self.project_root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            prefix = "" if rel_dir == "." else f"{rel_dir}/"
+
+            # Prune in place so os.walk skips ignored subtrees entirely
+            dirnames[:] = [
+                d for d in dirnames if not self.ignore_rules.should_ignore_dir(prefix + d)
+            ]
+            for name in filenames:
+                path = Path(dirpath, name)
+                if not self.ignore_rules.should_ignore(path):
+                    yield path
+
+    def _index_file(self, path: Path, known: Optional[dict[str, dict]] = None) -> Optional[dict]:
+        """Stat and hash a single file for the index.
+
+        Args:
+            path: Absolute file path
+            known: Previous entries by relative path, reused when size and mtime match
+
+        Returns:
+            Index entry, or None if the file should be skipped
+        """
+        # Skip files that are too large
+        try:
+            stat = path.stat()
+        except OSError:
+            return None  # Skip files we can't stat
+        if stat.st_size > self.max_file_size:
+            return None
+
+        # Get relative path
+        try:
+            rel_path = path.relative_to(self.project_root)
+        except ValueError:
+            return None
+
+        if known:
+            entry = known.get(str(rel_path))
+            if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                return entry
+
+        # Calculate hash for text files (skip binary)
+        file_hash = None
+        if self._is_likely_text(path):
+            try:
+                with open(path, "rb") as f:
+                    file_hash = hashlib.md5(f.read()).hexdigest()
+            except (IOError, OSError):
+                pass
+
+        return {
+            "path": str(rel_path),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": file_hash,
+            "language": self._detect_language(path),
+        }
+
     def _detect_language(self, path: Path) -> Optional[str]:
         """Detect programming language from file extension.
 
@@ -168,33 +289,129 @@ class FileIndex:
             return False
 
     def save_to_disk(self, snapshot: FileIndexSnapshot) -> None:
-        """Save index snapshot to .pitcrew/index.json.
+        """Save index snapshot to .pitcrew/index.bin.
 
         Args:
             snapshot: Snapshot to save
         """
-        index_path = self.project_root / ".pitcrew" / "index.json"
+        index_path = self.project_root / ".pitcrew" / "index.bin"
         index_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(index_path, "w") as f:
-            json.dump(snapshot.to_dict(), f, indent=2)
+        strtab = bytearray()
+        string_offsets: dict[str, tuple[int, int]] = {}
+
+        def intern(value: str) -> tuple[int, int]:
+            if value not in string_offsets:
+                encoded = value.encode("utf-8")
+                string_offsets[value] = (len(strtab), len(encoded))
+                strtab.extend(encoded)
+            return string_offsets[value]
+
+        records = bytearray()
+        for f in snapshot.files:
+            path_off, path_len = intern(f["path"])
+            lang_off, lang_len = intern(f["language"] or "")
+            file_hash = f.get("hash")
+            records += _RECORD.pack(
+                path_off,
+                path_len,
+                f["size"],
+                f["mtime"],
+                bytes.fromhex(file_hash) if file_hash else b"",
+                file_hash is not None,
+                lang_off,
+                lang_len,
+            )
+
+        summary = json.dumps(snapshot.summary).encode("utf-8")
+        header = _HEADER.pack(
+            INDEX_MAGIC,
+            INDEX_VERSION,
+            read_head_guard(self.project_root),
+            self._config_digest,
+            len(snapshot.files),
+            len(strtab),
+            len(summary),
+        )
+
+        # Write atomically so a concurrent reader never maps a partial file
+        temp_path = index_path.with_suffix(".bin.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(header)
+            f.write(records)
+            f.write(strtab)
+            f.write(summary)
+        temp_path.replace(index_path)
+
+    def load_or_refresh(self) -> FileIndexSnapshot:
+        """Load the saved index and bring it up to date with the working tree.
+
+        Walks the tree and stats every file, but only re-hashes files whose size
+        or mtime changed since the saved index. The index is rewritten only when
+        something changed.
+
+        Returns:
+            Current FileIndexSnapshot
+        """
+        previous = self._read_index(check_head=False)
+        snapshot = self.build(previous)
+        if previous is None or snapshot.files != previous.files:
+            self.save_to_disk(snapshot)
+        return snapshot
 
     def load_from_disk(self) -> Optional[FileIndexSnapshot]:
-        """Load index snapshot from .pitcrew/index.json.
+        """Load index snapshot from .pitcrew/index.bin.
 
         Returns:
-            FileIndexSnapshot if exists, None otherwise
+            FileIndexSnapshot if it exists and matches the current git HEAD, None otherwise
         """
-        index_path = self.project_root / ".pitcrew" / "index.json"
+        return self._read_index(check_head=True)
 
-        if not index_path.exists():
-            return None
+    def _read_index(self, check_head: bool) -> Optional[FileIndexSnapshot]:
+        """Read .pitcrew/index.bin if it was built with the current settings.
+
+        Args:
+            check_head: Also require the index to match the current git HEAD
+
+        Returns:
+            FileIndexSnapshot, or None if missing, corrupt or stale
+        """
+        index_path = self.project_root / ".pitcrew" / "index.bin"
 
         try:
-            with open(index_path) as f:
-                data = json.load(f)
-                return FileIndexSnapshot.from_dict(data)
-        except (json.JSONDecodeError, IOError, KeyError):
+            with open(index_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, guard, config, count, strtab_len, summary_len = (
+                    _HEADER.unpack_from(mm, 0)
+                )
+                if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                    return None
+                if config != self._config_digest:
+                    return None  # Built with different ignore rules or size limit
+                if check_head and guard != read_head_guard(self.project_root):
+                    return None  # Index predates the current commit
+
+                records_start = _HEADER.size
+                strtab_start = records_start + count * _RECORD.size
+                summary_start = strtab_start + strtab_len
+                if summary_start + summary_len != len(mm):
+                    return None
+
+                strtab = mm[strtab_start:summary_start]
+                files = []
+                for (path_off, path_len, size, mtime, md5, has_hash, lang_off, lang_len) in (
+                    _RECORD.iter_unpack(mm[records_start:strtab_start])
+                ):
+                    files.append({
+                        "path": strtab[path_off:path_off + path_len].decode("utf-8"),
+                        "size": size,
+                        "mtime": mtime,
+                        "hash": md5.hex() if has_hash else None,
+                        "language": strtab[lang_off:lang_off + lang_len].decode("utf-8") or None,
+                    })
+
+                summary = json.loads(mm[summary_start:])
+                return FileIndexSnapshot(files=files, summary=summary)
+        except (OSError, ValueError, struct.error, UnicodeDecodeError):
             return None
 
     def summarize(self, snapshot: FileIndexSnapshot) -> str:
@@ -1,15 +1,36 @@
 """Planning tool for generating multi-file edit plans."""
 
+import heapq
 import json
 import re
+import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers below still apply
+    from orjson import loads as _json_loads  # optional: pip install pitcrew[fast]
+except ImportError:
+    _json_loads = json.loads
 
 from pitcrew.llm import LLM
 from pitcrew.tools.file_index import FileIndexSnapshot
 
+# Plan-response parsing patterns, compiled once
+_FILENAME_RE = re.compile(r'\b\w+\.\w+\b')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+_JSON_BLOCK_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Fixed separators and trailing instruction keep prompt bytes stable across calls
+_SECTION_SEP = "\n\n"
+_PLAN_INSTRUCTION = (
+    "Create a structured plan using the create_plan function. "
+    "Follow the chain-of-thought process from the system instructions."
+)
+
 
 class EditAction(BaseModel):
     """Represents a single file edit action."""
@@ -21,12 +42,22 @@ class EditAction(BaseModel):
     content: Optional[str] = Field(None, description="Full content for create/replace action")
     description: Optional[str] = Field(None, description="Description for implement action - what the file should do")
 
+    @field_validator("action")
+    @classmethod
+    def _intern_action(cls, value: str) -> str:
+        """Intern the action so every edit shares one string per action type."""
+        return sys.intern(value)
+
 
 class ExecutionAction(BaseModel):
     """Represents a command to execute."""
 
     command: str = Field(description="Command to execute")
     cwd: Optional[str] = Field(None, description="Working directory (default: project root)")
+    parallel_safe: bool = Field(
+        True,
+        description="Whether the command can run alongside other checks (false for ones that write shared state)",
+    )
 
 
 class Plan(BaseModel):
@@ -50,15 +81,17 @@ class Plan(BaseModel):
 class Planner:
     """Generates multi-file edit plans using rule-based and LLM approaches."""
 
-    def __init__(self, llm: LLM, project_root: Path):
+    def __init__(self, llm: LLM, project_root: Path, use_prompt_caching: bool = True):
         """Initialize planner.
 
         Args:
             llm: LLM instance for plan generation
             project_root: Project root directory
+            use_prompt_caching: Mark the stable prompt prefix with Anthropic cache_control
         """
         self.llm = llm
         self.project_root = project_root
+        self.use_prompt_caching = use_prompt_caching
 
     def make_plan(
         self,
@@ -129,7 +162,7 @@ class Planner:
 
         # Try to identify relevant files from goal
         # Extract potential filenames or patterns
-        words = re.findall(r'\b\w+\.\w+\b', goal)
+        words = _FILENAME_RE.findall(goal)
         for word in words:
             # Check if this file exists in index
             for file_info in index.files:
@@ -158,12 +191,6 @@ class Planner:
         Returns:
             Plan object
         """
-        # Build system prompt with context docs
-        system_prompt = self._build_system_prompt(context_docs, hints)
-
-        # Build user prompt with conversation history
-        user_prompt = self._build_user_prompt(goal, index, conversation_history)
-
         # Define tools/schema for plan generation
         plan_schema = {
             "type": "object",
@@ -198,6 +225,7 @@ class Planner:
                         "properties": {
                             "command": {"type": "string"},
                             "cwd": {"type": "string"},
+                            "parallel_safe": {"type": "boolean"},
                         },
                         "required": ["command"],
                     },
@@ -207,10 +235,7 @@ class Planner:
         }
 
         # Call LLM with function calling
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
+        messages = self._build_messages(goal, index, context_docs, hints, conversation_history)
 
         tools = [
             {
@@ -239,14 +264,14 @@ class Planner:
 
                         # Try parsing as-is first
                         try:
-                            plan_data = json.loads(args_str)
+                            plan_data = _json_loads(args_str)
                         except json.JSONDecodeError as e:
                             print(f"DEBUG: JSON parse error: {e}")
                             print(f"DEBUG: Error at position {e.pos}")
                             # Try to fix common issues
                             # Remove trailing commas before closing brackets/braces
-                            args_str = re.sub(r',\s*([}\]])', r'\1', args_str)
-                            plan_data = json.loads(args_str)
+                            args_str = _TRAILING_COMMA_RE.sub(r'\1', args_str)
+                            plan_data = _json_loads(args_str)
                     else:
                         plan_data = tool_call["arguments"]
 
@@ -255,7 +280,7 @@ class Planner:
                     if "edits" in plan_data and isinstance(plan_data["edits"], str):
                         try:
                             # First try normal JSON parse
-                            plan_data["edits"] = json.loads(plan_data["edits"])
+                            plan_data["edits"] = _json_loads(plan_data["edits"])
                         except json.JSONDecodeError as e:
                             print(f"DEBUG: Failed to parse edits JSON: {e}")
                             print(f"DEBUG: Edits string (first 500 chars): {plan_data['edits'][:500]}")
@@ -267,7 +292,7 @@ class Planner:
                             edits_str = edits_str.replace('"""', '"')
 
                             try:
-                                plan_data["edits"] = json.loads(edits_str)
+                                plan_data["edits"] = _json_loads(edits_str)
                                 print("DEBUG: Successfully parsed after fixing triple quotes")
                             except json.JSONDecodeError:
                                 print("DEBUG: Still failed after fixes, returning empty edits")
@@ -276,13 +301,13 @@ class Planner:
 
                     if "post_checks" in plan_data and isinstance(plan_data["post_checks"], str):
                         try:
-                            plan_data["post_checks"] = json.loads(plan_data["post_checks"])
+                            plan_data["post_checks"] = _json_loads(plan_data["post_checks"])
                         except json.JSONDecodeError:
                             plan_data["post_checks"] = []
 
                     if "files_to_read" in plan_data and isinstance(plan_data["files_to_read"], str):
                         try:
-                            plan_data["files_to_read"] = json.loads(plan_data["files_to_read"])
+                            plan_data["files_to_read"] = _json_loads(plan_data["files_to_read"])
                         except json.JSONDecodeError:
                             plan_data["files_to_read"] = []
 
@@ -297,9 +322,9 @@ class Planner:
             content = response.get("content", "")
             if "```json" in content:
                 # Extract JSON from markdown code block
-                json_match = re.search(r'```json\s*(\{.*?\})\s*```', content, re.DOTALL)
+                json_match = _JSON_BLOCK_RE.search(content)
                 if json_match:
-                    plan_data = json.loads(json_match.group(1))
+                    plan_data = _json_loads(json_match.group(1))
                     return Plan(**plan_data)
 
             # If we can't extract a plan, create a minimal one
@@ -319,12 +344,64 @@ class Planner:
                 post_checks=[],
             )
 
-    def _build_system_prompt(self, context_docs: list[str], hints: dict[str, Any]) -> str:
-        """Build system prompt for plan generation.
+    def _build_messages(
+        self,
+        goal: str,
+        index: FileIndexSnapshot,
+        context_docs: list[str],
+        hints: dict[str, Any],
+        conversation_history: list[dict],
+    ) -> list[dict[str, Any]]:
+        """Build planner messages with the stable prefix first and the goal last.
+
+        The planner instructions, context docs and file list rarely change within
+        a session, so they are marked as cache breakpoints; hints, conversation
+        and the goal vary per call and come after them.
 
         Args:
+            goal: User's goal
+            index: File index
             context_docs: Context from AGENTS.md, etc.
             hints: Rule-based hints
+            conversation_history: Recent conversation messages
+
+        Returns:
+            List of message dicts for LLM.complete
+        """
+        system_prompt = self._build_system_prompt()
+        if context_docs:
+            context_block = _SECTION_SEP.join(["Project context:", *context_docs])
+        else:
+            context_block = None
+        file_tree = self._build_file_tree(index)
+        request = self._build_user_prompt(goal, hints, conversation_history)
+
+        if not self.use_prompt_caching:
+            system = _SECTION_SEP.join(part for part in (system_prompt, context_block) if part)
+            return [
+                {"role": "system", "content": system},
+                {"role": "user", "content": _SECTION_SEP.join([file_tree, request])},
+            ]
+
+        cache_control = {"type": "ephemeral"}
+        system_blocks: list[dict[str, Any]] = [{"type": "text", "text": system_prompt}]
+        if context_block:
+            system_blocks.append({"type": "text", "text": context_block})
+        system_blocks[-1]["cache_control"] = cache_control
+
+        return [
+            {"role": "system", "content": system_blocks},
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": file_tree, "cache_control": cache_control},
+                    {"type": "text", "text": request},
+                ],
+            },
+        ]
+
+    def _build_system_prompt(self) -> str:
+        """Build system prompt for plan generation.
 
         Returns:
             System prompt string
@@ -341,56 +418,76 @@ class Planner:
             "- 'delete' - Delete a file",
         ]
 
-        if hints["suggested_actions"]:
-            prompt_parts.append("")
-            prompt_parts.append("Specific guidance:")
-            for action in hints["suggested_actions"]:
-                prompt_parts.append(f"- {action}")
-
-        # NOTE: context_docs (AGENTS.md) is now in the main system prompt, not here
-
         return "\n".join(prompt_parts)
 
-    def _build_user_prompt(self, goal: str, index: FileIndexSnapshot, conversation_history: list[dict] = None) -> str:
-        """Build user prompt for plan generation.
+    def _build_file_tree(self, index: FileIndexSnapshot) -> str:
+        """Build the project file list shown to the planner.
+
+        Files are chosen by path and the summary is serialized with sorted keys,
+        so the block is byte-identical for an unchanged tree.
 
         Args:
-            goal: User's goal
             index: File index
-            conversation_history: Recent conversation messages
 
         Returns:
-            User prompt string
+            File list string
         """
-        # Build file tree summary
         file_list = []
-        for file_info in index.files[:50]:  # Limit to first 50 files
+        for file_info in heapq.nsmallest(50, index.files, key=itemgetter("path")):
             file_list.append(f"- {file_info['path']} ({file_info['language'] or 'unknown'})")
 
-        file_tree = "\n".join(file_list)
-
         if len(index.files) > 50:
-            file_tree += f"\n... and {len(index.files) - 50} more files"
+            file_list.append(f"... and {len(index.files) - 50} more files")
+
+        languages = json.dumps(index.summary.get("languages", {}), sort_keys=True)
+        return _SECTION_SEP.join([
+            "Project files:\n" + "\n".join(file_list),
+            f"Languages: {languages}",
+        ])
+
+    def _build_user_prompt(
+        self,
+        goal: str,
+        hints: dict[str, Any],
+        conversation_history: list[dict] = None,
+    ) -> str:
+        """Build the per-request part of the plan prompt.
+
+        Sections run from least to most variable, ending with the goal.
+
+        Args:
+            goal: User's goal
+            hints: Rule-based hints
+            conversation_history: Recent conversation messages
+
+        Returns:
+            User prompt string
+        """
+        sections = []
 
         # Include relevant conversation history (last 5 messages)
-        conversation_context = ""
         if conversation_history:
             recent_messages = conversation_history[-5:]  # Last 5 messages
-            conversation_context = "\n\nRecent conversation:\n"
+            context_lines = []
             for msg in recent_messages:
                 role = msg.get("role", "unknown")
                 content = msg.get("content", "")
                 # Truncate long messages
                 if len(content) > 200:
                     content = content[:200] + "..."
-                conversation_context += f"{role}: {content}\n"
+                context_lines.append(f"{role}: {content}")
+            sections.append("Recent conversation:\n" + "\n".join(context_lines))
 
-        return f"""Goal: {goal}
+        # Goal-specific guidance from rule-based analysis
+        if hints["suggested_actions"]:
+            sections.append("Specific guidance:\n" + "\n".join(
+                f"- {action}" for action in hints["suggested_actions"]
+            ))
 
-Project files:
-{file_tree}{conversation_context}
+        sections.append(_PLAN_INSTRUCTION)
+        sections.append(f"Goal: {goal}")
 
-Create a structured plan using the create_plan function. Follow the chain-of-thought process from the system instructions."""
+        return _SECTION_SEP.join(sections)
 
     def _validate_plan(self, plan: Plan, index: FileIndexSnapshot) -> Plan:
         """Validate and clean up a plan.
@@ -1,14 +1,72 @@
 """File reading, writing, and snapshot management."""
 
+import asyncio
+import codecs
+import hashlib
 import shutil
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from pitcrew.utils.diffs import apply_patch, normalize_line_endings
 
 
+_HASH_CHUNK_SIZE = 64 * 1024
+_PEEK_SIZE = 4096
+
+
+def content_hash(path: Path) -> Optional[bytes]:
+    """Hash a file's bytes without loading it all into memory.
+
+    Args:
+        path: File path
+
+    Returns:
+        16-byte blake2b digest, or None if the file cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+
+def text_hash(text: str) -> bytes:
+    """Hash text the way write() would store it (UTF-8).
+
+    Args:
+        text: File content
+
+    Returns:
+        16-byte blake2b digest, comparable with content_hash
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def looks_binary(head: bytes) -> bool:
+    """Guess whether a file is binary from its first bytes.
+
+    Args:
+        head: Leading bytes of the file (see ReadWrite.peek)
+
+    Returns:
+        True if the bytes contain NUL or are not valid UTF-8
+    """
+    if b"\0" in head:
+        return True
+    try:
+        # Non-final decode: a character cut off by the peek window is still text
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
 @dataclass
 class PatchResult:
     """Result of applying a patch."""
@@ -25,6 +83,7 @@ class ReadWrite:
         project_root: Path,
         max_read_mb: int = 8,
         max_write_mb: int = 2,
+        executor: Optional[Executor] = None,
     ):
         """Initialize ReadWrite tool.
 
@@ -32,10 +91,26 @@ class ReadWrite:
             project_root: Project root directory
             max_read_mb: Maximum file size to read (MB)
             max_write_mb: Maximum file size to write (MB)
+            executor: Shared pool for snapshot copies; a temporary pool is
+                used per snapshot if omitted
         """
         self.project_root = project_root
         self.max_read_bytes = max_read_mb * 1024 * 1024
         self.max_write_bytes = max_write_mb * 1024 * 1024
+        self.executor = executor
+
+    def _map_copies(self, copy: Callable[[Any], None], items: list) -> None:
+        """Run independent file copies concurrently.
+
+        Args:
+            copy: Copies one item
+            items: Items to copy
+        """
+        if self.executor is not None:
+            list(self.executor.map(copy, items))
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(items))) as pool:
+            list(pool.map(copy, items))
 
     def read(self, path: str, mode: str = "auto") -> tuple[bool, Optional[str], Optional[str]]:
         """Read a file.
@@ -79,6 +154,72 @@ class ReadWrite:
         except IOError as e:
             return False, None, f"Cannot read file: {e}"
 
+    def read_prefix(self, path: str, max_chars: int) -> tuple[bool, Optional[str], bool, Optional[str]]:
+        """Read at most the first max_chars characters of a text file.
+
+        Unlike read(), the rest of the file is never loaded, so there is no
+        size limit.
+
+        Args:
+            path: Relative or absolute path to file
+            max_chars: Maximum number of characters to return
+
+        Returns:
+            Tuple of (success, content, truncated, error); truncated is True
+            if the file continues past max_chars
+        """
+        file_path = self._resolve_path(path)
+
+        if not self._is_safe_path(file_path):
+            return False, None, False, f"Path outside project root: {path}"
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read(max_chars + 1)
+        except FileNotFoundError:
+            return False, None, False, f"File not found: {path}"
+        except IsADirectoryError:
+            return False, None, False, f"Not a file: {path}"
+        except UnicodeDecodeError:
+            return False, None, False, "File is not valid UTF-8 text"
+        except OSError as e:
+            return False, None, False, f"Cannot read file: {e}"
+
+        if len(content) > max_chars:
+            return True, content[:max_chars], True, None
+        return True, content, False, None
+
+    def peek(self, path: str, n: int = _PEEK_SIZE) -> bytes:
+        """Read the first bytes of a file, e.g. to sniff for binary content.
+
+        Args:
+            path: Relative or absolute path to file
+            n: Maximum number of bytes to read
+
+        Returns:
+            Up to n bytes, or b"" if the file is missing, unsafe, or unreadable
+        """
+        file_path = self._resolve_path(path)
+        if not self._is_safe_path(file_path):
+            return b""
+        try:
+            with open(file_path, "rb") as f:
+                return f.read(n)
+        except OSError:
+            return b""
+
+    async def aread(self, path: str, mode: str = "auto") -> tuple[bool, Optional[str], Optional[str]]:
+        """Read a file in a worker thread, without blocking the event loop.
+
+        Args:
+            path: Relative or absolute path to file
+            mode: Read mode (auto, text, binary)
+
+        Returns:
+            Tuple of (success, content, error), as for read()
+        """
+        return await asyncio.to_thread(self.read, path, mode)
+
     def write(self, path: str, content: str) -> tuple[bool, Optional[str]]:
         """Write content to a file.
 
@@ -162,36 +303,57 @@ class ReadWrite:
         snapshot_dir = self.project_root / ".pitcrew" / "snapshots" / snapshot_id
 
         try:
+            # Read before creating the directory so the listing fallback cannot
+            # return this snapshot
+            previous = self.latest_snapshot()
             snapshot_dir.mkdir(parents=True, exist_ok=True)
 
-            for file_path_str in files:
-                file_path = self._resolve_path(file_path_str)
+            # Copies are independent I/O, so several files are copied at once
+            if len(files) > 1:
+                self._map_copies(lambda f: self._snapshot_file(f, snapshot_dir), files)
+            else:
+                for file_path_str in files:
+                    self._snapshot_file(file_path_str, snapshot_dir)
 
-                # Skip if file doesn't exist
-                if not file_path.exists():
-                    continue
+            # Chain to the previous snapshot so repeated undos walk back in order
+            if previous:
+                (snapshot_dir.parent / f"{snapshot_id}.prev").write_text(previous)
+            self._set_latest_snapshot(snapshot_id)
+
+            return True, snapshot_id, None
 
-                # Validate path
-                if not self._is_safe_path(file_path):
-                    continue
+        except (IOError, OSError) as e:
+            return False, None, f"Cannot create snapshot: {e}"
 
-                # Get relative path for snapshot
-                try:
-                    rel_path = file_path.resolve().relative_to(self.project_root.resolve())
-                except ValueError:
-                    continue
+    def _snapshot_file(self, file_path_str: str, snapshot_dir: Path) -> None:
+        """Copy one file into a snapshot directory, skipping missing or unsafe paths.
 
-                # Create destination path
-                dest_path = snapshot_dir / rel_path
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            file_path_str: File path to snapshot
+            snapshot_dir: Snapshot directory
+        """
+        file_path = self._resolve_path(file_path_str)
 
-                # Copy file
-                shutil.copy2(file_path, dest_path)
+        # Skip if file doesn't exist
+        if not file_path.exists():
+            return
 
-            return True, snapshot_id, None
+        # Validate path
+        if not self._is_safe_path(file_path):
+            return
 
-        except (IOError, OSError) as e:
-            return False, None, f"Cannot create snapshot: {e}"
+        # Get relative path for snapshot
+        try:
+            rel_path = file_path.resolve().relative_to(self.project_root.resolve())
+        except ValueError:
+            return
+
+        # Create destination path
+        dest_path = snapshot_dir / rel_path
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Copy file
+        shutil.copy2(file_path, dest_path)
 
     def restore_snapshot(self, snapshot_id: str) -> tuple[bool, Optional[str]]:
         """Restore files from a snapshot.
@@ -208,27 +370,39 @@ class ReadWrite:
             return False, f"Snapshot not found: {snapshot_id}"
 
         try:
-            # Walk snapshot directory and restore files
-            for snapshot_file in snapshot_dir.rglob("*"):
-                if snapshot_file.is_dir():
-                    continue
+            # Walk snapshot directory and restore files; copies are independent,
+            # so several files are restored at once
+            snapshot_files = [f for f in snapshot_dir.rglob("*") if not f.is_dir()]
+            if len(snapshot_files) > 1:
+                self._map_copies(lambda f: self._restore_file(f, snapshot_dir), snapshot_files)
+            else:
+                for snapshot_file in snapshot_files:
+                    self._restore_file(snapshot_file, snapshot_dir)
+
+            # The next undo goes to the snapshot taken before this one
+            prev_file = snapshot_dir.parent / f"{snapshot_id}.prev"
+            self._set_latest_snapshot(prev_file.read_text().strip() if prev_file.exists() else None)
 
-                # Get relative path
-                rel_path = snapshot_file.relative_to(snapshot_dir)
+            return True, None
 
-                # Get destination path
-                dest_path = self.project_root / rel_path
+        except (IOError, OSError) as e:
+            return False, f"Cannot restore snapshot: {e}"
 
-                # Create parent directories
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+    def _restore_file(self, snapshot_file: Path, snapshot_dir: Path) -> None:
+        """Copy one file from a snapshot back into the project.
 
-                # Copy file back
-                shutil.copy2(snapshot_file, dest_path)
+        Args:
+            snapshot_file: File inside the snapshot directory
+            snapshot_dir: Snapshot directory
+        """
+        # Get destination path
+        dest_path = self.project_root / snapshot_file.relative_to(snapshot_dir)
 
-            return True, None
+        # Create parent directories
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        except (IOError, OSError) as e:
-            return False, f"Cannot restore snapshot: {e}"
+        # Copy file back (shutil uses sendfile where available, so no user-space copy)
+        shutil.copy2(snapshot_file, dest_path)
 
     def list_snapshots(self) -> list[str]:
         """List available snapshots.
@@ -248,6 +422,33 @@ class ReadWrite:
 
         return sorted(snapshots, reverse=True)
 
+    def latest_snapshot(self) -> Optional[str]:
+        """Get the snapshot the next undo should restore.
+
+        Reads the LATEST pointer maintained by create_snapshot and
+        restore_snapshot, falling back to a directory listing for snapshot
+        directories created before the pointer existed.
+
+        Returns:
+            Snapshot ID, or None if there is nothing left to undo
+        """
+        pointer = self.project_root / ".pitcrew" / "snapshots" / "LATEST"
+        try:
+            return pointer.read_text().strip() or None
+        except FileNotFoundError:
+            snapshots = self.list_snapshots()
+            return snapshots[0] if snapshots else None
+
+    def _set_latest_snapshot(self, snapshot_id: Optional[str]) -> None:
+        """Update the LATEST pointer (empty when the undo chain is exhausted).
+
+        Args:
+            snapshot_id: Snapshot ID, or None
+        """
+        pointer = self.project_root / ".pitcrew" / "snapshots" / "LATEST"
+        pointer.parent.mkdir(parents=True, exist_ok=True)
+        pointer.write_text(snapshot_id or "")
+
     def _resolve_path(self, path: str) -> Path:
         """Resolve a path string to absolute Path.
 
@@ -0,0 +1,249 @@
+"""Small caches for command, file and summary results."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Optional
+
+
+class TTLCache:
+    """Thread-safe bounded LRU cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted first)
+            ttl: Seconds an entry stays valid, or None for no expiry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Bump when the on-disk layout of SummaryCache changes; older caches are dropped
+SUMMARY_CACHE_VERSION = 1
+
+
+class SummaryCache:
+    """On-disk cache of LLM file summaries keyed by content hash.
+
+    Entries live in ``<cache_dir>/<namespace>_<blake2b>.md``; the namespace
+    should carry the model and prompt version so either change misses. A
+    manifest.json records the layout version, and a cache directory with a
+    missing or different version is cleared on first use.
+    """
+
+    def __init__(self, cache_dir: Path, namespace: str):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cached summaries
+            namespace: Model and prompt identifier prefixed to every entry
+        """
+        self.cache_dir = cache_dir
+        self.namespace = re.sub(r"[^\w.-]", "_", namespace)
+        self._checked = False
+        self._lock = threading.Lock()
+
+    def get(self, content: str) -> Optional[str]:
+        """Get the cached summary for some file content.
+
+        Args:
+            content: File content that was summarized
+
+        Returns:
+            Cached summary, or None on a miss
+        """
+        self._check_manifest()
+        try:
+            return self._entry_path(content).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def set(self, content: str, summary: str) -> None:
+        """Store the summary for some file content.
+
+        Args:
+            content: File content that was summarized
+            summary: Summary to store
+        """
+        self._check_manifest()
+        path = self._entry_path(content)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_text(summary, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _entry_path(self, content: str) -> Path:
+        """Path of the entry for some file content."""
+        key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{self.namespace}_{key}.md"
+
+    def _check_manifest(self) -> None:
+        """Create the cache directory, clearing it if its manifest is stale."""
+        if self._checked:
+            return
+        with self._lock:
+            if self._checked:
+                return
+            manifest = self.cache_dir / "manifest.json"
+            try:
+                version = json.loads(manifest.read_text()).get("version")
+            except (OSError, ValueError, AttributeError):
+                version = None
+            try:
+                if version != SUMMARY_CACHE_VERSION:
+                    if self.cache_dir.exists():
+                        for entry in self.cache_dir.glob("*.md"):
+                            entry.unlink(missing_ok=True)
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    manifest.write_text(json.dumps({"version": SUMMARY_CACHE_VERSION}))
+            except OSError:
+                pass
+            self._checked = True
+
+
+# Bump when the on-disk layout of FileContentCache changes; older caches are dropped
+FILE_CONTENT_CACHE_VERSION = 1
+
+
+class FileContentCache:
+    """On-disk cache of file excerpts, invalidated by size, mtime and line limit.
+
+    All entries live in one JSON file, loaded on first use and rewritten
+    atomically by save() when something changed. Each path maps to the
+    ``[size, mtime, max_lines, content]`` it was last read with, so an entry
+    only hits while the file's index stamp and the excerpt policy match.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize cache.
+
+        Args:
+            path: JSON file holding the cache
+        """
+        self.path = path
+        self._entries: Optional[dict[str, list]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str, size: int, mtime: float, max_lines: Optional[int]) -> Optional[str]:
+        """Get a cached excerpt.
+
+        Args:
+            file_path: Path relative to the project root
+            size: Current file size from the index
+            mtime: Current file mtime from the index
+            max_lines: Line limit the excerpt was read with
+
+        Returns:
+            Cached excerpt, or None on a miss
+        """
+        with self._lock:
+            entry = self._load().get(file_path)
+        if entry is None or entry[:3] != [size, mtime, max_lines]:
+            return None
+        return entry[3]
+
+    def set(self, file_path: str, size: int, mtime: float, max_lines: Optional[int], content: str) -> None:
+        """Store an excerpt.
+
+        Args:
+            file_path: Path relative to the project root
+            size: File size from the index
+            mtime: File mtime from the index
+            max_lines: Line limit the excerpt was read with
+            content: Excerpt to store
+        """
+        with self._lock:
+            self._load()[file_path] = [size, mtime, max_lines, content]
+            self._dirty = True
+
+    def save(self, keep: Optional[Iterable[str]] = None) -> None:
+        """Write the cache to disk if it changed.
+
+        Args:
+            keep: Paths still in use; entries for other paths are dropped
+        """
+        with self._lock:
+            entries = self._load()
+            if keep is not None:
+                for stale in entries.keys() - keep:
+                    del entries[stale]
+                    self._dirty = True
+            if not self._dirty:
+                return
+
+            data = json.dumps({"version": FILE_CONTENT_CACHE_VERSION, "entries": entries})
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(data, encoding="utf-8")
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+
+    def _load(self) -> dict[str, list]:
+        """Load entries on first use (caller holds the lock)."""
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") != FILE_CONTENT_CACHE_VERSION:
+                    raise ValueError("stale cache version")
+                self._entries = data["entries"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                self._entries = {}
+        return self._entries
@@ -5,7 +5,7 @@ from typing import Optional
 
 import pathspec
 
-from pitcrew.constants import BUILTIN_IGNORES
+from pitcrew.constants import BUILTIN_IGNORES, is_ignored
 
 
 class IgnoreRules:
@@ -18,11 +18,18 @@ class IgnoreRules:
             project_root: Root directory to search for ignore files
         """
         self.project_root = project_root
+        self._builtins_in_spec = False
         self.spec = self._build_spec()
 
     def _build_spec(self) -> pathspec.PathSpec:
-        """Build combined PathSpec from all ignore sources."""
-        patterns = list(BUILTIN_IGNORES)
+        """Build PathSpec from project ignore files.
+
+        Built-in patterns are normally left out of the spec and matched by a
+        precompiled regex in ``should_ignore``. If the project rules contain
+        negations, the built-ins go first in the spec instead, so that a
+        ``!pattern`` can re-include a path a built-in excludes.
+        """
+        patterns: list[str] = []
 
         # Load .gitignore
         gitignore_path = self.project_root / ".gitignore"
@@ -56,6 +63,10 @@ class IgnoreRules:
         # Filter out empty lines and comments
         patterns = [p.strip() for p in patterns if p.strip() and not p.strip().startswith("#")]
 
+        if any(p.startswith("!") for p in patterns):
+            self._builtins_in_spec = True
+            patterns = [*BUILTIN_IGNORES, *patterns]
+
         return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
 
     def should_ignore(self, path: Path) -> bool:
@@ -77,11 +88,35 @@ class IgnoreRules:
             # Path is outside project root
             return True
 
-        # Check against pathspec
-        return self.spec.match_file(str(rel_path))
+        rel_str = rel_path.as_posix()
+
+        # Built-in patterns first (single precompiled regex), then project rules
+        if not self._builtins_in_spec and is_ignored(rel_str):
+            return True
+        return self.spec.match_file(rel_str)
+
+    def should_ignore_dir(self, rel_dir: str) -> bool:
+        """Check if a whole directory is ignored, so a walk can skip it.
+
+        Everything under an ignored directory is ignored too (as in git, a
+        negated pattern cannot re-include a file whose parent is excluded).
+
+        Args:
+            rel_dir: POSIX-style directory path relative to the project root
+
+        Returns:
+            True if the directory should be ignored
+        """
+        dir_str = f"{rel_dir}/"
+        if not self._builtins_in_spec and is_ignored(dir_str):
+            return True
+        return self.spec.match_file(dir_str)
 
     def get_patterns(self) -> list[str]:
-        """Get all ignore patterns.
+        """Get the patterns matched by pathspec.
+
+        These are the project patterns, preceded by the built-ins when the
+        project rules contain negations.
 
         Returns:
             List of pattern strings
@@ -5,6 +5,26 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson  # optional: pip install pitcrew[fast]
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
 
 class SessionLogger:
     """Handles logging for a PitCrew session."""
@@ -51,8 +71,8 @@ class SessionLogger:
         if tool_calls:
             entry["tool_calls"] = tool_calls
 
-        with open(self.transcript_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        with open(self.transcript_path, "ab") as f:
+            f.write(_dumps(entry) + b"\n")
 
     def save_plan(self, plan: dict) -> None:
         """Save a plan to disk.
@@ -60,8 +80,8 @@ class SessionLogger:
         Args:
             plan: Plan dictionary
         """
-        with open(self.plan_path, "w") as f:
-            json.dump(plan, f, indent=2)
+        with open(self.plan_path, "wb") as f:
+            f.write(_dumps(plan, indent=True))
 
     def save_diff(self, filename: str, diff_content: str) -> None:
         """Save a diff to disk.
@@ -87,16 +107,15 @@ class SessionLogger:
         filename = f"{timestamp}_{safe_cmd}.json"
 
         exec_path = self.exec_dir / filename
-        with open(exec_path, "w") as f:
-            json.dump(
+        with open(exec_path, "wb") as f:
+            f.write(_dumps(
                 {
                     "command": command,
                     "timestamp": datetime.now().isoformat(),
                     **result,
                 },
-                f,
-                indent=2,
-            )
+                indent=True,
+            ))
 
     def get_log_path(self) -> str:
         """Get the path to the log directory.
@@ -0,0 +1,62 @@
+"""Tests for in-memory caches."""
+
+from pitcrew.utils.cache import FileContentCache, SummaryCache, TTLCache
+
+
+def test_lru_eviction_order():
+    """Test that the least recently used entry is evicted first."""
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recent
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """Test that entries older than the TTL are dropped."""
+    now = [100.0]
+    monkeypatch.setattr("pitcrew.utils.cache.time.monotonic", lambda: now[0])
+
+    cache = TTLCache(maxsize=4, ttl=30)
+    cache.set("git status", "clean")
+    now[0] += 29
+    assert cache.get("git status") == "clean"
+
+    now[0] += 2
+    assert cache.get("git status") is None
+    assert len(cache) == 0
+
+
+def test_summary_cache_drops_entries_from_other_versions(temp_dir):
+    """Test that a cache directory with a stale manifest is cleared."""
+    cache_dir = temp_dir / "summary_cache"
+    cache = SummaryCache(cache_dir, "model_v1")
+    cache.set("content", "summary")
+    assert SummaryCache(cache_dir, "model_v1").get("content") == "summary"
+    assert SummaryCache(cache_dir, "model_v2").get("content") is None
+
+    (cache_dir / "manifest.json").write_text('{"version": 0}')
+    assert SummaryCache(cache_dir, "model_v1").get("content") is None
+
+
+def test_file_content_cache_matches_stamp_and_prunes(temp_dir):
+    """Test that excerpts persist, miss on a changed stamp and drop removed paths."""
+    path = temp_dir / "init_cache.json"
+    cache = FileContentCache(path)
+    cache.set("a.py", 10, 1.5, 300, "x = 1")
+    cache.set("b.py", 20, 2.5, None, "y = 2")
+    cache.save()
+
+    reloaded = FileContentCache(path)
+    assert reloaded.get("a.py", 10, 1.5, 300) == "x = 1"
+    assert reloaded.get("a.py", 11, 1.5, 300) is None
+    assert reloaded.get("a.py", 10, 1.5, None) is None
+
+    reloaded.save(keep={"b.py"})
+    assert FileContentCache(path).get("a.py", 10, 1.5, 300) is None
+    assert FileContentCache(path).get("b.py", 20, 2.5, None) == "y = 2"
@@ -0,0 +1,26 @@
+"""Tests for configuration loading."""
+
+import json
+import os
+
+from pitcrew.config import Config
+
+
+def test_project_commands_reload_when_file_changes(test_project):
+    """Test that custom commands are cached but re-read after the file changes."""
+    config_path = test_project / ".pitcrew" / "config.json"
+    config_path.parent.mkdir()
+    config_path.write_text(json.dumps({"commands": {"lint": "ruff check ."}}))
+
+    assert Config.load(test_project).custom_commands == {"lint": "ruff check ."}
+
+    config_path.write_text(json.dumps({"commands": {"fmt": "black ."}}))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert Config.load(test_project).custom_commands == {"fmt": "black ."}
+
+
+def test_missing_project_config_yields_no_commands(test_project):
+    """Test that a project without .pitcrew/config.json loads cleanly."""
+    assert Config.load(test_project).custom_commands == {}
@@ -0,0 +1,54 @@
+"""Tests for conversation context."""
+
+import pytest
+
+from pitcrew.conversation import ConversationContext
+
+
+def test_file_reads_keep_most_recent():
+    """Test that recently read files are capped and ordered by recency."""
+    context = ConversationContext()
+
+    for i in range(12):
+        context.add_file_read(f"file{i}.py")
+
+    # Re-reading an old file moves it to the end
+    context.add_file_read("file5.py")
+
+    files = list(context.last_files_read)
+    assert len(files) == 10
+    assert "file0.py" not in files
+    assert files[-1] == "file5.py"
+    assert "file11.py, file5.py" in context.get_context_summary()
+
+
+def test_history_trimmed_keeps_system_prompt():
+    """Test that old messages are evicted while the system prompt is kept."""
+    context = ConversationContext(max_history=2)
+    context.set_system_prompt("You are PitCrew")
+
+    for i in range(6):
+        context.add_message("user", f"question {i}")
+        context.add_message("assistant", f"answer {i}")
+
+    messages = context.to_messages()
+    assert len(messages) == 5
+    assert messages[0] == {"role": "system", "content": "You are PitCrew"}
+    assert messages[1]["content"] == "question 4"
+    assert messages[-1]["content"] == "answer 5"
+
+    context.clear()
+    assert context.to_messages() == ({"role": "system", "content": "You are PitCrew"},)
+
+
+def test_to_messages_is_read_only_view():
+    """Test that callers cannot grow the stored history through to_messages."""
+    context = ConversationContext()
+    context.set_system_prompt("You are PitCrew")
+    context.add_message("user", "hi")
+
+    messages = context.to_messages()
+    assert isinstance(messages, tuple)
+    assert [m["role"] for m in messages] == ["system", "user"]
+    with pytest.raises(AttributeError):
+        messages.append({"role": "user", "content": "extra"})
@@ -0,0 +1,58 @@
+"""Tests for the daemon socket protocol."""
+
+import socket
+from types import SimpleNamespace
+
+from pitcrew.daemon import _handle_request, _recv_msg, _send_msg, _share_console, send_command, socket_path
+
+
+def test_message_round_trip():
+    """Test that length-prefixed JSON messages survive a socket round trip."""
+    left, right = socket.socketpair()
+    with left, right:
+        _send_msg(left, {"command": "/read src/main.py"})
+        assert _recv_msg(right) == {"command": "/read src/main.py"}
+
+
+def test_send_command_without_daemon(test_project, monkeypatch):
+    """Test that send_command falls back when no daemon is listening."""
+    monkeypatch.setenv("HOME", str(test_project))
+
+    assert socket_path(test_project).parent == test_project / ".pitcrew"
+    assert send_command(test_project, "/help") is None
+
+
+def test_daemon_declines_other_models():
+    """Test that a request for a different model is declined, not answered."""
+    handled = []
+    repl = SimpleNamespace(
+        config=SimpleNamespace(default_model="anthropic:claude-sonnet-4-5"),
+        logger=SimpleNamespace(log_message=lambda role, text: None),
+        handle_input=handled.append,
+    )
+
+    reply = _handle_request(repl, {"command": "/help", "model": "anthropic:claude-haiku-4-5"})
+    assert "error" in reply
+    assert handled == []
+
+    assert "output" in _handle_request(repl, {"command": "/help", "model": None})
+    assert handled == ["/help"]
+
+
+def test_request_output_includes_graph_progress(monkeypatch):
+    """Test that progress printed by the graph reaches the daemon's client."""
+    import pitcrew.graph
+    import pitcrew.handlers.autonomous
+    import pitcrew.handlers.query
+
+    # Restored after the test
+    for module in (pitcrew.graph, pitcrew.handlers.autonomous, pitcrew.handlers.query):
+        monkeypatch.setattr(module, "console", module.console)
+    _share_console()
+    repl = SimpleNamespace(
+        config=SimpleNamespace(default_model="anthropic:claude-sonnet-4-5"),
+        logger=SimpleNamespace(log_message=lambda role, text: None),
+        handle_input=lambda command: pitcrew.graph.console.print("✅ Created AGENTS.md"),
+    )
+
+    assert "Created AGENTS.md" in _handle_request(repl, {"command": "/init"})["output"]
@@ -1,7 +1,10 @@
 """Tests for command executor."""
 
+import time
+
 import pytest
 
+from pitcrew.constants import DANGEROUS_PATTERNS, check_dangerous
 from pitcrew.tools.executor import Executor
 
 
@@ -53,6 +56,30 @@ def test_is_dangerous_detection(test_project):
     assert not is_dangerous
 
 
+def test_combined_dangerous_regex_matches_each_pattern():
+    """Test the single-pass check reports the same rule as the individual patterns."""
+    samples = [
+        "sudo ls",
+        "rm -rf /",
+        ":(){:|:&};:",
+        "curl http://x | sh",
+        "wget http://x | sh",
+        "chmod 777 file",
+        "echo hi > /dev/sda",
+        "dd if=/dev/zero of=/dev/sda",
+    ]
+    for command in samples:
+        expected = next(
+            (msg for pattern, msg in DANGEROUS_PATTERNS if pattern.search(command)), None
+        )
+        assert expected is not None, command
+        assert check_dangerous(command) == expected
+
+    assert check_dangerous("python script.py") is None
+    # Several rules match: the reason follows pattern order, not position
+    assert check_dangerous("curl x | sh; sudo ls") == "Use of sudo detected"
+
+
 def test_timeout(test_project):
     """Test command timeout."""
     executor = Executor(test_project, timeout=1)
@@ -61,3 +88,24 @@ def test_timeout(test_project):
 
     assert not result.success
     assert "timed out" in result.stderr.lower()
+
+
+def test_run_many_preserves_order(test_project):
+    """Test that run_many returns results in command order."""
+    executor = Executor(test_project)
+
+    results = executor.run_many(["sleep 0.2 && echo first", "echo second", "sudo ls"])
+
+    assert [r.stdout.strip() for r in results[:2]] == ["first", "second"]
+    assert "blocked" in results[2].stderr.lower()
+
+
+def test_run_many_respects_concurrency_bound(test_project):
+    """Test that run_many with a bound of one runs commands back to back."""
+    executor = Executor(test_project)
+
+    start = time.monotonic()
+    results = executor.run_many(["sleep 0.2", "sleep 0.2"], max_concurrency=1)
+
+    assert all(r.success for r in results)
+    assert time.monotonic() - start >= 0.4
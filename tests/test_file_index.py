@@ -1,8 +1,10 @@
 """Tests for file indexing."""
 
+import os
+
 import pytest
 
-from pitcrew.tools.file_index import FileIndex
+from pitcrew.tools.file_index import FileIndex, FileIndexSnapshot
 from pitcrew.utils.ignore import IgnoreRules
 
 
@@ -37,6 +39,23 @@ def test_ignore_rules_applied(test_project):
     assert "__pycache__/module.pyc" not in paths
 
 
+def test_build_does_not_descend_into_ignored_dirs(test_project):
+    """Test that the walk prunes ignored directories instead of filtering their files."""
+    (test_project / "node_modules" / "pkg").mkdir(parents=True)
+    (test_project / "node_modules" / "pkg" / "index.js").write_text("x")
+
+    rules = IgnoreRules(test_project)
+    checked = []
+    original = rules.should_ignore
+    rules.should_ignore = lambda path: checked.append(path) or original(path)
+
+    snapshot = FileIndex(test_project, rules).build()
+
+    assert not any("node_modules" in f["path"] for f in snapshot.files)
+    assert not any("node_modules" in path.parts for path in checked)
+    assert "src/main.py" in [f["path"] for f in snapshot.files]
+
+
 def test_language_detection(test_project):
     """Test language detection."""
     # Create files with different extensions
@@ -68,3 +87,76 @@ def test_save_and_load_index(test_project):
 
     assert snapshot2 is not None
     assert snapshot2.summary["total_files"] == snapshot1.summary["total_files"]
+
+
+def test_index_round_trip_preserves_records(test_project):
+    """Test that the binary index restores every file record exactly."""
+    (test_project / "données.txt").write_text("unicode path")
+
+    rules = IgnoreRules(test_project)
+    indexer = FileIndex(test_project, rules)
+
+    snapshot1 = indexer.build()
+    indexer.save_to_disk(snapshot1)
+    snapshot2 = indexer.load_from_disk()
+
+    assert snapshot2.files == snapshot1.files
+    assert snapshot2.summary == snapshot1.summary
+
+
+def test_index_invalidated_when_head_moves(test_project):
+    """Test that a saved index is rejected after git HEAD changes."""
+    git_dir = test_project / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+
+    rules = IgnoreRules(test_project)
+    indexer = FileIndex(test_project, rules)
+    indexer.save_to_disk(indexer.build())
+
+    assert indexer.load_from_disk() is not None
+
+    (git_dir / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+
+    assert indexer.load_from_disk() is None
+
+
+def test_refresh_rehashes_only_changed_files(test_project):
+    """Test that load_or_refresh reuses records for untouched files."""
+    rules = IgnoreRules(test_project)
+    indexer = FileIndex(test_project, rules)
+    first = indexer.load_or_refresh()
+
+    main_py = test_project / "src" / "main.py"
+    main_py.write_text("def hello():\n    return 'there'\n")
+    stat = main_py.stat()
+    os.utime(main_py, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (test_project / "src" / "new.py").write_text("x = 1\n")
+
+    rehashed = []
+    original_index_file = indexer._index_file
+
+    def tracking_index_file(path, known=None):
+        entry = original_index_file(path, known)
+        if entry is not None and entry is not (known or {}).get(entry["path"]):
+            rehashed.append(entry["path"])
+        return entry
+
+    indexer._index_file = tracking_index_file
+    second = indexer.load_or_refresh()
+
+    assert sorted(rehashed) == ["src/main.py", "src/new.py"]
+    assert len(second.files) == len(first.files) + 1
+    assert indexer.load_from_disk().files == second.files
+
+
+def test_snapshot_columns_follow_files():
+    """Test that the extension and size columns line up with the file list."""
+    snapshot = FileIndexSnapshot(
+        files=[{"path": "src/App.PY", "size": 10}, {"path": "Makefile"}, {"path": "a.tar.gz", "size": 3}],
+        summary={},
+    )
+
+    assert snapshot.exts == [".py", "", ".gz"]
+    assert snapshot.sizes == [10, 0, 3]
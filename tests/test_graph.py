@@ -0,0 +1,620 @@
+"""Tests for graph helpers."""
+
+import asyncio
+import os
+import threading
+import time
+
+from pitcrew.config import Config
+from pitcrew.graph import (
+    PitCrewGraph,
+    _CACHEABLE_EXEC_RE,
+    _clip,
+    _init_line_limit,
+    _init_should_skip,
+    _pack_blocks,
+    _preview_thinking,
+)
+from pitcrew.tools.executor import ExecResult
+from pitcrew.tools.file_index import FileIndexSnapshot
+from pitcrew.tools.planner import Plan
+
+
+def test_context_docs_are_canonicalized_and_cached(test_project):
+    """Test that context docs are normalized and only re-read after they change."""
+    agents = test_project / "AGENTS.md"
+    agents.write_bytes(b"# Agents\r\nUse pytest.  \r\n\r\n")
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+
+    assert graph._load_context_docs() == ["# Agents\nUse pytest.\n"]
+
+    reads = []
+    original_read = graph.read_write.read
+
+    def counting_read(path):
+        reads.append(path)
+        return original_read(path)
+
+    graph.read_write.read = counting_read
+    assert graph._load_context_docs() == ["# Agents\nUse pytest.\n"]
+    assert reads == []
+
+    agents.write_text("# Agents v2\n")
+    stat = agents.stat()
+    os.utime(agents, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert graph._load_context_docs() == ["# Agents v2\n"]
+    assert reads == ["AGENTS.md"]
+
+
+def test_exec_cache_only_reuses_read_only_commands(test_project):
+    """Test that inspection commands are cached and other commands always run."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+
+    first = graph.handle_exec("ls src")
+    assert "cached result" in graph.handle_exec("ls src")
+    assert "cached result" not in first
+
+    graph.handle_exec("touch marker.txt")
+    assert "cached result" not in graph.handle_exec("touch marker.txt")
+
+    # The mutating command dropped the cached listing, which now shows its file
+    listing = graph.handle_exec("ls")
+    assert "cached result" not in listing
+    assert "marker.txt" in listing
+
+    graph.invalidate_caches()
+    assert "cached result" not in graph.handle_exec("ls src")
+
+
+def test_exec_cache_skips_find_and_branch_side_effects():
+    """Test that find actions and branch creation are never treated as read-only."""
+    for command in ("find . -name '*.py'", "git branch", "git branch -a", "git status --short"):
+        assert _CACHEABLE_EXEC_RE.match(command), command
+    for command in ("find . -name '*.tmp' -delete", "find . -exec rm {} +", "git branch feature", "git branch -D old"):
+        assert not _CACHEABLE_EXEC_RE.match(command), command
+
+
+def test_clip_keeps_head_and_tail():
+    """Test that long output is shortened to head and tail."""
+    assert _clip("short", 10) == "short"
+
+    clipped = _clip("a" * 50 + "b" * 50, 20)
+    assert clipped.startswith("a" * 10)
+    assert clipped.endswith("b" * 10)
+    assert "[80 characters elided]" in clipped
+
+
+def test_init_should_skip_uses_index_columns():
+    """Test that /init skips by extension, size, name and directory component."""
+    assert _init_should_skip("assets/logo.png", ".png", 10)
+    assert _init_should_skip("src/big.py", ".py", 600_000)
+    assert _init_should_skip("web/package-lock.json", ".json", 10)
+    assert _init_should_skip("node_modules/x/index.js", ".js", 10)
+    assert _init_should_skip("pkg/__pycache__/mod.py", ".py", 10)
+    assert not _init_should_skip("src/node_modules_helper.py", ".py", 10)
+    assert not _init_should_skip("src/main.py", ".py", 10)
+
+
+def test_init_line_limit_reads_important_files_in_full():
+    """Test that entry points, config files and config directories are read whole."""
+    assert _init_line_limit("README.md", ".md") is None
+    assert _init_line_limit("pkg/cli.py", ".py") is None
+    assert _init_line_limit("deploy/app.yaml", ".yaml") is None
+    assert _init_line_limit("config/base.py", ".py") is None
+    assert _init_line_limit("app/settings/prod.py", ".py") is None
+    assert _init_line_limit("a/b/config/deep.py", ".py") == 300
+    assert _init_line_limit("src/configure.py", ".py") == 300
+
+
+def test_preview_thinking_keeps_whole_lines():
+    """Test that reasoning previews stop at a line boundary once over the limit."""
+    assert _preview_thinking("short\nlines") == "short\nlines"
+    assert _preview_thinking("a" * 6 + "\n" + "b" * 6, limit=10) == "aaaaaa\n..."
+
+
+def test_pack_blocks_keeps_order_within_budget():
+    """Test that oversized blocks are dropped and later small ones still fit."""
+    blocks = ["a" * 40, "b" * 400, "c" * 40]
+
+    assert _pack_blocks(blocks, 30) == (["a" * 40, "c" * 40], 1)
+    assert _pack_blocks(blocks, 1000) == (blocks, 0)
+
+
+def test_apply_runs_same_path_edits_in_order(test_project):
+    """Test that parallel apply keeps per-file ordering and plan message order."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    plan = {
+        "intent": "multi-file edit",
+        "edits": [
+            {"path": "a.txt", "action": "create", "justification": "new", "content": "one"},
+            {"path": "b.txt", "action": "create", "justification": "new", "content": "two"},
+            {"path": "./a.txt", "action": "replace", "justification": "update", "content": "three"},
+            {"path": "README.md", "action": "delete", "justification": "cleanup"},
+        ],
+    }
+
+    result = graph.handle_apply(plan)
+
+    assert (test_project / "a.txt").read_text() == "three"
+    assert (test_project / "b.txt").read_text() == "two"
+    assert not (test_project / "README.md").exists()
+    assert result.index("Created a.txt") < result.index("Replaced ./a.txt")
+    assert result.index("Replaced ./a.txt") < result.index("Created b.txt")
+
+
+def test_apply_runs_implement_edits_serially(test_project):
+    """Test that implement edits run one at a time, in plan order, after file edits."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    lock = threading.Lock()
+    active = []
+    overlaps = []
+    calls = []
+
+    def fake_implement(file_path, description):
+        with lock:
+            active.append(file_path)
+            overlaps.append(len(active))
+        calls.append((file_path, (test_project / "plain.txt").exists()))
+        time.sleep(0.05)
+        with lock:
+            active.remove(file_path)
+        return f"✓ Implemented {file_path}"
+
+    graph.handle_implement = fake_implement
+    result = graph.handle_apply({
+        "intent": "generate code",
+        "edits": [
+            {"path": "first.py", "action": "implement", "justification": "x", "description": "one"},
+            {"path": "second.py", "action": "implement", "justification": "x", "description": "two"},
+            {"path": "plain.txt", "action": "create", "justification": "x", "content": "x\n"},
+        ],
+    })
+
+    assert overlaps == [1, 1]
+    assert calls == [("first.py", True), ("second.py", True)]
+    assert result.index("Implemented first.py") < result.index("Implemented second.py")
+    assert result.index("Implemented second.py") < result.index("Created plain.txt")
+
+
+def test_build_file_tree_lists_parents_once(test_project):
+    """Test the file tree shows each directory once, before its first file."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    index = FileIndexSnapshot(
+        files=[
+            {"path": "src/pkg/b.py"},
+            {"path": "README.md"},
+            {"path": "src/pkg/a.py"},
+            {"path": "src/main.py"},
+            {"path": "docs/api/v1/ref.md"},
+        ],
+        summary={},
+    )
+
+    assert graph._build_file_tree(index).splitlines() == [
+        "  README.md",
+        "docs/",
+        "docs/api/",
+        "docs/api/v1/",
+        "  docs/api/v1/ref.md",
+        "src/",
+        "  src/main.py",
+        "src/pkg/",
+        "  src/pkg/a.py",
+        "  src/pkg/b.py",
+    ]
+
+
+def test_build_file_tree_stops_at_line_limit(test_project):
+    """Test that a deep tree is cut at 50 lines, without the overflow note."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    index = FileIndexSnapshot(
+        files=[{"path": f"d{i:02}/sub/f.py"} for i in range(40)],
+        summary={},
+    )
+
+    lines = graph._build_file_tree(index).splitlines()
+    assert len(lines) == 50
+    assert lines[-3:] == ["  d15/sub/f.py", "d16/", "d16/sub/"]
+
+
+def test_apply_skips_identical_replace(test_project):
+    """Test that a replace with the current content is neither snapshotted nor written."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    readme = test_project / "README.md"
+    mtime_ns = readme.stat().st_mtime_ns
+    plan = {
+        "intent": "no-op",
+        "edits": [
+            {"path": "README.md", "action": "replace", "justification": "same",
+             "content": readme.read_text()},
+        ],
+    }
+
+    result = graph.handle_apply(plan)
+
+    assert "= unchanged README.md" in result
+    assert "snapshot" not in result.lower()
+    assert readme.stat().st_mtime_ns == mtime_ns
+
+
+def test_apply_snapshots_only_changed_existing_files(test_project):
+    """Test that creates and no-op edits are left out of the snapshot."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    readme = test_project / "README.md"
+    snapshotted = []
+
+    def fake_create_snapshot(files):
+        snapshotted.extend(files)
+        return True, "s1", None
+
+    graph.read_write.create_snapshot = fake_create_snapshot
+    plan = {
+        "intent": "mixed",
+        "edits": [
+            {"path": "new.txt", "action": "create", "justification": "new", "content": "x"},
+            {"path": "README.md", "action": "replace", "justification": "same",
+             "content": readme.read_text()},
+            {"path": "src/main.py", "action": "replace", "justification": "update",
+             "content": "print('hi')\n"},
+        ],
+    }
+
+    graph.handle_apply(plan)
+
+    assert snapshotted == ["src/main.py"]
+
+
+def test_handle_plan_passes_index_and_docs_to_planner(test_project):
+    """Test that handle_plan gathers the index and context docs before planning."""
+    (test_project / "AGENTS.md").write_text("# Agents\n")
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    calls = []
+
+    def fake_make_plan(goal, index, context_docs, conversation_history):
+        calls.append((goal, len(index.files), context_docs))
+        return Plan(intent=goal)
+
+    graph.planner.make_plan = fake_make_plan
+
+    plan_dict, summary = graph.handle_plan("add logging")
+
+    assert plan_dict["intent"] == "add logging"
+    assert calls == [("add logging", 5, ["# Agents\n"])]
+    assert "Intent: add logging" in summary
+
+
+def test_get_index_shares_a_concurrent_refresh(test_project):
+    """Test that callers queued behind a running refresh share one fresh refresh."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    started = threading.Event()
+    release = threading.Event()
+    refreshes = []
+    original_refresh = graph.file_index.load_or_refresh
+
+    def slow_refresh():
+        refreshes.append(1)
+        started.set()
+        release.wait(5)
+        return original_refresh()
+
+    graph.file_index.load_or_refresh = slow_refresh
+    waiting = threading.Semaphore(0)
+    lock = graph._index_lock
+
+    class SignallingLock:
+        def __enter__(self):
+            if started.is_set():
+                waiting.release()
+            return lock.__enter__()
+
+        def __exit__(self, *exc):
+            return lock.__exit__(*exc)
+
+    graph._index_lock = SignallingLock()
+    results = []
+    first = threading.Thread(target=lambda: results.append(graph.get_index()))
+    first.start()
+    started.wait(5)
+    # Both arrive while the first refresh runs, so it may have scanned
+    # before their edits; one of them refreshes again and the other reuses it
+    queued_results = []
+    queued = [threading.Thread(target=lambda: queued_results.append(graph.get_index())) for _ in range(2)]
+    for thread in queued:
+        thread.start()
+    assert waiting.acquire(timeout=5) and waiting.acquire(timeout=5)
+    release.set()
+    for thread in (first, *queued):
+        thread.join(5)
+
+    assert len(refreshes) == 2
+    assert len(queued_results) == 2 and queued_results[0] is queued_results[1]
+
+    # A later, uncontended call refreshes again to pick up new edits
+    graph.get_index()
+    assert len(refreshes) == 3
+
+
+def test_unchanged_index_keeps_snapshot_and_file_tree(test_project):
+    """Test that an unchanged refresh reuses the snapshot and its rendered tree."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    first = graph.get_index()
+    tree = graph._build_file_tree(first)
+
+    assert graph.get_index() is first
+    assert graph._build_file_tree(first) is tree
+
+    (test_project / "src" / "new.py").write_text("x = 1\n")
+    second = graph.get_index()
+    assert second is not first
+    assert "src/new.py" in graph._build_file_tree(second)
+
+
+def test_build_graph_is_cached_until_invalidated(test_project):
+    """Test that the compiled workflow is reused and rebuilt after invalidation."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+
+    compiled = graph.build_graph()
+    assert graph.build_graph() is compiled
+
+    graph.invalidate_graph()
+    assert graph.build_graph() is not compiled
+
+
+def test_init_prompt_lists_files_in_index_order(test_project):
+    """Test that concurrently read files land in the /init prompt in index order."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    prompts = []
+
+    def fake_stream(messages, temperature=None):
+        prompts.append(messages[-1]["content"])
+        yield "# AGE"
+        yield "NTS\n"
+
+    graph.llm.stream = fake_stream
+    index = graph.file_index.load_or_refresh()
+
+    assert graph.handle_init() == "✓ Created AGENTS.md based on project analysis"
+
+    files_block, project_block = prompts[0]
+    assert files_block["cache_control"] == {"type": "ephemeral"}
+    positions = [files_block["text"].index(f"=== {f['path']} ===") for f in index.files]
+    assert positions == sorted(positions)
+    assert "def add(a, b):" in files_block["text"]
+    assert "Test Command: pytest -q" in project_block["text"]
+
+    # The generated AGENTS.md is served from the cache without reading it back
+    graph.read_write.read = None
+    assert graph._load_context_docs() == ["# AGENTS\n"]
+
+
+def test_async_context_docs_match_sync(test_project):
+    """Test that the async loader reads both docs and shares the sync cache."""
+    (test_project / "AGENTS.md").write_text("# Agents\r\n")
+    (test_project / "AGENTS.local.md").write_text("# Local\n\n")
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+
+    docs = asyncio.run(graph._load_context_docs_async())
+
+    assert docs == ["# Agents\n", "# Local\n"]
+    graph.read_write.read = None  # any further read would fail
+    assert graph._load_context_docs() == docs
+
+
+def test_init_batch_submits_then_collects(test_project):
+    """Test that /init --batch records the batch and writes AGENTS.md once it ends."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    submitted = []
+    results = [None]
+    graph.llm.submit_batch = lambda requests, temperature=None: submitted.append(requests) or "b1"
+    graph.llm.poll_batch = lambda batch_id: results[0]
+
+    assert "Submitted" in graph.handle_init(batch=True)
+    assert len(submitted) == 1
+    assert "still processing" in graph.handle_init(batch=True)
+
+    results[0] = [{"content": "# AGENTS\n"}]
+    assert graph.handle_init(batch=True) == "✓ Created AGENTS.md based on project analysis"
+    assert (test_project / "AGENTS.md").read_text() == "# AGENTS\n"
+    assert not (test_project / ".pitcrew" / "pending_batch.json").exists()
+
+
+def test_format_plan_summary_layout(test_project):
+    """Test the plan summary lists edits and post-checks line by line."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    plan = Plan(
+        intent="Add x",
+        edits=[{"path": "a.py", "action": "create", "justification": "new file"}],
+        post_checks=[{"command": "pytest -q"}],
+    )
+
+    assert graph._format_plan_summary(plan).splitlines() == [
+        "Intent: Add x",
+        "",
+        "Edits (1):",
+        "  create   a.py",
+        "           new file",
+        "",
+        "Post-checks (1):",
+        "  - pytest -q",
+    ]
+    assert graph._format_plan_summary(Plan(intent="Nothing")) == "Intent: Nothing\n\nEdits (0):"
+
+
+def test_init_falls_back_when_streaming_fails(test_project):
+    """Test that a failed stream leaves no temp file and retries without streaming."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+
+    def broken_stream(messages, temperature=None):
+        yield "partial"
+        raise ConnectionError("stream dropped")
+
+    graph.llm.stream = broken_stream
+    graph.llm.complete = lambda messages, temperature=None: {"content": "# Full\n"}
+
+    assert graph.handle_init() == "✓ Created AGENTS.md based on project analysis"
+    assert (test_project / "AGENTS.md").read_text() == "# Full\n"
+    assert not (test_project / "AGENTS.md.tmp").exists()
+
+
+def test_read_init_file_limits_lines(test_project):
+    """Test that /init reads stop at the line limit and handle empty files."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    (test_project / "long.txt").write_bytes(b"".join(b"line %d\r\n" % i for i in range(10)))
+    (test_project / "empty.txt").write_text("")
+
+    assert graph._read_init_file("long.txt", 3) == "line 0\nline 1\nline 2\n... (truncated at 3 lines)"
+    assert graph._read_init_file("long.txt", 10).endswith("line 9")
+    assert graph._read_init_file("long.txt", None).count("\n") == 9
+    assert graph._read_init_file("empty.txt", 3) == ""
+    assert graph._read_init_file("missing.txt", 3) is None
+
+
+def test_init_reuses_cached_excerpts_for_unchanged_files(test_project):
+    """Test that a second /init only re-reads files whose stamp changed."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    graph.llm.stream = lambda messages, temperature=None: iter(["# AGENTS\n"])
+    graph.handle_init()
+
+    reads = []
+    original_read = graph._read_init_file
+
+    def counting_read(file_path, max_lines):
+        reads.append(file_path)
+        return original_read(file_path, max_lines)
+
+    graph._read_init_file = counting_read
+    main = test_project / "src" / "main.py"
+    main.write_text(main.read_text() + "# edited\n")
+
+    graph.handle_init()
+    # AGENTS.md is new since the first run; every other file comes from the cache
+    assert sorted(reads) == ["AGENTS.md", "src/main.py"]
+
+
+def test_gather_init_inputs_elides_duplicate_files(test_project):
+    """Test that a repeated excerpt becomes a back-reference to the first copy."""
+    boilerplate = "# Generated file, do not edit\n" * 5
+    for name in ("one.py", "two.py"):
+        (test_project / name).write_text(boilerplate)
+    (test_project / "empty.py").write_text("")
+    (test_project / "empty2.py").write_text("")
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    candidates = [(name, None, 0, 0.0) for name in ("one.py", "two.py", "empty.py", "empty2.py")]
+
+    _, _, blocks = asyncio.run(graph._gather_init_inputs(graph.get_index(), candidates))
+
+    assert blocks[0] == f"=== one.py ===\n{boilerplate.rstrip(chr(10))}"
+    assert blocks[1] == "=== two.py ===\n# (identical to one.py)"
+    # A back-reference longer than the content it replaces is not worth it
+    assert blocks[3] == "=== empty2.py ===\n"
+
+
+def test_implement_batch_uses_one_call_and_falls_back(test_project):
+    """Test that several files share one LLM call and missing ones get their own."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    replies = [
+        '<file path="src/a.py">\na = 1\n</file>\n<file path="src/b.py">\nb = 2\n</file>',
+        "<code>c = 3</code>",
+    ]
+    prompts = []
+
+    def fake_complete(messages, temperature=None):
+        prompts.append(messages[-1]["content"])
+        return {"content": replies[len(prompts) - 1]}
+
+    graph.llm.complete = fake_complete
+    results = graph.handle_implement_batch([
+        ("src/a.py", "set a"), ("src/b.py", "set b"), ("src/c.py", "set c"),
+    ])
+
+    assert len(prompts) == 2
+    assert "src/c.py" in prompts[1] and "src/a.py" not in prompts[1]
+    assert [r.startswith("✓ Implemented") for r in results] == [True, True, True]
+    assert (test_project / "src" / "a.py").read_text() == "a = 1"
+    assert (test_project / "src" / "c.py").read_text() == "c = 3"
+
+
+def test_apply_runs_unsafe_post_checks_serially(test_project):
+    """Test that only parallel-safe post-checks go through run_many."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    batched, serial = [], []
+
+    def fake_run_many(commands, sandbox=True):
+        batched.append(commands)
+        return [ExecResult(True, "", "", 0, 0, c) for c in commands]
+
+    def fake_run(command, sandbox=True):
+        serial.append(command)
+        return ExecResult(True, "", "", 0, 0, command)
+
+    graph.executor.run_many = fake_run_many
+    graph.executor.run = fake_run
+    output = graph.handle_apply({
+        "intent": "checks only",
+        "post_checks": [
+            {"command": "ruff check ."},
+            {"command": "make migrate", "parallel_safe": False},
+            {"command": "mypy ."},
+        ],
+    })
+
+    assert batched == [["ruff check .", "mypy ."]]
+    assert serial == ["make migrate"]
+    assert output.index("✓ ruff check .") < output.index("✓ make migrate") < output.index("✓ mypy .")
+
+
+def test_apply_drops_cached_context_doc_it_rewrites(test_project):
+    """Test that a plan editing AGENTS.md forces it to be re-read."""
+    agents = test_project / "AGENTS.md"
+    agents.write_text("# One\n")
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    assert graph._load_context_docs() == ["# One\n"]
+    stat = agents.stat()
+
+    graph.handle_apply({
+        "intent": "edit docs",
+        "edits": [{"path": "./AGENTS.md", "action": "replace", "justification": "x", "content": "# Two\n"}],
+    })
+    # Same size and mtime as before, so only the explicit drop makes it re-read
+    os.utime(agents, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert graph._load_context_docs() == ["# Two\n"]
+
+
+def test_apply_reuses_shared_io_pool(test_project):
+    """Test that /apply runs on the graph's pool rather than a fresh one."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    threads = set()
+    original = graph._apply_edit_group
+
+    def record(edits, unchanged):
+        threads.add(threading.current_thread().name)
+        return original(edits, unchanged)
+
+    graph._apply_edit_group = record
+    for name in ("a.txt", "b.txt"):
+        graph.handle_apply({
+            "intent": "add file",
+            "edits": [{"path": name, "action": "create", "justification": "x", "content": "x\n"}],
+        })
+    graph.close()
+
+    assert threads and all(name.startswith("pitcrew-io") for name in threads)
+    assert graph._io_pool._shutdown
+
+
+def test_index_build_uses_shared_io_pool(test_project):
+    """Test that index builds hand their per-file work to the graph's pool."""
+    graph = PitCrewGraph(test_project, Config(anthropic_api_key="test-key"))
+    threads = set()
+    original = graph.file_index._index_file
+
+    def record(path, known):
+        threads.add(threading.current_thread().name)
+        return original(path, known)
+
+    graph.file_index._index_file = record
+    graph.get_index()
+    graph.close()
+
+    assert threads and all(name.startswith("pitcrew-io") for name in threads)
@@ -50,3 +50,55 @@ def test_normal_files_not_ignored(test_project):
     assert not rules.should_ignore(test_project / "src" / "main.py")
     assert not rules.should_ignore(test_project / "README.md")
     assert not rules.should_ignore(test_project / "tests" / "test_main.py")
+
+
+def test_builtin_regex_matches_pathspec():
+    """Test that the compiled built-in matcher agrees with gitwildmatch."""
+    import pathspec
+
+    from pitcrew.constants import BUILTIN_IGNORES, is_ignored
+
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", BUILTIN_IGNORES)
+    paths = [
+        "src/main.py",
+        "src/main.pyc",
+        "pkg/__pycache__/mod.cpython-311.pyc",
+        "node_modules/lodash/index.js",
+        "web/node_modules/react/index.js",
+        "my_pkg.egg-info/PKG-INFO",
+        ".venv/lib/site.py",
+        "docs/build/index.html",
+        "notes.log",
+        ".DS_Store",
+        "README.md",
+        "env.py",
+        "builder/main.py",
+    ]
+
+    for path in paths:
+        assert is_ignored(path) == spec.match_file(path), path
+
+
+def test_should_ignore_dir(test_project):
+    """Test that built-in and project directory patterns match whole directories."""
+    (test_project / ".gitignore").write_text("build/\ngenerated\n")
+    rules = IgnoreRules(test_project)
+
+    assert rules.should_ignore_dir("node_modules")
+    assert rules.should_ignore_dir("web/node_modules")
+    assert rules.should_ignore_dir("build")
+    assert rules.should_ignore_dir("src/generated")
+    assert not rules.should_ignore_dir("src")
+
+
+def test_negation_reincludes_builtin_ignores(test_project):
+    """Test that a project `!pattern` can re-include what a built-in ignores."""
+    (test_project / ".gitignore").write_text("dist/\n!dist/\n!keep.log\n")
+
+    rules = IgnoreRules(test_project)
+
+    assert not rules.should_ignore(test_project / "dist" / "a.js")
+    assert not rules.should_ignore(test_project / "logs" / "keep.log")
+    assert not rules.should_ignore_dir("dist")
+    assert rules.should_ignore(test_project / "logs" / "other.log")
+    assert rules.should_ignore(test_project / "node_modules" / "pkg" / "index.js")
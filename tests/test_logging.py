@@ -0,0 +1,21 @@
+"""Tests for session logging."""
+
+import json
+
+from pitcrew.utils.logging import SessionLogger
+
+
+def test_logs_are_valid_json(test_project):
+    """Test that transcript, plan and exec logs round-trip through json."""
+    logger = SessionLogger(test_project, run_id="test")
+
+    logger.log_message("user", "héllo")
+    logger.log_message("assistant", "hi", tool_calls=[{"name": "read_file"}])
+    logger.save_plan({"intent": "demo", "edits": []})
+    logger.save_exec_result("echo hi", {"success": True, "stdout": "hi\n"})
+
+    lines = logger.transcript_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["content"] for line in lines] == ["héllo", "hi"]
+    assert json.loads(logger.plan_path.read_text()) == {"intent": "demo", "edits": []}
+    (exec_log,) = logger.exec_dir.iterdir()
+    assert json.loads(exec_log.read_text())["stdout"] == "hi\n"
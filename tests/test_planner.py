@@ -0,0 +1,52 @@
+"""Tests for the planner."""
+
+import sys
+
+from pitcrew.tools.file_index import FileIndexSnapshot
+from pitcrew.tools.planner import Plan, Planner
+
+
+def _snapshot():
+    files = [{"path": "src/main.py", "language": "python"}]
+    return FileIndexSnapshot(files=files, summary={"total_files": 1})
+
+
+def test_cached_prefix_is_stable_across_goals(temp_dir):
+    """Test that only the trailing request block changes between /plan calls."""
+    planner = Planner(None, temp_dir)
+    docs = ["# AGENTS.md\nUse pytest."]
+
+    index = _snapshot()
+
+    first_hints = planner._analyze_goal("add a test", index)
+    first = planner._build_messages("add a test", index, docs, first_hints, [])
+    second_hints = planner._analyze_goal("fix the bug", index)
+    second = planner._build_messages("fix the bug", index, docs, second_hints, [])
+
+    assert first[0] == second[0]
+    assert first[0]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert first[1]["content"][0] == second[1]["content"][0]
+    assert first[1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "Goal: add a test" in first[1]["content"][-1]["text"]
+    assert "cache_control" not in first[1]["content"][-1]
+
+
+def test_plain_messages_without_caching(temp_dir):
+    """Test that disabling caching produces plain string content."""
+    planner = Planner(None, temp_dir, use_prompt_caching=False)
+    hints = planner._analyze_goal("add x", _snapshot())
+
+    messages = planner._build_messages("add x", _snapshot(), [], hints, [])
+
+    assert isinstance(messages[0]["content"], str)
+    assert messages[1]["content"].startswith("Project files:")
+    assert messages[1]["content"].endswith("Goal: add x")
+
+
+def test_edit_action_is_interned():
+    """Test that parsed edit actions share the interned action string."""
+    plan = Plan(intent="x", edits=[
+        {"path": "a.py", "action": "".join(["re", "place"]), "justification": "j"},
+    ])
+
+    assert plan.edits[0].action is sys.intern("replace")
@@ -0,0 +1,295 @@
+"""Tests for the query handler."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pitcrew.handlers.query as query_module
+from pitcrew.handlers.query import (
+    QueryHandler,
+    _AdaptiveLimit,
+    _rate_limit_pause,
+    _retry_wait,
+    _truncate_code,
+)
+
+
+class _FakeReadWrite:
+    def __init__(self, files):
+        self.files = files
+
+    def read(self, path):
+        if path in self.files:
+            content = self.files[path]
+            if isinstance(content, bytes):
+                return False, None, "File is not valid UTF-8 text"
+            return True, content, None
+        return False, None, "not found"
+
+    def read_prefix(self, path, max_chars):
+        success, content, error = self.read(path)
+        if not success:
+            return False, None, False, error
+        return True, content[:max_chars], len(content) > max_chars, None
+
+    def peek(self, path, n=4096):
+        content = self.files.get(path, b"")
+        return (content if isinstance(content, bytes) else content.encode("utf-8"))[:n]
+
+
+class _FakeLLM:
+    descriptor = SimpleNamespace(name="claude-test")
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+
+    def complete(self, messages, temperature=None):
+        self.prompts.append(messages[-1]["content"])
+        return {"content": self.reply}
+
+    async def acomplete(self, messages, temperature=None):
+        return self.complete(messages, temperature)
+
+
+def test_tool_calls_run_concurrently_and_keep_ids(temp_dir):
+    """Test that one turn's tool calls overlap and map back to their ids."""
+    handler = QueryHandler(SimpleNamespace(project_root=temp_dir), _FakeLLM(""))
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_execute_tool(tool_name, arguments):
+        barrier.wait()  # deadlocks unless all three calls run at once
+        return f"{tool_name}:{arguments['path']}"
+
+    handler._execute_tool = fake_execute_tool
+    tool_calls = [
+        {"id": f"call_{i}", "name": "read_file", "arguments": f'{{"path": "f{i}.py"}}'}
+        for i in range(3)
+    ]
+
+    results = handler._execute_tool_calls(tool_calls)
+
+    assert results == {f"call_{i}": f"read_file:f{i}.py" for i in range(3)}
+
+
+def test_small_file_summaries_share_one_call(temp_dir):
+    """Test that several small files are summarized by a single LLM call."""
+    graph = SimpleNamespace(
+        project_root=temp_dir, read_write=_FakeReadWrite({"a.js": "x = 1", "b.js": "y = 2"})
+    )
+    llm = _FakeLLM("## SUMMARY 1\nSets x.\n## SUMMARY 2\nSets y.\n")
+    handler = QueryHandler(graph, llm)
+
+    results = handler._summarize_files_batched(["a.js", "missing.js", "b.js"])
+
+    assert results == ["Sets x.", "Error reading missing.js: not found", "Sets y."]
+    assert len(llm.prompts) == 1
+    assert "=== FILE 2: b.js ===" in llm.prompts[0]
+
+
+def test_batch_falls_back_to_single_file_calls(temp_dir):
+    """Test that files missing from a batched reply are summarized on their own."""
+    graph = SimpleNamespace(
+        project_root=temp_dir, read_write=_FakeReadWrite({"a.js": "x = 1", "b.js": "y = 2"})
+    )
+    llm = _FakeLLM("## SUMMARY 1\nSets x.\n")
+    handler = QueryHandler(graph, llm)
+
+    results = handler._summarize_files_batched(["a.js", "b.js"])
+
+    assert results[0] == "Sets x."
+    assert len(llm.prompts) == 2
+    assert "File: b.js" in llm.prompts[1]
+
+
+def test_summaries_are_reused_until_content_changes(temp_dir):
+    """Test that a cached summary skips the LLM and edited content misses."""
+    files = {"a.js": "x = 1"}
+    graph = SimpleNamespace(project_root=temp_dir, read_write=_FakeReadWrite(files))
+    llm = _FakeLLM("Sets x.")
+
+    assert QueryHandler(graph, llm)._summarize_file("a.js") == "Sets x."
+    assert QueryHandler(graph, llm)._summarize_file("a.js") == "Sets x."
+    assert len(llm.prompts) == 1
+
+    files["a.js"] = "x = 2"
+    QueryHandler(graph, llm)._summarize_file("a.js")
+    assert len(llm.prompts) == 2
+
+
+def test_binary_files_are_not_summarized(temp_dir):
+    """Test that a binary file is rejected from its head without an LLM call."""
+    files = {"logo.png": b"\x89PNG\r\n\x1a\n\x00\x00", "a.js": "x = 1"}
+    graph = SimpleNamespace(project_root=temp_dir, read_write=_FakeReadWrite(files))
+    llm = _FakeLLM("## SUMMARY 1\nSets x.")
+
+    assert "Binary file" in QueryHandler(graph, llm)._summarize_file("logo.png")
+    results = QueryHandler(graph, llm)._summarize_files_batched(["logo.png", "a.js"])
+    assert "Binary file" in results[0]
+    assert len(llm.prompts) == 1
+
+
+def test_summaries_are_keyed_by_current_model(temp_dir):
+    """Test that switching the handler's model misses the old model's summaries."""
+    graph = SimpleNamespace(project_root=temp_dir, read_write=_FakeReadWrite({"a.js": "x = 1"}))
+    llm = _FakeLLM("Sets x.")
+    handler = QueryHandler(graph, llm)
+    handler._summarize_file("a.js")
+
+    handler.llm = _FakeLLM("Assigns x.")
+    handler.llm.descriptor = SimpleNamespace(name="claude-other")
+
+    assert handler._summarize_file("a.js") == "Assigns x."
+
+
+def test_small_python_file_is_summarized_from_its_ast(temp_dir):
+    """Test that a small .py file never reaches the LLM."""
+    source = (
+        '"""Greeting helpers."""\n\nimport os\n\nGREETING = "hi"\n\n\n'
+        'class Greeter:\n    """Says hello."""\n\n    def greet(self, name: str) -> str:\n        return name\n\n\n'
+        'async def main(argv=None):\n    """Entry point."""\n'
+    )
+    graph = SimpleNamespace(project_root=temp_dir, read_write=_FakeReadWrite({"tiny.py": source}))
+    llm = _FakeLLM("unused")
+
+    summary = QueryHandler(graph, llm)._summarize_file("tiny.py")
+
+    assert llm.prompts == []
+    assert summary.startswith("**Purpose:**\nGreeting helpers.")
+    assert "**Classes:**\n- `Greeter` - Says hello.\n  - `greet(self, name: str) -> str`" in summary
+    assert "**Functions:**\n- `async main(argv=None)` - Entry point." in summary
+    assert "**Dependencies:**\n- `import os`" in summary
+    assert "- `GREETING`" in summary
+
+
+def test_summary_is_truncated_to_token_budget(temp_dir, monkeypatch):
+    """Test that a tokenizer, when available, sets the exact summary budget."""
+    class OneTokenPerChar:
+        def encode(self, text, disallowed_special=()):
+            return list(text)
+
+        def decode(self, tokens):
+            return "".join(tokens)
+
+    monkeypatch.setattr(query_module, "_token_encoder", lambda: OneTokenPerChar())
+    (temp_dir / "data.txt").write_text("x" * 6_000)
+    graph = SimpleNamespace(
+        project_root=temp_dir, read_write=_FakeReadWrite({"data.txt": "x" * 6_000})
+    )
+    llm = _FakeLLM("Data.")
+
+    QueryHandler(graph, llm)._summarize_file("data.txt")
+
+    assert "x" * 5_000 + "\n" in llm.prompts[0]
+    assert "x" * 5_001 not in llm.prompts[0]
+    assert "truncated from 6,000 bytes to 5,000 characters" in llm.prompts[0]
+
+
+def test_truncate_code_drops_partial_trailing_definition():
+    """Test that a cut-off source prefix ends before its last definition."""
+    source = "import os\n\n\ndef first():\n    return 1\n\n\ndef second():\n    x = ("
+    assert _truncate_code(source, 10) == "import os\n\n\ndef first():\n    return 1\n\n\n"
+    # A closing brace is not a boundary, so C-like blocks stay closed
+    braces = "int a() {\n  return 1;\n}\nint b() {\n  return"
+    assert _truncate_code(braces, 5) == "int a() {\n  return 1;\n}\n"
+    # One definition longer than the minimum keeps the plain cut
+    assert _truncate_code(source, len(source) - 5) == source
+
+
+class _StatusError(Exception):
+    """Stand-in for an SDK error carrying an HTTP status and response."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def test_retry_wait_honours_retry_after_and_skips_client_errors():
+    """Test that only transient errors retry, never sooner than retry-after."""
+    assert 2 <= _retry_wait(_StatusError(529), 0) <= 4
+    assert 4 <= _retry_wait(_StatusError(503), 1) <= 8
+    assert _retry_wait(_StatusError(429, {"retry-after": "30"}), 0) == 30
+    assert _retry_wait(Exception("Error code: 429 - rate_limit_error"), 0) is not None
+    assert _retry_wait(_StatusError(400), 0) is None
+
+
+async def _no_sleep(seconds, sleeps):
+    sleeps.append(round(seconds))
+
+
+def test_summary_retries_rate_limits(temp_dir, monkeypatch):
+    """Test that a rate-limited summary call is retried after the wait."""
+    sleeps = []
+    monkeypatch.setattr(query_module.asyncio, "sleep", lambda seconds: _no_sleep(seconds, sleeps))
+    graph = SimpleNamespace(project_root=temp_dir, read_write=_FakeReadWrite({"a.js": "x = 1"}))
+    llm = _FakeLLM("Sets x.")
+    errors = [_StatusError(429, {"retry-after": "7"})]
+    complete = llm.complete
+
+    def flaky_complete(messages, temperature=None):
+        if errors:
+            raise errors.pop()
+        return complete(messages, temperature)
+
+    llm.complete = flaky_complete
+
+    assert QueryHandler(graph, llm)._summarize_file("a.js") == "Sets x."
+    assert sleeps == [7]
+
+
+def test_adaptive_limit_grows_additively_and_halves_on_errors():
+    """Test the AIMD rule: +0.5 per success, halved on rate limits, never below one."""
+    async def run():
+        limit = _AdaptiveLimit(4.0, 5)
+        for ok, expected in [(True, 4.5), (True, 5.0), (True, 5.0), (False, 2.5), (None, 2.5), (False, 1.25), (False, 1.0)]:
+            await limit.acquire()
+            await limit.release(ok=ok)
+            assert limit.limit == expected
+
+    asyncio.run(run())
+
+
+def test_rate_limit_pause_waits_for_exhausted_windows():
+    """Test that only a window with nothing remaining holds off new calls."""
+    reset = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+    headers = {
+        "anthropic-ratelimit-requests-remaining": "0",
+        "anthropic-ratelimit-requests-reset": reset,
+        "anthropic-ratelimit-tokens-remaining": "1000",
+        "anthropic-ratelimit-tokens-reset": reset,
+    }
+    assert 28 <= _rate_limit_pause(headers) <= 30
+    headers["anthropic-ratelimit-requests-remaining"] = "5"
+    assert _rate_limit_pause(headers) == 0
+    assert _rate_limit_pause({}) == 0
+
+
+def test_batched_summaries_stay_within_adaptive_limit(temp_dir):
+    """Test that summary calls in flight never exceed the current AIMD limit."""
+    big = "x" * 15_000  # One file per batch
+    files = {f"f{i}.js": big + str(i) for i in range(4)}
+    graph = SimpleNamespace(project_root=temp_dir, read_write=_FakeReadWrite(files))
+    llm = _FakeLLM("Summary.")
+    active = []
+    starts = []
+
+    async def acomplete(messages, temperature=None):
+        active.append(1)
+        starts.append(len(active))
+        await asyncio.sleep(0.02)
+        active.pop()
+        return {"content": "Summary."}
+
+    llm.acomplete = acomplete
+    handler = QueryHandler(graph, llm)
+    handler._summary_concurrency = 1.0
+
+    results = handler._summarize_files_batched(list(files))
+
+    assert results == ["Summary."] * 4
+    # 1 -> 1.5 -> 2: the first two calls run alone, then two at once
+    assert starts[:2] == [1, 1]
+    assert max(starts) == 2
+    assert handler._summary_concurrency == 3.0
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from pitcrew.tools.read_write import ReadWrite
+from pitcrew.tools.read_write import ReadWrite, looks_binary
 
 
 def test_read_file(test_project):
@@ -81,6 +81,23 @@ def test_snapshot_and_restore(test_project):
     assert content == original_content
 
 
+def test_latest_snapshot_walks_back_on_restore(test_project):
+    """Test that each restore moves the undo pointer to the previous snapshot."""
+    rw = ReadWrite(test_project)
+    assert rw.latest_snapshot() is None
+
+    _, first, _ = rw.create_snapshot(["src/main.py"])
+    _, second, _ = rw.create_snapshot(["src/utils.py"])
+    assert rw.latest_snapshot() == second
+
+    rw.restore_snapshot(second)
+    assert rw.latest_snapshot() == first
+
+    rw.restore_snapshot(first)
+    assert rw.latest_snapshot() is None
+    assert rw.list_snapshots() == [second, first]
+
+
 def test_path_safety(test_project):
     """Test that paths outside project root are rejected."""
     rw = ReadWrite(test_project)
@@ -90,3 +107,43 @@ def test_path_safety(test_project):
 
     assert not success
     assert "outside project root" in error.lower()
+
+
+def test_snapshot_copies_many_files(test_project):
+    """Test that a multi-file snapshot restores every file it captured."""
+    rw = ReadWrite(test_project)
+    paths = ["src/main.py", "src/utils.py", "tests/test_main.py", "missing.py"]
+    originals = {p: (test_project / p).read_text() for p in paths[:3]}
+
+    success, snapshot_id, _ = rw.create_snapshot(paths)
+    for p in originals:
+        (test_project / p).write_text("changed\n")
+
+    assert success
+    assert rw.restore_snapshot(snapshot_id) == (True, None)
+    assert {p: (test_project / p).read_text() for p in originals} == originals
+
+
+def test_peek_sniffs_binary_files(test_project):
+    """Test that peek reads only the head and looks_binary classifies it."""
+    rw = ReadWrite(test_project)
+    (test_project / "blob.bin").write_bytes(b"\x7fELF\x00\x01" * 2000)
+    (test_project / "text.txt").write_text("éa" * 3000, encoding="utf-8")
+
+    head = rw.peek("blob.bin")
+    assert len(head) == 4096
+    assert looks_binary(head)
+    # The 4KB window may split a multi-byte character; that is still text
+    assert not looks_binary(rw.peek("text.txt"))
+    assert rw.peek("missing.txt") == b""
+
+
+def test_read_prefix(test_project):
+    """Test reading only the start of a file."""
+    rw = ReadWrite(test_project)
+    (test_project / "big.txt").write_text("abcdef")
+
+    assert rw.read_prefix("big.txt", 4) == (True, "abcd", True, None)
+    assert rw.read_prefix("big.txt", 6) == (True, "abcdef", False, None)
+    success, _, _, error = rw.read_prefix("missing.txt", 4)
+    assert not success and "not found" in error